@@ -0,0 +1,471 @@
+"""
+단어장 API 성능 측정 (마이크로벤치마크)
+
+크기별로 가상의 단어장(카테고리, 퀴즈 통계, 복습 일정 포함)을 만들고
+Flask 테스트 클라이언트로 web_vocab_app의 모든 API를 호출해 응답 시간을 잼.
+load_data()/save_data()도 직접 호출해 측정함.
+
+크기마다 새 프로세스와 임시 폴더에서 실행하므로 서로 영향을 주지 않고,
+실제 데이터 파일(vocabulary.json 등)은 건드리지 않음.
+
+사용법:
+    python benchmark.py                          # 1k, 100k, 1m 단어로 측정, 기준 결과가 있으면 비교
+    python benchmark.py --sizes 1k,100k          # 크기 지정
+    python benchmark.py --save-baseline          # 결과를 기준(benchmark_baseline.json)으로 저장
+    python benchmark.py --backend sqlite --json result.json
+
+기준 결과보다 중앙값(p50)이 --tolerance 이상 느려진 항목이 있으면 종료 코드 1
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+BASELINE_FILE = "benchmark_baseline.json"
+DEFAULT_SIZES = "1k,100k,1m"
+# 항목마다 최대 호출 수, 측정 시간 한도(초), 최소 호출 수
+DEFAULT_REPEAT = 200
+DEFAULT_BUDGET = 2.0
+MIN_SAMPLES = 3
+# save_data() 측정 횟수
+SAVE_REPEAT = 3
+# 기준 대비 허용하는 p50 증가율과, 이보다 작은 차이(ms)는 잡음으로 보고 무시
+DEFAULT_TOLERANCE = 0.25
+NOISE_FLOOR_MS = 0.25
+
+# 가상 단어장의 카테고리 (앞쪽일수록 단어가 많음, ""은 카테고리 없음)
+CATEGORIES = ["", "noun", "verb", "adjective", "adverb", "food", "animal", "travel", "business",
+              "school", "emotion", "science", "sports", "health", "weather", "technology",
+              "family", "body", "clothes", "music", "nature", "city", "job", "time"]
+# 퀴즈를 풀어 본 단어 비율
+PRACTICED_RATIO = 0.4
+
+ONSETS = ["b", "bl", "br", "c", "ch", "cl", "cr", "d", "dr", "f", "fl", "fr", "g", "gl", "gr", "h",
+          "j", "k", "l", "m", "n", "p", "pl", "pr", "qu", "r", "s", "sh", "sl", "sp", "st", "str",
+          "t", "th", "tr", "v", "w", "y", "z"]
+VOWELS = ["a", "e", "i", "o", "u", "ai", "ea", "ee", "io", "ou", "oo"]
+CODAS = ["", "", "", "n", "r", "s", "t", "l", "m", "nd", "ng", "ck", "st", "ght"]
+CHOSEONG_QUERIES = ["ㅅㄱ", "ㄱㄴ", "ㅎㄱ"]
+
+# 측정 항목: (이름, 메서드, 라우트 규칙, 요청 만들기, 미리 할 일, 기대 상태 코드)
+Case = Tuple[str, str, str, Callable[[random.Random], Tuple[str, Dict]], Optional[Callable[[], None]], int]
+
+def parse_size(text: str) -> int:
+    """'1k', '100k', '1m', '5000' 같은 크기 문자열 해석"""
+    text = text.strip().lower()
+    units = {"k": 1000, "m": 1000000}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+def size_label(size: int) -> str:
+    if size >= 1000000 and size % 1000000 == 0:
+        return f"{size // 1000000}m"
+    if size >= 1000 and size % 1000 == 0:
+        return f"{size // 1000}k"
+    return str(size)
+
+def make_word(rng: random.Random) -> str:
+    """영어처럼 보이는 가상 단어 (음절 1~4개)"""
+    syllables = rng.choices((1, 2, 3, 4), weights=(2, 5, 4, 1))[0]
+    return "".join(rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS) for _ in range(syllables))
+
+def make_meaning(rng: random.Random) -> str:
+    """가상의 한국어 뜻 (1~3글자, 가끔 뜻이 두 개)"""
+    meaning = "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(1, 3)))
+    if rng.random() < 0.2:
+        meaning += ", " + "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(1, 3)))
+    return meaning
+
+def generate_vocabulary(size: int, seed: int, directory: str, now: float) -> List[str]:
+    """
+    가상 단어장 파일 만들기 (vocabulary.json, quiz_stats.json, review_schedule.json)
+    
+    Args:
+        size: 단어 수
+        seed: 난수 시드 (같으면 같은 단어장)
+        directory: 파일을 만들 폴더
+        now: 복습 일정 기준 시각
+    
+    Returns:
+        List[str]: 만든 영어 단어 목록
+    """
+    rng = random.Random(seed)
+    # 카테고리별 단어 수는 순위에 반비례 (자주 쓰는 카테고리에 단어가 몰림)
+    weights = [1 / (rank + 1) for rank in range(len(CATEGORIES))]
+    
+    vocabulary = {}
+    while len(vocabulary) < size:
+        word = make_word(rng)
+        if word not in vocabulary:
+            vocabulary[word] = {"korean": make_meaning(rng), "category": rng.choices(CATEGORIES, weights)[0]}
+    words = list(vocabulary)
+    
+    stats = {}
+    schedules = {}
+    for word in rng.sample(words, int(size * PRACTICED_RATIO)):
+        total = min(int(rng.expovariate(1 / 4)) + 1, 50)
+        correct = sum(rng.random() < 0.7 for _ in range(total))
+        stats[word] = [correct, total - correct]
+        # 이미 복습할 때가 된 단어와 앞으로 복습할 단어가 섞이도록
+        interval = rng.choice((1, 6, 15, 36))
+        schedules[word] = [rng.randint(1, 4), interval, round(rng.uniform(1.3, 2.8), 2),
+                           int(now + rng.uniform(-2, 1) * interval * 86400)]
+    
+    for filename, data in (("vocabulary.json", vocabulary), ("quiz_stats.json", stats),
+                           ("review_schedule.json", schedules)):
+        with open(os.path.join(directory, filename), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+    return words
+
+def rss_mb() -> float:
+    """현재 프로세스의 상주 메모리 (MB, /proc이 없으면 최대 상주 메모리)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        return peak_rss_mb()
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, 리눅스는 KB
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+def summarize(samples: List[float]) -> Dict:
+    """측정값(초) 요약 (ms)"""
+    values = sorted(sample * 1000 for sample in samples)
+    return {
+        "samples": len(values),
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p90_ms": round(percentile(values, 90), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0
+    }
+
+def build_cases(app_module, words: List[str], rng: random.Random, repeat: int) -> List[Case]:
+    """
+    측정할 요청 목록 (조회 먼저, 변경 요청은 뒤에)
+    
+    Args:
+        app_module: 불러온 web_vocab_app 모듈
+        words: 단어장의 단어 목록
+        rng: 난수 생성기
+        repeat: 항목마다 최대 호출 수 (삭제할 단어를 미리 만드는 데 씀)
+    """
+    store = app_module.get_store()
+    sample = rng.sample(words, min(len(words), 10000))
+    categories = store.categories()
+    top_category = max(categories, key=store.count_words) if categories else ""
+    
+    def word() -> str:
+        return rng.choice(sample)
+    
+    def misspelled() -> str:
+        w = word()
+        i = rng.randrange(len(w))
+        return w[:i] + rng.choice("aeioust") + w[i + 1:]
+    
+    def answer(w: str) -> Dict:
+        data = store.get_word(w)
+        korean = data.korean if data is not None and rng.random() < 0.7 else "오답"
+        return {"word": w, "answer": korean, "type": "english_to_korean", "mode": "text"}
+    
+    # 수정/삭제용 단어는 측정 전에 만들어 둠
+    bench_words = [f"zzbench{i:06d}" for i in range(repeat + 2)]
+    with store.transaction():
+        for w in bench_words:
+            store.add_word(w, "벤치마크", "benchmark")
+    delete_pool = iter(bench_words[1:])
+    counter = iter(range(10 ** 9))
+    import_body = "english,korean,category\n" + "".join(
+        f"zzimport{i:04d},가져오기{i},benchmark\n" for i in range(100))
+    
+    def clear_cache() -> None:
+        app_module.response_cache.clear()
+    
+    return [
+        ("index", "GET", "/", lambda r: ("/", {}), None, 200),
+        ("healthz", "GET", "/healthz", lambda r: ("/healthz", {}), None, 200),
+        ("readyz", "GET", "/readyz", lambda r: ("/readyz", {}), None, 200),
+        ("words_full", "GET", "/api/words", lambda r: ("/api/words", {}), None, 200),
+        ("words_full_uncached", "GET", "/api/words", lambda r: ("/api/words", {}), clear_cache, 200),
+        ("words_category", "GET", "/api/words",
+         lambda r: ("/api/words", {"query_string": {"category": top_category}}), clear_cache, 200),
+        ("words_page", "GET", "/api/words",
+         lambda r: ("/api/words", {"query_string": {"limit": 100, "cursor": app_module.encode_cursor(word())}}),
+         None, 200),
+        ("word_get", "GET", "/api/words/<word>", lambda r: (f"/api/words/{word()}", {}), None, 200),
+        ("word_get_missing", "GET", "/api/words/<word>", lambda r: (f"/api/words/{misspelled()}x", {}), None, 404),
+        ("suggest", "GET", "/api/words/suggest",
+         lambda r: ("/api/words/suggest", {"query_string": {"prefix": word()[:2]}}), None, 200),
+        ("similar", "GET", "/api/words/similar",
+         lambda r: ("/api/words/similar", {"query_string": {"word": misspelled()}}), None, 200),
+        ("search_english", "GET", "/api/search",
+         lambda r: ("/api/search", {"query_string": {"q": word()[:3]}}), None, 200),
+        ("search_korean", "GET", "/api/search",
+         lambda r: ("/api/search", {"query_string": {"q": store.get_word(word()).korean[:1]}}), None, 200),
+        ("search_choseong", "GET", "/api/search",
+         lambda r: ("/api/search", {"query_string": {"q": r.choice(CHOSEONG_QUERIES)}}), None, 200),
+        ("quiz_text", "POST", "/api/quiz", lambda r: ("/api/quiz", {"json": {}}), None, 200),
+        ("quiz_multiple", "POST", "/api/quiz", lambda r: ("/api/quiz", {"json": {"mode": "multiple"}}), None, 200),
+        ("quiz_focus", "POST", "/api/quiz", lambda r: ("/api/quiz", {"json": {"focus_mode": True}}), None, 200),
+        ("quiz_review", "POST", "/api/quiz", lambda r: ("/api/quiz", {"json": {"review_mode": True}}), None, 200),
+        ("quiz_batch", "POST", "/api/quiz/batch", lambda r: ("/api/quiz/batch", {"json": {"count": 10}}), None, 200),
+        ("stats", "GET", "/api/stats", lambda r: ("/api/stats", {}), None, 200),
+        ("stats_uncached", "GET", "/api/stats", lambda r: ("/api/stats", {}), clear_cache, 200),
+        ("categories", "GET", "/api/categories", lambda r: ("/api/categories", {}), clear_cache, 200),
+        ("export_ndjson", "GET", "/api/export", lambda r: ("/api/export", {}), None, 200),
+        ("export_csv", "GET", "/api/export", lambda r: ("/api/export", {"query_string": {"format": "csv"}}), None, 200),
+        ("quiz_check", "POST", "/api/quiz/check", lambda r: ("/api/quiz/check", {"json": answer(word())}), None, 200),
+        ("quiz_check_batch", "POST", "/api/quiz/check/batch",
+         lambda r: ("/api/quiz/check/batch", {"json": {"answers": [answer(word()) for _ in range(10)]}}), None, 200),
+        ("word_add", "POST", "/api/words",
+         lambda r: ("/api/words", {"json": {"english": f"zzadd{next(counter):06d}", "korean": "추가",
+                                            "category": "benchmark"}}), None, 200),
+        ("word_update", "PUT", "/api/words/<word>",
+         lambda r: (f"/api/words/{bench_words[0]}", {"json": {"english": bench_words[0],
+                                                             "korean": f"수정{next(counter)}",
+                                                             "category": "benchmark"}}), None, 200),
+        ("word_delete", "DELETE", "/api/words/<word>", lambda r: (f"/api/words/{next(delete_pool)}", {}), None, 200),
+        ("import_csv", "POST", "/api/import",
+         lambda r: ("/api/import", {"query_string": {"format": "csv", "on_conflict": "overwrite"},
+                                    "data": import_body.encode("utf-8")}), None, 200),
+    ]
+
+def run_case(client, case: Case, rng: random.Random, repeat: int, budget: float) -> Dict:
+    """항목 하나를 반복 호출해 응답 시간 측정 (마지막에 한 번 더 호출해 할당 메모리 측정)"""
+    name, method, rule, make_request, prepare, expected = case
+    samples = []
+    unexpected = 0
+    started = time.perf_counter()
+    while len(samples) < repeat:
+        if len(samples) >= MIN_SAMPLES and time.perf_counter() - started >= budget:
+            break
+        if prepare:
+            prepare()
+        url, kwargs = make_request(rng)
+        t0 = time.perf_counter()
+        response = client.open(url, method=method, **kwargs)
+        response.get_data()  # 스트리밍 응답은 끝까지 읽어야 함
+        samples.append(time.perf_counter() - t0)
+        if response.status_code != expected:
+            unexpected += 1
+        response.close()
+    
+    result = summarize(samples)
+    result["unexpected_status"] = unexpected
+    
+    # 요청 하나가 잠깐 쓰는 메모리 (tracemalloc은 느려서 시간 측정과 따로 함)
+    if prepare:
+        prepare()
+    url, kwargs = make_request(rng)
+    tracemalloc.start()
+    response = client.open(url, method=method, **kwargs)
+    response.get_data()
+    result["alloc_peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    tracemalloc.stop()
+    response.close()
+    return result
+
+def run_worker(size: int, seed: int, repeat: int, budget: float) -> Dict:
+    """
+    한 크기의 단어장으로 측정 (임시 폴더를 현재 폴더로 쓰는 별도 프로세스에서 실행)
+    
+    Returns:
+        Dict: 측정 결과
+    """
+    now = time.time()
+    started = time.perf_counter()
+    words = generate_vocabulary(size, seed, os.getcwd(), now)
+    generate_seconds = time.perf_counter() - started
+    
+    logging.disable(logging.INFO)
+    import web_vocab_app
+    if web_vocab_app.STORAGE_BACKEND == "sqlite":
+        # 처음 열 때 JSON 단어장을 데이터베이스로 옮기므로 미리 한 번 열어 둠 (측정에서 제외)
+        migrated = web_vocab_app.create_store()
+        migrated.load()
+        migrated.close()
+    rss_before = rss_mb()
+    
+    started = time.perf_counter()
+    web_vocab_app.load_data()
+    load_seconds = time.perf_counter() - started
+    rss_loaded = rss_mb()
+    
+    save_samples = []
+    for _ in range(SAVE_REPEAT):
+        started = time.perf_counter()
+        if not web_vocab_app.save_data():
+            raise RuntimeError("save_data() 실패")
+        save_samples.append(time.perf_counter() - started)
+    
+    rng = random.Random(seed)
+    client = web_vocab_app.app.test_client()
+    cases = build_cases(web_vocab_app, words, rng, repeat)
+    del words
+    
+    routes = {}
+    for case in cases:
+        routes[case[0]] = run_case(client, case, rng, repeat, budget)
+    
+    # 측정하지 않은 라우트 확인 (새 API를 추가하면 build_cases에도 추가해야 함)
+    covered = {(case[2], case[1]) for case in cases}
+    missing = sorted(
+        f"{method} {rule.rule}"
+        for rule in web_vocab_app.app.url_map.iter_rules() if rule.endpoint != "static"
+        for method in rule.methods - {"HEAD", "OPTIONS"} if (rule.rule, method) not in covered
+    )
+    
+    return {
+        "words": size,
+        "backend": web_vocab_app.STORAGE_BACKEND,
+        "persist_mode": web_vocab_app.PERSIST_MODE,
+        "generate_seconds": round(generate_seconds, 3),
+        "load": summarize([load_seconds]),
+        "save": summarize(save_samples),
+        "memory": {
+            "rss_before_load_mb": round(rss_before, 1),
+            "rss_after_load_mb": round(rss_loaded, 1),
+            "data_mb": round(rss_loaded - rss_before, 1),
+            "peak_rss_mb": round(peak_rss_mb(), 1)
+        },
+        "routes": routes,
+        "uncovered_routes": missing
+    }
+
+def run_size(size: int, args: argparse.Namespace) -> Dict:
+    """크기 하나를 새 프로세스와 임시 폴더에서 측정"""
+    workdir = tempfile.mkdtemp(prefix=f"vocab_bench_{size_label(size)}_")
+    env = dict(os.environ, STORAGE_BACKEND=args.backend, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    if args.persist_mode:
+        env["PERSIST_MODE"] = args.persist_mode
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", str(size), "--seed", str(args.seed),
+           "--repeat", str(args.repeat), "--budget", str(args.budget)]
+    try:
+        completed = subprocess.run(cmd, cwd=workdir, env=env, stdout=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"{size_label(size)} 측정 실패 (종료 코드 {completed.returncode})")
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def print_report(label: str, result: Dict) -> None:
+    memory = result["memory"]
+    print(f"\n[{label}] {result['words']}개 단어 ({result['backend']}, {result['persist_mode']})")
+    print(f"  load_data: {result['load']['p50_ms']:.1f}ms, save_data p50: {result['save']['p50_ms']:.1f}ms")
+    print(f"  메모리: 불러온 데이터 {memory['data_mb']}MB, 최대 상주 {memory['peak_rss_mb']}MB")
+    print(f"  {'항목':<22}{'횟수':>6}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}{'할당KB':>10}")
+    for name, stats in result["routes"].items():
+        flag = "  (상태 코드 이상)" if stats["unexpected_status"] else ""
+        print(f"  {name:<22}{stats['samples']:>6}{stats['p50_ms']:>10.3f}{stats['p90_ms']:>10.3f}"
+              f"{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}{stats['alloc_peak_kb']:>10.1f}{flag}")
+    if result["uncovered_routes"]:
+        print(f"  측정하지 않은 라우트: {', '.join(result['uncovered_routes'])}")
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    기준 결과와 비교해 느려진 항목 찾기 (p50 기준)
+    
+    Returns:
+        List[str]: 느려진 항목 설명 목록
+    """
+    regressions = []
+    for label, result in results["sizes"].items():
+        base = baseline.get("sizes", {}).get(label)
+        if base is None or base.get("backend") != result["backend"]:
+            continue
+        entries = [("load_data", result["load"], base["load"]), ("save_data", result["save"], base["save"])]
+        entries += [(name, stats, base["routes"][name]) for name, stats in result["routes"].items()
+                    if name in base.get("routes", {})]
+        for name, stats, base_stats in entries:
+            old, new = base_stats["p50_ms"], stats["p50_ms"]
+            if new - old > NOISE_FLOOR_MS and new > old * (1 + tolerance):
+                regressions.append(f"[{label}] {name}: p50 {old:.3f}ms -> {new:.3f}ms ({new / old - 1:+.0%})"
+                                   if old else f"[{label}] {name}: p50 {old:.3f}ms -> {new:.3f}ms")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="단어장 API 성능 측정")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"단어장 크기 목록 (기본: {DEFAULT_SIZES})")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default=os.environ.get("STORAGE_BACKEND", "json"),
+                        help="저장소 (기본: STORAGE_BACKEND 또는 json)")
+    parser.add_argument("--persist-mode", choices=("sync", "deferred"), help="json 저장소의 저장 모드")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"항목마다 최대 호출 수 (기본: {DEFAULT_REPEAT})")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help=f"항목마다 측정 시간 한도, 초 (기본: {DEFAULT_BUDGET})")
+    parser.add_argument("--seed", type=int, default=42, help="가상 단어장 난수 시드")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help=f"기준 결과 파일 (기본: {BASELINE_FILE})")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"기준보다 p50이 이 비율 이상 늘면 느려진 것으로 봄 (기본: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    
+    if args.worker is not None:
+        result = run_worker(args.worker, args.seed, max(MIN_SAMPLES, args.repeat), args.budget)
+        print(json.dumps(result, ensure_ascii=False))
+        return 0
+    
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": {}
+    }
+    for text in args.sizes.split(","):
+        size = parse_size(text)
+        label = size_label(size)
+        print(f"{label}: 가상 단어장 만드는 중...", file=sys.stderr, flush=True)
+        results["sizes"][label] = run_size(size, args)
+        print_report(label, results["sizes"][label])
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 결과 저장: {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"\n기준 결과({args.baseline})가 없습니다. --save-baseline으로 먼저 저장해주세요.")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n기준({baseline.get('created')})보다 느려진 항목:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\n기준({baseline.get('created')}) 대비 느려진 항목 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
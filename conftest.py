@@ -0,0 +1,38 @@
+"""
+pytest 공통 설정
+
+web_vocab_app은 현재 폴더의 데이터 파일을 쓰므로, 테스트마다 임시 폴더로 옮긴 뒤
+새 저장소를 만들어 전역 저장소 대신 쓰게 함 (실제 vocabulary.json은 건드리지 않음)
+"""
+
+import logging
+
+import pytest
+
+import web_vocab_app
+
+logging.disable(logging.INFO)
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend(request) -> str:
+    """저장소 종류 (json, sqlite 각각 실행)"""
+    return request.param
+
+@pytest.fixture
+def store(tmp_path, monkeypatch, backend):
+    """임시 폴더에 만든 빈 저장소 (인덱스 포함, 앱의 전역 저장소로도 씀)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(web_vocab_app, "STORAGE_BACKEND", backend)
+    new_store = web_vocab_app.create_store()
+    new_store.load()
+    monkeypatch.setattr(web_vocab_app, "store", new_store)
+    monkeypatch.setattr(web_vocab_app, "data_ready", True)
+    monkeypatch.setattr(web_vocab_app, "data_load_seconds", 0.0)
+    web_vocab_app.response_cache.clear()
+    yield new_store
+    new_store.close()
+
+@pytest.fixture
+def client(store):
+    """Flask 테스트 클라이언트"""
+    return web_vocab_app.app.test_client()
@@ -0,0 +1,27 @@
+"""
+Gunicorn 설정
+
+데이터를 마스터 프로세스에서 한 번만 불러온 뒤(preload) fork된 워커들이
+copy-on-write로 공유하도록 설정합니다. 워커 수를 늘려도 시작 시간과
+워커당 메모리가 거의 늘지 않습니다.
+
+실행: gunicorn --config gunicorn.conf.py
+"""
+
+import os
+
+# ✅ Railway 등에서는 PORT 환경 변수 사용
+bind = f"0.0.0.0:{int(os.environ.get('PORT', 5000))}"
+
+# WEB_CONCURRENCY로 워커 수 조정 (예: CPU 코어 수)
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+timeout = 120
+
+# 마스터에서 create_app()으로 데이터를 미리 불러옴
+wsgi_app = "web_vocab_app:create_app()"
+preload_app = True
+
+def when_ready(server):
+    """데이터 로드가 끝나고 워커를 띄우기 직전에 호출"""
+    server.log.info(f"데이터 준비 완료, 워커 {workers}개 x 스레드 {threads}개로 시작합니다.")
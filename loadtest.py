@@ -0,0 +1,545 @@
+"""
+gunicorn 배포 부하 테스트 (표준 라이브러리 asyncio만 사용)
+
+임시 폴더에 가상 단어장을 만들고 gunicorn을 원하는 워커/스레드 구성으로 띄운 뒤,
+목록/퀴즈/정답 확인/단어 변경 요청을 정해진 비율로 목표 RPS에 맞춰 보냄 (open-loop).
+응답 시간은 요청을 보내기로 한 시각부터 재므로 서버가 밀리면 대기 시간도 포함됨.
+
+끝나면 처리량, 응답 시간 백분위수, 오류율과 함께 '잃어버린 변경' 수를 보고함.
+성공 응답을 받은 변경(정답 기록, 추가, 수정, 삭제)이 서버 응답과 디스크에 모두 남아 있는지 확인함.
+변경은 이 테스트가 만든 단어에만 하므로 --url로 기존 서버에 보내도 원래 단어는 바뀌지 않음
+
+사용법:
+    python loadtest.py                                   # 워커 2 x 스레드 2, 200 RPS, 30초
+    python loadtest.py --workers 4 --threads 4 --rps 800 --duration 60
+    python loadtest.py --mix list=50,quiz=30,check=20    # 요청 비율
+    python loadtest.py --url http://127.0.0.1:5000       # 이미 떠 있는 서버에 보냄 (디스크 확인 생략)
+
+잃어버린 변경이나 5xx/연결 오류가 있으면 종료 코드 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from benchmark import generate_vocabulary, percentile
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MIX = "list=40,quiz=25,check=25,add=4,update=4,delete=2"
+REQUEST_KINDS = ("list", "quiz", "check", "add", "update", "delete")
+# 정답 기록을 몰아서 보내는 단어 수 (적을수록 같은 단어에 동시 변경이 많아짐)
+HOT_WORDS = 50
+# 연결 하나에서 응답을 기다리는 시간 (초)
+REQUEST_TIMEOUT = 30.0
+# 서버가 준비될 때까지 기다리는 시간 (초)
+STARTUP_TIMEOUT = 300.0
+
+class HttpConnection:
+    """keep-alive HTTP/1.1 연결 하나 (요청 하나씩 순서대로 보냄)"""
+    
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+    
+    async def request(self, method: str, path: str, body: Optional[Dict] = None) -> Tuple[int, bytes]:
+        """
+        요청 보내고 응답 받기
+        
+        서버가 쉬고 있던 keep-alive 연결을 먼저 닫은 경우(응답이 한 바이트도 없음)에만 새 연결로 한 번 다시 보냄
+        
+        Returns:
+            Tuple[int, bytes]: (상태 코드, 응답 본문)
+        """
+        reused = self.writer is not None
+        try:
+            return await self._send(method, path, body)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            self.close()
+            if not reused or (isinstance(e, asyncio.IncompleteReadError) and e.partial):
+                raise
+            return await self._send(method, path, body)
+    
+    async def _send(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+        if body is not None:
+            head += "Content-Type: application/json\r\n"
+        head += f"Content-Length: {len(payload)}\r\n\r\n"
+        self.writer.write(head.encode("latin-1") + payload)
+        await self.writer.drain()
+        
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                chunks.append(chunk[:-2])
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await self.reader.read()
+            self.close()
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, data
+    
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+class LoadState:
+    """
+    요청 생성과 결과 기록
+    
+    성공 응답을 받은 변경만 '기대 상태'에 반영함 (마지막에 서버/디스크 상태와 비교)
+    """
+    
+    def __init__(self, run_id: str, hot_words: List[str], update_pool: List[str], delete_pool: List[str],
+                 rng: random.Random):
+        self.run_id = run_id
+        self.hot_words = hot_words
+        self.update_pool = update_pool
+        self.delete_pool = delete_pool
+        self.rng = rng
+        self.next_add = 0
+        self.next_update = 0
+        self.next_delete = 0
+        self.cursors: List[str] = [""]  # 목록 요청에 쓸 커서 (받은 응답에서 모음)
+        # 성공 응답을 받은 변경
+        self.expected_stats: Dict[str, List[int]] = {word: [0, 0] for word in hot_words}
+        self.added: List[str] = []
+        self.updated: Dict[str, str] = {}
+        self.deleted: List[str] = []
+        # 결과 기록
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.service_times: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.failures: Dict[str, int] = defaultdict(int)  # 연결 오류/시간 초과
+        self.skipped: Dict[str, int] = defaultdict(int)  # 대상 단어가 모자라 보내지 않은 요청
+    
+    def make_request(self, kind: str) -> Optional[Tuple[str, str, Optional[Dict], Optional[tuple]]]:
+        """
+        요청 만들기
+        
+        Returns:
+            (메서드, 경로, JSON 본문, 성공 시 기록할 변경) 또는 None (보낼 대상이 없음)
+        """
+        rng = self.rng
+        if kind == "list":
+            cursor = rng.choice(self.cursors)
+            query = {"limit": 50}
+            if cursor:
+                query["cursor"] = cursor
+            return "GET", "/api/words?" + urllib.parse.urlencode(query), None, None
+        if kind == "quiz":
+            body = {"mode": rng.choice(("text", "multiple")),
+                    "type": rng.choice(("english_to_korean", "korean_to_english"))}
+            if rng.random() < 0.2:
+                body[rng.choice(("focus_mode", "review_mode"))] = True
+            return "POST", "/api/quiz", body, None
+        if kind == "check":
+            word = rng.choice(self.hot_words)
+            correct = rng.random() < 0.7
+            body = {"word": word, "answer": f"뜻 {word}" if correct else "오답",
+                    "type": "english_to_korean", "mode": "text"}
+            return "POST", "/api/quiz/check", body, ("check", word, correct)
+        if kind == "add":
+            word = f"{self.run_id}add{self.next_add}"
+            self.next_add += 1
+            body = {"english": word, "korean": f"추가 {word}", "category": "loadtest"}
+            return "POST", "/api/words", body, ("add", word)
+        if kind == "update":
+            # 단어마다 한 번만 수정하므로 마지막 값이 정해져 있음
+            if self.next_update >= len(self.update_pool):
+                return None
+            word = self.update_pool[self.next_update]
+            self.next_update += 1
+            korean = f"수정 {word}"
+            body = {"english": word, "korean": korean, "category": "loadtest"}
+            return "PUT", f"/api/words/{word}", body, ("update", word, korean)
+        if kind == "delete":
+            if self.next_delete >= len(self.delete_pool):
+                return None
+            word = self.delete_pool[self.next_delete]
+            self.next_delete += 1
+            return "DELETE", f"/api/words/{word}", None, ("delete", word)
+        raise ValueError(f"알 수 없는 요청 종류: {kind}")
+    
+    def record(self, kind: str, status: int, data: bytes, change: Optional[tuple]) -> None:
+        self.statuses[kind][status] += 1
+        if status != 200:
+            return
+        if kind == "list" and len(self.cursors) < 1000:
+            cursor = json.loads(data).get("next_cursor")
+            if cursor:
+                self.cursors.append(cursor)
+        if change is None:
+            return
+        if change[0] == "check":
+            self.expected_stats[change[1]][0 if change[2] else 1] += 1
+        elif change[0] == "add":
+            self.added.append(change[1])
+        elif change[0] == "update":
+            self.updated[change[1]] = change[2]
+        elif change[0] == "delete":
+            self.deleted.append(change[1])
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'list=40,quiz=25,...' 형식의 요청 비율 해석"""
+    mix = {}
+    for item in text.split(","):
+        kind, _, weight = item.partition("=")
+        kind = kind.strip()
+        if kind not in REQUEST_KINDS:
+            raise ValueError(f"알 수 없는 요청 종류: {kind} ({', '.join(REQUEST_KINDS)} 중 하나)")
+        mix[kind] = float(weight)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("요청 비율이 비어 있습니다.")
+    return mix
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def http_json(base_url: str, method: str, path: str, body: Optional[bytes] = None,
+              content_type: str = "application/json"):
+    """준비/확인 단계에서 쓰는 간단한 동기 요청 (JSON 응답)"""
+    request = urllib.request.Request(base_url + path, data=body, method=method,
+                                     headers={"Content-Type": content_type})
+    with urllib.request.urlopen(request, timeout=STARTUP_TIMEOUT) as response:
+        return json.loads(response.read())
+
+def start_server(workdir: str, port: int, args: argparse.Namespace) -> subprocess.Popen:
+    """임시 폴더를 데이터 폴더로 gunicorn 시작 (gunicorn.conf.py 설정에 워커/스레드만 덮어씀)"""
+    env = dict(os.environ, STORAGE_BACKEND=args.backend, PYTHONPATH=REPO_DIR)
+    if args.persist_mode:
+        env["PERSIST_MODE"] = args.persist_mode
+    cmd = ["gunicorn", "--config", os.path.join(REPO_DIR, "gunicorn.conf.py"), "--chdir", workdir,
+           "--bind", f"127.0.0.1:{port}", "--workers", str(args.workers), "--threads", str(args.threads)]
+    log = open(os.path.join(workdir, "gunicorn.log"), "w")
+    return subprocess.Popen(cmd, cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+def wait_ready(base_url: str, process: Optional[subprocess.Popen]) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"gunicorn이 종료되었습니다 (종료 코드 {process.returncode})")
+        try:
+            if http_json(base_url, "GET", "/readyz").get("ready"):
+                return
+        except (OSError, ValueError):
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("서버가 준비되지 않았습니다.")
+
+def stop_server(process: subprocess.Popen) -> None:
+    """정상 종료 (워커가 남은 변경을 저장하고 끝나도록 SIGTERM)"""
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+def prepare_words(base_url: str, run_id: str, update_count: int, delete_count: int
+                  ) -> Tuple[List[str], List[str], List[str]]:
+    """테스트용 단어 만들기 (정답 기록용, 수정용, 삭제용) - /api/import로 한 번에 추가"""
+    hot = [f"{run_id}hot{i}" for i in range(HOT_WORDS)]
+    update_pool = [f"{run_id}upd{i}" for i in range(update_count)]
+    delete_pool = [f"{run_id}del{i}" for i in range(delete_count)]
+    body = "".join(f"{word},뜻 {word},loadtest\n" for word in hot + update_pool + delete_pool)
+    result = http_json(base_url, "POST", "/api/import?format=csv&on_conflict=overwrite&chunk_size=5000",
+                       body.encode("utf-8"), "text/csv")
+    if not result.get("success") or result["failed"]:
+        raise RuntimeError(f"테스트 단어 추가 실패: {result}")
+    return hot, update_pool, delete_pool
+
+async def run_load(base_url: str, state: LoadState, mix: Dict[str, float], rps: float, duration: float,
+                   connections: int) -> float:
+    """
+    목표 RPS로 요청 보내기 (요청 간격은 지수 분포, 연결이 모두 쓰이고 있으면 기다림)
+    
+    Returns:
+        float: 실제로 걸린 시간 (초, 마지막 응답까지)
+    """
+    parsed = urllib.parse.urlsplit(base_url)
+    pool: asyncio.Queue = asyncio.Queue()
+    for _ in range(connections):
+        pool.put_nowait(HttpConnection(parsed.hostname, parsed.port or 80))
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    loop = asyncio.get_running_loop()
+    
+    async def one(kind: str, scheduled: float) -> None:
+        request = state.make_request(kind)
+        if request is None:
+            state.skipped[kind] += 1
+            return
+        method, path, body, change = request
+        connection = await pool.get()
+        sent = loop.time()
+        try:
+            status, data = await asyncio.wait_for(connection.request(method, path, body), REQUEST_TIMEOUT)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError):
+            connection.close()
+            state.failures[kind] += 1
+            return
+        finally:
+            pool.put_nowait(connection)
+        done = loop.time()
+        state.latencies[kind].append(done - scheduled)
+        state.service_times[kind].append(done - sent)
+        state.record(kind, status, data, change)
+    
+    tasks = []
+    started = loop.time()
+    scheduled = started
+    while True:
+        scheduled += state.rng.expovariate(rps)
+        if scheduled - started >= duration:
+            break
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        kind = state.rng.choices(kinds, weights)[0]
+        tasks.append(asyncio.ensure_future(one(kind, scheduled)))
+    await asyncio.gather(*tasks)
+    while not pool.empty():
+        pool.get_nowait().close()
+    return loop.time() - started
+
+def compare_state(state: LoadState, rows: Dict[str, Dict]) -> Dict[str, int]:
+    """
+    성공 응답을 받은 변경과 실제 상태 비교
+    
+    Args:
+        rows: {단어: {"korean", "correct", "wrong"}} (테스트 단어만)
+    
+    Returns:
+        Dict[str, int]: 종류별 잃어버린 변경 수 (+ 응답 없이 반영된 정답 기록 수)
+    """
+    lost = {"check": 0, "add": 0, "update": 0, "delete": 0, "unacknowledged_checks": 0}
+    for word, (correct, wrong) in state.expected_stats.items():
+        row = rows.get(word, {})
+        for expected, actual in ((correct, row.get("correct", 0)), (wrong, row.get("wrong", 0))):
+            lost["check"] += max(0, expected - actual)
+            lost["unacknowledged_checks"] += max(0, actual - expected)
+    lost["add"] = sum(1 for word in state.added if word not in rows)
+    lost["update"] = sum(1 for word, korean in state.updated.items() if rows.get(word, {}).get("korean") != korean)
+    lost["delete"] = sum(1 for word in state.deleted if word in rows)
+    return lost
+
+def served_rows(base_url: str, run_id: str) -> Dict[str, Dict]:
+    """서버가 보여 주는 테스트 단어 상태 (/api/export)"""
+    rows = {}
+    with urllib.request.urlopen(base_url + "/api/export?format=ndjson", timeout=STARTUP_TIMEOUT) as response:
+        for line in response:
+            row = json.loads(line)
+            if row["english"].startswith(run_id):
+                rows[row["english"]] = row
+    return rows
+
+# 서버를 멈춘 뒤 데이터 폴더에서 저장소를 직접 불러와 테스트 단어 상태를 출력하는 코드
+DISK_READER = """
+import json, logging, sys
+logging.disable(logging.INFO)
+import web_vocab_app
+web_vocab_app.load_data()
+store = web_vocab_app.get_store()
+prefix = sys.argv[1]
+rows = {}
+for word, data in store.iter_words():
+    if word.startswith(prefix):
+        correct, wrong = store.get_stats(word) or (0, 0)
+        rows[word] = {"korean": data.korean, "correct": correct, "wrong": wrong}
+store.close()
+print(json.dumps(rows, ensure_ascii=False))
+"""
+
+def disk_rows(workdir: str, run_id: str, backend: str) -> Dict[str, Dict]:
+    """디스크에 남은 테스트 단어 상태 (서버를 멈춘 뒤 새 프로세스로 불러옴)"""
+    env = dict(os.environ, STORAGE_BACKEND=backend, PYTHONPATH=REPO_DIR)
+    completed = subprocess.run([sys.executable, "-c", DISK_READER, run_id], cwd=workdir, env=env,
+                               stdout=subprocess.PIPE, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def summarize(state: LoadState, elapsed: float) -> Dict:
+    """종류별/전체 처리량, 응답 시간, 오류 집계"""
+    def latency_summary(values: List[float]) -> Dict:
+        values = sorted(value * 1000 for value in values)
+        return {
+            "p50_ms": round(percentile(values, 50), 2),
+            "p90_ms": round(percentile(values, 90), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "p99_9_ms": round(percentile(values, 99.9), 2),
+            "max_ms": round(values[-1], 2) if values else 0.0
+        }
+    
+    kinds = {}
+    all_latencies = []
+    totals = {"requests": 0, "errors_4xx": 0, "errors_5xx": 0, "failures": 0}
+    for kind in REQUEST_KINDS:
+        statuses = state.statuses.get(kind, {})
+        if not statuses and not state.failures.get(kind) and not state.skipped.get(kind):
+            continue
+        requests = sum(statuses.values()) + state.failures.get(kind, 0)
+        errors_4xx = sum(count for status, count in statuses.items() if 400 <= status < 500)
+        errors_5xx = sum(count for status, count in statuses.items() if status >= 500)
+        kinds[kind] = {
+            "requests": requests,
+            "throughput_rps": round(requests / elapsed, 1),
+            "errors_4xx": errors_4xx,
+            "errors_5xx": errors_5xx,
+            "failures": state.failures.get(kind, 0),
+            "skipped": state.skipped.get(kind, 0),
+            "latency": latency_summary(state.latencies[kind]),
+            "service": latency_summary(state.service_times[kind])
+        }
+        all_latencies += state.latencies[kind]
+        totals["requests"] += requests
+        totals["errors_4xx"] += errors_4xx
+        totals["errors_5xx"] += errors_5xx
+        totals["failures"] += state.failures.get(kind, 0)
+    
+    totals["throughput_rps"] = round(totals["requests"] / elapsed, 1)
+    totals["error_rate"] = round((totals["errors_5xx"] + totals["failures"]) / totals["requests"], 4) \
+        if totals["requests"] else 0.0
+    totals["latency"] = latency_summary(all_latencies)
+    return {"elapsed_seconds": round(elapsed, 2), "total": totals, "kinds": kinds}
+
+def print_report(report: Dict) -> None:
+    config = report["config"]
+    total = report["result"]["total"]
+    print(f"\n워커 {config['workers']} x 스레드 {config['threads']} ({config['backend']}, {config['persist_mode']}), "
+          f"목표 {config['rps']} RPS, {report['result']['elapsed_seconds']}초")
+    print(f"  처리량 {total['throughput_rps']} RPS, 요청 {total['requests']}개, "
+          f"5xx {total['errors_5xx']}, 연결 오류/시간 초과 {total['failures']}, 오류율 {total['error_rate']:.2%}")
+    print(f"  {'종류':<8}{'요청':>8}{'RPS':>9}{'p50':>10}{'p90':>10}{'p99':>10}{'p99.9':>10}{'max':>10}{'4xx':>6}{'5xx':>6}")
+    rows = list(report["result"]["kinds"].items()) + [("전체", total)]
+    for kind, stats in rows:
+        latency = stats["latency"]
+        print(f"  {kind:<8}{stats['requests']:>8}{stats['throughput_rps']:>9}{latency['p50_ms']:>10}"
+              f"{latency['p90_ms']:>10}{latency['p99_ms']:>10}{latency['p99_9_ms']:>10}{latency['max_ms']:>10}"
+              f"{stats['errors_4xx']:>6}{stats['errors_5xx']:>6}")
+    for where, lost in report["lost_updates"].items():
+        unacknowledged = lost.pop("unacknowledged_checks")
+        print(f"  잃어버린 변경 ({where}): {sum(lost.values())}개 {lost}"
+              + (f", 응답 없이 반영된 정답 기록 {unacknowledged}개" if unacknowledged else ""))
+        lost["unacknowledged_checks"] = unacknowledged
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="gunicorn 배포 부하 테스트")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn 워커 수 (기본: 2)")
+    parser.add_argument("--threads", type=int, default=2, help="워커당 스레드 수 (기본: 2)")
+    parser.add_argument("--rps", type=float, default=200, help="목표 초당 요청 수 (기본: 200)")
+    parser.add_argument("--duration", type=float, default=30, help="부하 시간, 초 (기본: 30)")
+    parser.add_argument("--connections", type=int, default=64, help="동시 연결 수 (기본: 64)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"요청 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--words", type=int, default=10000, help="가상 단어장 크기 (기본: 10000)")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default=os.environ.get("STORAGE_BACKEND", "json"),
+                        help="저장소 (기본: STORAGE_BACKEND 또는 json)")
+    parser.add_argument("--persist-mode", choices=("sync", "deferred"), help="json 저장소의 저장 모드")
+    parser.add_argument("--url", help="이미 떠 있는 서버 주소 (지정하면 서버를 띄우지 않음)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--settle", type=float, default=2.0,
+                        help="부하가 끝난 뒤 확인 전에 기다리는 시간, 초 (deferred 모드 저장 주기보다 길게)")
+    parser.add_argument("--keep", action="store_true", help="임시 데이터 폴더를 지우지 않음")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args(argv)
+    
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    rng = random.Random(args.seed)
+    run_id = f"zzlt{int(time.time()) % 100000}x"
+    # 수정/삭제 대상은 단어마다 한 번씩만 쓰므로 예상 요청 수보다 넉넉히 만듦
+    weight_sum = sum(mix.values())
+    expected = {kind: int(args.rps * args.duration * mix.get(kind, 0) / weight_sum * 1.5) + 10
+                for kind in ("update", "delete")}
+    
+    workdir = None
+    process = None
+    base_url = args.url.rstrip("/") if args.url else None
+    try:
+        if base_url is None:
+            workdir = tempfile.mkdtemp(prefix="vocab_loadtest_")
+            print(f"가상 단어장 {args.words}개 만드는 중... ({workdir})", file=sys.stderr, flush=True)
+            generate_vocabulary(args.words, args.seed, workdir, time.time())
+            port = free_port()
+            process = start_server(workdir, port, args)
+            base_url = f"http://127.0.0.1:{port}"
+        wait_ready(base_url, process)
+        
+        hot, update_pool, delete_pool = prepare_words(base_url, run_id, expected["update"], expected["delete"])
+        state = LoadState(run_id, hot, update_pool, delete_pool, rng)
+        print(f"부하 시작: {args.rps} RPS, {args.duration}초", file=sys.stderr, flush=True)
+        elapsed = asyncio.run(run_load(base_url, state, mix, args.rps, args.duration, args.connections))
+        
+        time.sleep(args.settle)
+        lost_updates = {"served": compare_state(state, served_rows(base_url, run_id))}
+        if process is not None:
+            stop_server(process)
+            process = None
+            lost_updates["disk"] = compare_state(state, disk_rows(workdir, run_id, args.backend))
+        
+        report = {
+            "config": {"workers": args.workers, "threads": args.threads, "rps": args.rps,
+                       "duration": args.duration, "connections": args.connections, "mix": mix,
+                       "words": args.words, "backend": args.backend,
+                       "persist_mode": args.persist_mode or os.environ.get("PERSIST_MODE", "sync"),
+                       "url": args.url},
+            "result": summarize(state, elapsed),
+            "lost_updates": lost_updates
+        }
+    finally:
+        if process is not None:
+            stop_server(process)
+        if workdir is not None and not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    total = report["result"]["total"]
+    lost = sum(count for where in lost_updates.values() for kind, count in where.items()
+               if kind != "unacknowledged_checks")
+    return 1 if lost or total["errors_5xx"] or total["failures"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,14 +14,11 @@ port = int(os.environ.get("PORT", 5000))
 if __name__ == '__main__':
     print(f"Starting Gunicorn on port {port}", flush=True)
     
-    # Gunicorn 실행
+    # Gunicorn 실행 (워커/스레드/preload 설정은 gunicorn.conf.py)
     cmd = [
         'gunicorn',
-        '--bind', f'0.0.0.0:{port}',
-        '--workers', '2',
-        '--threads', '2',
-        '--timeout', '120',
-        'web_vocab_app:app'
+        '--config', 'gunicorn.conf.py',
+        '--bind', f'0.0.0.0:{port}'
     ]
     
     print(f"Executing: {' '.join(cmd)}", flush=True)
@@ -17,5 +17,5 @@ fi
 echo "Starting Gunicorn on port $PORT"
 
 # Gunicorn 실행
-exec gunicorn --bind 0.0.0.0:$PORT --workers 2 --threads 2 --timeout 120 web_vocab_app:app
+exec gunicorn --config gunicorn.conf.py --bind 0.0.0.0:$PORT
 
@@ -35,24 +35,49 @@ function showTab(tabName, buttonElement) {
     }
 }
 
+// 단어 목록 페이지 크기
+const WORDS_PAGE_SIZE = 100;
+// 지금까지 불러온 단어와 다음 페이지 커서
+let loadedWords = [];
+let wordsCursor = null;
+
 /**
- * 단어 목록을 서버에서 불러와 화면에 표시
+ * 단어 목록을 서버에서 한 페이지씩 불러와 화면에 표시 (선택한 카테고리만)
+ * @param {boolean} append - true면 다음 페이지를 이어서 표시
  * @returns {Promise<void>}
  */
-async function loadWords() {
+async function loadWords(append = false) {
     const wordsList = document.getElementById('words-list');
-    wordsList.innerHTML = '<p class="loading">로딩 중...</p>';
+    const categoryFilter = document.getElementById('category-filter');
+    const category = categoryFilter ? categoryFilter.value : '';
+    if (!append) {
+        wordsList.innerHTML = '<p class="loading">로딩 중...</p>';
+    }
     
     try {
-        const response = await fetch('/api/words');
-        const words = await response.json();
+        const params = new URLSearchParams({ limit: WORDS_PAGE_SIZE });
+        if (category) {
+            params.set('category', category);
+        }
+        if (append && wordsCursor) {
+            params.set('cursor', wordsCursor);
+        }
         
-        if (words.length === 0) {
+        const response = await fetch(`/api/words?${params.toString()}`);
+        const page = await response.json();
+        loadedWords = append ? loadedWords.concat(page.words) : page.words;
+        wordsCursor = page.next_cursor;
+        
+        if (loadedWords.length === 0) {
             wordsList.innerHTML = '<p class="empty-message">저장된 단어가 없습니다. 단어를 추가해보세요!</p>';
             return;
         }
         
-        displayWords(words);
+        displayWords(loadedWords, page.total);
+        if (wordsCursor) {
+            wordsList.insertAdjacentHTML('beforeend',
+                '<button class="btn-search" onclick="loadWords(true)">더 보기</button>');
+        }
     } catch (error) {
         wordsList.innerHTML = '<p class="error-message">단어를 불러오는 중 오류가 발생했습니다.</p>';
         console.error('Error:', error);
@@ -62,8 +87,9 @@ async function loadWords() {
 /**
  * 단어 목록을 화면에 표시하는 함수
  * @param {Array<{english: string, korean: string}>} words - 표시할 단어 배열
+ * @param {number} [total] - 전체 단어 수 (일부만 표시하는 경우)
  */
-function displayWords(words) {
+function displayWords(words, total) {
     const wordsList = document.getElementById('words-list');
     
     if (words.length === 0) {
@@ -86,7 +112,7 @@ function displayWords(words) {
     `).join('');
     
     // 단어 개수 업데이트
-    document.getElementById('word-count').textContent = words.length;
+    document.getElementById('word-count').textContent = total === undefined ? words.length : total;
 }
 
 /**
@@ -101,24 +127,36 @@ async function searchWords() {
     const category = categoryFilter ? categoryFilter.value : '';
     const wordsList = document.getElementById('words-list');
     
+    // 검색어가 없으면 전체 목록을 페이지 단위로 표시
+    if (!searchTerm) {
+        await loadWords();
+        return;
+    }
+    
     wordsList.innerHTML = '<p class="loading">검색 중...</p>';
     
     try {
+        // 서버 검색 API 사용 (영어 또는 한글에 포함되는지 확인)
+        const params = new URLSearchParams({ q: searchTerm });
         // 카테고리 필터 적용
-        let url = '/api/words';
         if (category) {
-            url += `?category=${encodeURIComponent(category)}`;
+            params.set('category', category);
         }
+        const url = `/api/search?${params.toString()}`;
         
         const response = await fetch(url);
-        let words = await response.json();
+        const words = await response.json();
         
-        // 검색어로 필터링 (영어 또는 한글에 포함되는지 확인)
-        if (searchTerm) {
-            words = words.filter(word => 
-                word.english.toLowerCase().includes(searchTerm) || 
-                word.korean.includes(searchTerm)
-            );
+        // 결과가 없으면 철자가 비슷한 단어 추천
+        if (words.length === 0) {
+            const similarResponse = await fetch(`/api/words/similar?word=${encodeURIComponent(searchTerm)}`);
+            const similarWords = await similarResponse.json();
+            if (similarWords.length > 0) {
+                displayWords(similarWords);
+                wordsList.insertAdjacentHTML('afterbegin',
+                    '<p class="empty-message">검색 결과가 없습니다. 혹시 이 단어를 찾으셨나요?</p>');
+                return;
+            }
         }
         
         displayWords(words);
@@ -128,6 +166,35 @@ async function searchWords() {
     }
 }
 
+/**
+ * 입력 중인 영어 단어로 시작하는 기존 단어를 자동 완성 목록에 표시
+ * (이미 있는 단어를 다시 추가하지 않도록 뜻도 함께 보여줌)
+ * @returns {Promise<void>}
+ */
+async function suggestWords() {
+    const prefix = document.getElementById('english-input').value.trim().toLowerCase();
+    const suggestionList = document.getElementById('english-suggestions');
+    if (!suggestionList) {
+        return;
+    }
+    if (!prefix) {
+        suggestionList.innerHTML = '';
+        return;
+    }
+    
+    try {
+        const response = await fetch(`/api/words/suggest?prefix=${encodeURIComponent(prefix)}`);
+        const words = await response.json();
+        suggestionList.innerHTML = words.map(word =>
+            `<option value="${escapeHtml(word.english)}">${escapeHtml(word.korean)}</option>`
+        ).join('');
+    } catch (error) {
+        console.error('자동 완성 오류:', error);
+    }
+}
+
+document.getElementById('english-input').addEventListener('input', suggestWords);
+
 // 단어 추가
 document.getElementById('add-word-form').addEventListener('submit', async (e) => {
     e.preventDefault();
@@ -257,11 +324,45 @@ async function deleteWord(word) {
 // 퀴즈 시작
 let currentQuiz = null;
 
+// 한 번에 미리 받아 두는 퀴즈 문제 수
+const QUIZ_BATCH_SIZE = 10;
+// 미리 받아 둔 문제와 그때의 퀴즈 설정 (설정이 바뀌면 버림)
+let quizQueue = [];
+let quizQueueKey = '';
+
+/**
+ * 다음 퀴즈 문제 가져오기
+ * 문제를 한 번에 여러 개 받아 두고 하나씩 꺼내므로 매 문제마다 서버에 요청하지 않음
+ * @param {Object} options - 퀴즈 설정 (type, mode, category, focus_mode, review_mode)
+ * @returns {Promise<Object>} /api/quiz 응답과 같은 형식의 문제
+ */
+async function nextQuizQuestion(options) {
+    const key = JSON.stringify(options);
+    if (key !== quizQueueKey || quizQueue.length === 0) {
+        const response = await fetch('/api/quiz/batch', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ ...options, count: QUIZ_BATCH_SIZE })
+        });
+        
+        const result = await response.json();
+        if (!result.success) {
+            return result;
+        }
+        quizQueue = result.questions;
+        quizQueueKey = key;
+    }
+    return quizQueue.shift();
+}
+
 async function startQuiz() {
     const quizType = document.getElementById('quiz-type').value;
     const quizMode = document.getElementById('quiz-mode').value;
     const quizCategory = document.getElementById('quiz-category').value;
     const focusMode = document.getElementById('focus-mode').checked;
+    const reviewMode = document.getElementById('review-mode').checked;
     const quizArea = document.getElementById('quiz-area');
     const quizResult = document.getElementById('quiz-result');
     
@@ -269,21 +370,14 @@ async function startQuiz() {
     quizArea.innerHTML = '<p class="loading">문제를 불러오는 중...</p>';
     
     try {
-        const response = await fetch('/api/quiz', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({ 
-                type: quizType, 
-                mode: quizMode, 
-                category: quizCategory,
-                focus_mode: focusMode 
-            })
+        const result = await nextQuizQuestion({
+            type: quizType,
+            mode: quizMode,
+            category: quizCategory,
+            focus_mode: focusMode,
+            review_mode: reviewMode
         });
         
-        const result = await response.json();
-        
         if (result.success) {
             currentQuiz = result;
             
@@ -439,6 +533,7 @@ async function checkAnswer(selectedIndex = null) {
                 quizResult.innerHTML = `
                     <div class="quiz-result wrong">
                         ✗ 틀렸습니다. 정답은 "${escapeHtml(result.correct_answer)}" 입니다.<br>
+                        ${result.distance && result.distance <= 2 ? `<small>아깝네요! 철자가 ${result.distance}글자 다릅니다.</small><br>` : ''}
                         <small>맞춘 횟수: ${result.stats[0]}회 | 틀린 횟수: ${result.stats[1]}회</small>
                     </div>
                 `;
@@ -706,31 +801,8 @@ async function loadCategories() {
 
 // 카테고리별 필터링
 async function filterByCategory() {
-    const category = document.getElementById('category-filter').value;
-    const searchInput = document.getElementById('search-input');
-    const searchTerm = searchInput ? searchInput.value.trim().toLowerCase() : '';
-    
-    try {
-        let url = '/api/words';
-        if (category) {
-            url += `?category=${encodeURIComponent(category)}`;
-        }
-        
-        const response = await fetch(url);
-        let words = await response.json();
-        
-        // 검색어가 있으면 추가 필터링
-        if (searchTerm) {
-            words = words.filter(word => 
-                word.english.toLowerCase().includes(searchTerm) || 
-                word.korean.includes(searchTerm)
-            );
-        }
-        
-        displayWords(words);
-    } catch (error) {
-        console.error('필터링 오류:', error);
-    }
+    // 검색어와 카테고리를 함께 적용
+    await searchWords();
 }
 
 // 페이지 로드 시 단어 목록 자동 로드 및 다크 모드 설정 불러오기
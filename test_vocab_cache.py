@@ -0,0 +1,43 @@
+"""
+응답 캐시 테스트 (버전 확인, 크기/항목 수 한도)
+"""
+
+from vocab_cache import ResponseCache
+
+def test_get_checks_version():
+    cache = ResponseCache()
+    cache.put("words", "v1", b"[1]")
+    assert cache.get("words", "v1") == b"[1]"
+    # 데이터 버전이 바뀌면 버리고 다시 만들게 함
+    assert cache.get("words", "v2") is None
+    assert cache.get("words", "v1") is None
+    assert cache.info() == {"entries": 0, "bytes": 0, "hits": 1, "misses": 2, "evictions": 0}
+
+def test_put_replaces_entry():
+    cache = ResponseCache()
+    cache.put("words", "v1", b"[1]")
+    cache.put("words", "v2", b"[1, 2]")
+    assert cache.get("words", "v2") == b"[1, 2]"
+    assert cache.size == 6 and len(cache.entries) == 1
+
+def test_evicts_least_recently_used():
+    cache = ResponseCache(max_bytes=10, max_entries=2)
+    cache.put("a", "v", b"aaaa")
+    cache.put("b", "v", b"bbbb")
+    assert cache.get("a", "v") == b"aaaa"
+    cache.put("c", "v", b"cccc")  # 항목 수 한도: 가장 오래 쓰이지 않은 b를 버림
+    assert list(cache.entries) == ["a", "c"]
+    cache.put("c", "v", b"ccccccc")  # 크기 한도: a를 버림
+    assert list(cache.entries) == ["c"] and cache.size == 7
+    assert cache.info()["evictions"] == 2
+    
+    cache.put("d", "v", b"d" * 11)  # 한도보다 큰 응답은 저장하지 않음
+    assert cache.get("d", "v") is None and list(cache.entries) == ["c"]
+    cache.clear()
+    assert cache.size == 0 and not cache.entries
+
+def test_disabled_cache():
+    cache = ResponseCache(max_bytes=0)
+    assert not cache.enabled
+    cache.put("words", "v1", b"[]")
+    assert cache.get("words", "v1") is None
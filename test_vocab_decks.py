@@ -0,0 +1,102 @@
+"""
+덱 저장소 캐시 테스트 (LRU 내보내기, 저장 중 다시 불러오기)
+"""
+
+import threading
+import time
+
+from vocab_decks import DeckCache, is_valid_deck_id
+
+class FakeStore:
+    """불러오기/저장/닫기 순서를 기록하는 저장소 (save는 gate가 열릴 때까지 대기)"""
+    
+    def __init__(self, deck_id, log, gate):
+        self.deck_id = deck_id
+        self.log = log
+        self.gate = gate
+        self.version = 0
+    
+    def load(self):
+        self.log.append(("load", self.deck_id))
+    
+    def save(self):
+        self.log.append(("save-start", self.deck_id))
+        self.gate.wait(5)
+        self.log.append(("save", self.deck_id))
+        return True
+    
+    def close(self):
+        self.log.append(("close", self.deck_id))
+    
+    def data_version(self):
+        return ("test", self.version, 0)
+    
+    def __len__(self):
+        return 1
+
+def make_cache(max_decks=1):
+    log = []
+    gate = threading.Event()
+    cache = DeckCache(lambda deck_id: FakeStore(deck_id, log, gate), max_decks=max_decks)
+    return cache, log, gate
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+def test_deck_id_validation():
+    assert is_valid_deck_id("my-deck_1")
+    assert not is_valid_deck_id("../etc")
+    assert not is_valid_deck_id("")
+    assert not is_valid_deck_id("a" * 65)
+
+def test_evicts_least_recently_used():
+    cache, log, gate = make_cache(max_decks=2)
+    gate.set()
+    for deck_id in ("a", "b", "a", "c"):
+        cache.acquire(deck_id)
+        cache.release(deck_id)
+    assert list(cache.entries) == ["a", "c"]
+    # 변경이 없던 덱은 저장하지 않고 닫음
+    assert ("close", "b") in log and ("save", "b") not in log
+    assert cache.info()["evictions"] == 1
+
+def test_pinned_deck_is_not_evicted():
+    cache, log, gate = make_cache(max_decks=1)
+    cache.acquire("a")
+    cache.acquire("b")
+    assert set(cache.entries) == {"a", "b"}
+    cache.release("a")
+    assert list(cache.entries) == ["b"]
+
+def test_save_runs_outside_cache_lock():
+    """저장이 오래 걸려도 다른 요청은 막히지 않고, 같은 덱은 저장이 끝난 뒤에 다시 불러옴"""
+    cache, log, gate = make_cache(max_decks=1)
+    store = cache.acquire("a")
+    store.version += 1  # 변경이 있었던 덱 (내보낼 때 저장함)
+    cache.release("a")
+    
+    evicting = threading.Thread(target=cache.acquire, args=("b",))
+    evicting.start()
+    wait_for(lambda: ("save-start", "a") in log)
+    
+    # 캐시 잠금을 잡지 않고 저장하므로 다른 호출이 바로 끝남
+    info = threading.Thread(target=cache.info)
+    info.start()
+    info.join(1)
+    assert not info.is_alive()
+    
+    reloading = threading.Thread(target=cache.acquire, args=("a",))
+    reloading.start()
+    time.sleep(0.2)
+    assert log.count(("load", "a")) == 1
+    
+    gate.set()
+    evicting.join(5)
+    reloading.join(5)
+    loads = [i for i, event in enumerate(log) if event == ("load", "a")]
+    assert len(loads) == 2
+    assert log.index(("close", "a")) < loads[1]
+    assert not cache.closing
@@ -0,0 +1,260 @@
+"""
+보조 인덱스 테스트 (추가/삭제/조회)
+"""
+
+import random
+import time
+
+import pytest
+
+from vocab_index import (NgramIndex, ChoseongIndex, PrefixIndex, FuzzyIndex, CategoryIndex, RankedList, WeaknessIndex,
+                         WordPool, DueQueue, edit_distance, choseong_key, is_choseong_query)
+from vocab_store import WordRecord
+
+WORDS = {
+    "apple": WordRecord("사과", "fruit"),
+    "pineapple": WordRecord("파인애플", "fruit"),
+    "apply": WordRecord("신청하다", "verb"),
+    "cat": WordRecord("고양이", "animal"),
+    "catalog": WordRecord("목록", ""),
+    "dog": WordRecord("개", "animal"),
+}
+
+def build(index, words=WORDS, stats=(), schedules=()):
+    index.rebuild(words.items(), stats, schedules)
+    return index
+
+def test_ngram_search():
+    index = build(NgramIndex())
+    # 완전 일치 > 앞부분 일치 > 부분 일치, 같으면 짧은 단어 먼저
+    assert index.search("apple") == ["apple", "pineapple"]
+    assert index.search("app") == ["apple", "apply", "pineapple"]
+    assert index.search("고양") == ["cat"]
+    assert index.search("사") == ["apple"]
+    assert index.search("app", limit=1) == ["apple"]
+    assert index.search("app", accept=lambda word: word != "apple") == ["apply", "pineapple"]
+    assert index.search("zzz") == []
+    assert index.search("  ") == []
+    
+    index.remove("apple", WORDS["apple"])
+    assert index.search("apple") == ["pineapple"]
+    index.add("apple", WordRecord("능금", "fruit"))
+    assert index.search("능금") == ["apple"]
+    assert index.search("사과") == []
+
+def test_ngram_single_character():
+    """한 글자 영어 검색어는 그 글자로 시작하는 단어만 순위대로 찾고 전체를 훑지 않음"""
+    words = dict(WORDS, a=WordRecord("하나", ""), bat=WordRecord("박쥐", "animal"))
+    index = build(NgramIndex(), words)
+    assert index.search("a") == ["a", "apple", "apply"]
+    assert index.search("C") == ["cat", "catalog"]
+    assert index.search("a", accept=lambda word: word != "apple") == ["a", "apply"]
+    assert index.search("x") == []
+    index.remove("a", words["a"])
+    index.add("ant", WordRecord("개미", "animal"))
+    assert index.search("a", limit=2) == ["ant", "apple"]
+    
+    many = {f"s{i:04d}": WordRecord("뜻", "") for i in range(2000)}
+    index = build(NgramIndex(), many)
+    checked = []
+    
+    def accept(word):
+        checked.append(word)
+        return True
+    
+    assert index.search("s", limit=5, accept=accept) == ["s0000", "s0001", "s0002", "s0003", "s0004"]
+    assert len(checked) == 5
+
+def test_choseong():
+    assert choseong_key("사과 주스") == "ㅅㄱ ㅈㅅ"
+    assert choseong_key("a사b") == "aㅅb"
+    assert is_choseong_query("ㅅㄱ")
+    assert not is_choseong_query("사과")
+    assert not is_choseong_query(" ")
+
+def test_choseong_search():
+    index = build(ChoseongIndex())
+    assert index.search("ㄱㅇㅇ") == ["cat"]
+    assert index.search("ㅅ") == ["apple", "apply"]
+    index.remove("cat", WORDS["cat"])
+    assert index.search("ㄱㅇㅇ") == []
+
+def test_prefix_index():
+    index = build(PrefixIndex())
+    assert list(index.iter_from()) == sorted(WORDS)
+    assert list(index.iter_from("cat")) == ["catalog", "dog", "pineapple"]
+    assert index.complete("app") == ["apple", "apply"]
+    assert index.complete("cat", accept=lambda word: word != "cat") == ["catalog"]
+    assert index.complete("a", limit=1) == ["apple"]
+    
+    index.add("apple", WORDS["apple"])  # 이미 있는 단어는 한 번만
+    index.add("applaud", WordRecord("박수 치다"))
+    index.remove("apply", WORDS["apply"])
+    assert index.complete("app") == ["applaud", "apple"]
+
+def test_edit_distance():
+    assert edit_distance("apple", "apple") == 0
+    assert edit_distance("aple", "apple") == 1
+    assert edit_distance("kitten", "sitting") == 3
+    assert edit_distance("a" * 50, "apple", max_distance=2) == 3
+
+def test_fuzzy_lookup():
+    index = build(FuzzyIndex(max_distance=2))
+    assert index.lookup("aple") == [("apple", 1), ("apply", 2)]
+    assert index.lookup("aple", max_distance=1) == [("apple", 1)]
+    assert index.lookup("dgo") == [("dog", 2)]
+    assert index.lookup("zzzz") == []
+    
+    index.remove("apple", WORDS["apple"])
+    assert index.lookup("aple") == [("apply", 2)]
+
+def test_category_index():
+    index = build(CategoryIndex())
+    assert index.words("fruit") == ["apple", "pineapple"]
+    assert index.count("animal") == 2
+    assert index.categories() == ["animal", "fruit", "verb"]
+    assert list(index.iter_from("fruit", "apple")) == ["pineapple"]
+    
+    index.remove("apply", WORDS["apply"])
+    index.add("banana", WordRecord("바나나", "fruit"))
+    assert index.categories() == ["animal", "fruit"]
+    assert list(index.iter_from("fruit")) == ["apple", "banana", "pineapple"]
+    assert index.words("fruit") == ["apple", "pineapple", "banana"]
+
+def test_ranked_list_matches_sorted_list():
+    rng = random.Random(7)
+    ranked = RankedList()
+    ranked.BUCKET_SIZE = 4  # 구간 나누기/합치기까지 확인
+    expected = []
+    for _ in range(500):
+        value = rng.randrange(200)
+        if value in expected and rng.random() < 0.4:
+            assert ranked.remove(value)
+            expected.remove(value)
+        else:
+            ranked.add(value)
+            expected.append(value)
+    expected.sort()
+    assert len(ranked) == len(expected)
+    assert [ranked[i] for i in range(len(ranked))] == expected
+    assert not ranked.remove(1000)
+    with pytest.raises(IndexError):
+        ranked[len(expected)]
+
+def test_weakness_index():
+    stats = [("apple", [1, 3]), ("cat", [0, 2]), ("dog", [5, 0]), ("apply", [1, 1]), ("gone", [0, 9])]
+    index = build(WeaknessIndex(), stats=stats)
+    # 단어장에 없는 단어(gone)는 제외
+    assert index.count() == 4
+    assert index.count("animal") == 2
+    # 하위 50%: cat(0%), apple(25%)
+    rng = random.Random(1)
+    assert {index.draw(rng=rng) for _ in range(50)} == {"cat", "apple"}
+    assert set(index.sample(5, rng=rng)) == {"cat", "apple"}
+    assert index.draw("animal", rng) == "cat"
+    
+    index.set_stats("cat", [9, 0])
+    assert {index.draw(rng=rng) for _ in range(50)} == {"apple", "apply"}
+    index.remove("apple", WORDS["apple"])
+    assert index.count() == 3
+    index.set_stats("dog", None)
+    assert index.count("animal") == 1
+    assert index.draw("verb", rng) == "apply"
+    assert index.draw("fruit", rng) is None
+
+def test_word_pool():
+    index = build(WordPool())
+    rng = random.Random(2)
+    assert index.count() == len(WORDS)
+    assert index.count("animal") == 2
+    assert index.choice("animal", rng) in ("cat", "dog")
+    assert index.choice("없음", rng) is None
+    assert sorted(index.sample(10, rng=rng)) == sorted(WORDS)
+    picked = index.sample(3, exclude={"apple"}, rng=rng)
+    assert len(set(picked)) == 3 and "apple" not in picked
+    
+    index.remove("cat", WORDS["cat"])
+    assert index.sample(5, category="animal", rng=rng) == ["dog"]
+    assert index.count() == len(WORDS) - 1
+
+def test_due_queue():
+    schedules = [("apple", [2, 6, 2.5, 100]), ("cat", [1, 1, 2.5, 300]), ("dog", [1, 1, 2.5, 200])]
+    index = build(DueQueue(), schedules=schedules)
+    rng = random.Random(3)
+    assert index.next_due() == (100, "apple")
+    assert index.next_due("animal") == (200, "dog")
+    # 복습 시각이 지난 단어 -> 처음 보는 단어 -> 곧 복습할 단어
+    assert index.draw(2, 250, rng=rng) == ["apple", "dog"]
+    words = index.draw(6, 150, rng=rng)
+    assert words[0] == "apple"
+    assert set(words[1:4]) == {"pineapple", "apply", "catalog"}
+    assert words[4:] == ["dog", "cat"]
+    # 꺼낸 단어는 일정이 바뀌기 전까지 대기열에 남음
+    assert index.draw(1, 250, rng=rng) == ["apple"]
+    
+    index.set_schedule("apple", [3, 15, 2.5, 1000])
+    assert index.next_due() == (200, "dog")
+    index.remove("dog", WORDS["dog"])
+    assert index.draw(1, 1000, "animal", rng) == ["cat"]
+    index.set_schedule("cat", None)
+    assert index.next_due("animal") is None
+    assert index.draw(1, 0, "animal", rng) == ["cat"]
+
+def make_words(count, seed=0):
+    """서로 다른 가상 단어 (글자 종류가 적어 지운 문자열마다 단어가 많이 모임)"""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice("bdkst") + rng.choice("ae") for _ in range(rng.randint(3, 7))))
+    return sorted(words)
+
+def test_fuzzy_bucket_limit():
+    """한 지운 문자열에 몰린 단어는 조회할 때 먼저 색인된 bucket_limit개만 확인"""
+    words = ["x" + ch for ch in "abcdefghijklmnopqrstuvwxyz"]  # 모두 "x"로 색인됨
+    index = FuzzyIndex(max_distance=1, bucket_limit=10)
+    index.rebuild(((word, None) for word in words), ())
+    assert index.lookup("x", limit=50) == [(word, 1) for word in words[:10]]
+    for word in words[:5]:
+        index.remove(word, None)
+    assert index.lookup("x", limit=50) == [(word, 1) for word in words[5:15]]
+    index.add("xa", None)  # 나중에 추가된 단어는 뒤로 감
+    assert ("xa", 1) not in index.lookup("x", limit=50)
+    assert index.lookup("xa")[0] == ("xa", 0)
+    
+    index.bucket_limit = 100
+    assert len(index.lookup("x", limit=50)) == len(words) - 4
+
+def best_time(run, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def test_fuzzy_build_and_lookup_scale_linearly():
+    """단어 수가 4배가 되면 색인/조회 시간도 4배 정도까지만 늘어남 (버킷에서 단어를 선형 탐색하면 제곱으로 늘어남)"""
+    small, large = make_words(3000), make_words(12000)
+    queries = [word[:-1] + "x" for word in make_words(20, seed=1)]
+    
+    def build(words):
+        index = FuzzyIndex()
+        index.rebuild(((word, None) for word in words), ())
+        return index
+    
+    build_ratio = best_time(lambda: build(large)) / best_time(lambda: build(small))
+    small_index, large_index = build(small), build(large)
+    lookup_ratio = (best_time(lambda: [large_index.lookup(query) for query in queries])
+                    / best_time(lambda: [small_index.lookup(query) for query in queries]))
+    assert build_ratio < 6, build_ratio
+    assert lookup_ratio < 6, lookup_ratio
+    
+    # 하나씩 추가/삭제해도 전체 색인과 같은 결과
+    index = FuzzyIndex()
+    for word in small:
+        index.add(word, None)
+    for word in small[::2]:
+        index.remove(word, None)
+    expected = build(small[1::2])
+    assert all(index.lookup(query) == expected.lookup(query) for query in queries)
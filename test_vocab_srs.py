@@ -0,0 +1,48 @@
+"""
+복습 일정(SM-2) 테스트
+"""
+
+from vocab_srs import next_schedule, MAX_INTERVAL_DAYS, DAY_SECONDS, RELEARN_SECONDS, DEFAULT_EASE
+from vocab_store import SqliteVocabStore
+
+SQLITE_INTEGER_MAX = 2 ** 63 - 1
+
+def test_first_intervals():
+    schedule = next_schedule(None, True, 1000)
+    assert schedule == [1, 1, DEFAULT_EASE, 1000 + DAY_SECONDS]
+    schedule = next_schedule(schedule, True, 2000)
+    assert schedule[:2] == [2, 6]
+    assert schedule[3] == 2000 + 6 * DAY_SECONDS
+
+def test_wrong_answer_resets():
+    schedule = next_schedule([5, 40, 2.5, 0], False, 1000)
+    assert schedule[0] == 0 and schedule[1] == 0
+    assert schedule[2] < 2.5
+    assert schedule[3] == 1000 + RELEARN_SECONDS
+
+def test_interval_is_capped():
+    """계속 맞춰도 간격은 상한을 넘지 않고 다음 복습 시각이 INTEGER 범위 안에 있음"""
+    schedule = None
+    now = 1_700_000_000
+    for _ in range(100):
+        schedule = next_schedule(schedule, True, now)
+        assert 1 <= schedule[1] <= MAX_INTERVAL_DAYS
+        assert schedule[3] <= SQLITE_INTEGER_MAX
+    assert schedule[0] == 100
+    assert schedule[1] == MAX_INTERVAL_DAYS
+
+def test_sqlite_record_many_correct(tmp_path):
+    """SQLite 저장소에 정답을 계속 기록해도 실패하지 않음"""
+    store = SqliteVocabStore(str(tmp_path / "vocabulary.db"))
+    store.load()
+    try:
+        with store.transaction():
+            store.add_word("apple", "사과", "")
+        for _ in range(100):
+            with store.transaction() as txn:
+                store.record_result("apple", True)
+            assert txn.ok
+        assert store.get_stats("apple") == [100, 0]
+        assert store.get_schedule("apple")[1] == MAX_INTERVAL_DAYS
+    finally:
+        store.close()
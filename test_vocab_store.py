@@ -0,0 +1,621 @@
+"""
+저장소 테스트 (JSON 저널/스냅샷, deferred 저장, SQLite 변경 로그와 버전 확인)
+"""
+
+import json
+import random
+import os
+import time
+
+import pytest
+
+import web_vocab_app
+from vocab_sql_index import rebuild_draw_slots, rebuild_search_rows
+from vocab_store import JsonVocabStore, SqliteVocabStore, WordRecord, json_default
+
+def make_json_store(directory, **options) -> JsonVocabStore:
+    """임시 폴더의 JSON 저장소 (불러온 상태)"""
+    store = JsonVocabStore(os.path.join(directory, "vocabulary.json"), os.path.join(directory, "quiz_stats.json"),
+                           os.path.join(directory, "quiz_stats.journal"), **options)
+    store.load()
+    return store
+
+def journal_lines(directory) -> int:
+    """저널 레코드 수 (세대 머리글 제외)"""
+    path = os.path.join(directory, "quiz_stats.journal")
+    if not os.path.exists(path):
+        return 0
+    with open(path, "rb") as f:
+        return sum(1 for line in f if not line.startswith(b'{"op": "gen"'))
+
+def store_state(store) -> tuple:
+    """단어장, 통계, 복습 일정 전체"""
+    return (dict((word, data.to_dict()) for word, data in store.iter_words()), dict(store.iter_stats()),
+            dict(store.iter_schedules()))
+
+def apply_changes(store) -> None:
+    """추가/수정/이름 변경/삭제/퀴즈 결과를 섞은 변경"""
+    with store.transaction():
+        store.add_word("apple", "사과", "fruit")
+        store.add_word("cat", "고양이", "animal")
+        store.add_word("dog", "개", "animal")
+    store.record_result("apple", True, now=1000)
+    store.record_result("cat", False, now=2000)
+    store.update_word("cat", "kitten", "새끼 고양이", "animal")
+    store.update_word("apple", "apple", "사과나무", "fruit")
+    store.delete_word("dog")
+    store.record_result("kitten", True, now=3000)
+
+def test_journal_replay(tmp_path):
+    """스냅샷 없이 저널만 남은 변경을 다시 불러오면 같은 상태가 됨"""
+    store = make_json_store(tmp_path, compact_threshold=1000)
+    apply_changes(store)
+    expected = store_state(store)
+    store.close()
+    assert not os.path.exists(tmp_path / "vocabulary.json")
+    assert journal_lines(tmp_path) == 9
+    
+    reader = make_json_store(tmp_path)
+    assert store_state(reader) == expected
+    assert reader.get_word("kitten").korean == "새끼 고양이"
+    assert reader.get_stats("kitten") == [1, 1]
+    assert "dog" not in reader and reader.get_stats("dog") is None
+    reader.close()
+
+def test_journal_replay_skips_damaged_records(tmp_path):
+    """깨진 줄은 건너뛰고, 아직 다 쓰이지 않은 마지막 줄은 완성된 뒤에 읽음"""
+    store = make_json_store(tmp_path)
+    with store.transaction():
+        store.add_word("apple", "사과", "")
+    store.close()
+    record = json.dumps({"op": "put", "w": "cat", "k": "고양이", "cat": ""}, ensure_ascii=False).encode("utf-8")
+    with open(tmp_path / "quiz_stats.journal", "ab") as f:
+        f.write(b"{not json\n" + record[:10])
+    
+    reader = make_json_store(tmp_path)
+    assert "apple" in reader and "cat" not in reader
+    with open(tmp_path / "quiz_stats.journal", "ab") as f:
+        f.write(record[10:] + b"\n")
+    assert reader.refresh() is True
+    assert reader.get_word("cat").korean == "고양이"
+    reader.close()
+
+def test_journal_compaction(tmp_path):
+    """저널 레코드가 compact_threshold개가 되면 스냅샷에 합치고 저널을 비움"""
+    store = make_json_store(tmp_path, compact_threshold=4)
+    apply_changes(store)
+    expected = store_state(store)
+    # 9개 기록 중 8개는 두 번의 압축으로 스냅샷에 들어가고 1개만 저널에 남음
+    assert journal_lines(tmp_path) == 1
+    assert store.journal_record_count == 1
+    with open(tmp_path / "vocabulary.json", encoding="utf-8") as f:
+        assert "kitten" in json.load(f)
+    store.close()
+    
+    reader = make_json_store(tmp_path)
+    assert store_state(reader) == expected
+    assert reader.save() is True
+    assert journal_lines(tmp_path) == 0
+    reader.close()
+    assert store_state(make_json_store(tmp_path)) == expected
+
+@pytest.mark.parametrize("stats", [{"apple": "3:0"}, {"apple": [-1, 0]}, [["apple", 3, 0]]])
+def test_malformed_stats_file(tmp_path, stats):
+    """항목 형식이 잘못된 통계 파일은 불러오기를 멈추지 않고 빈 통계로 복구"""
+    with open(tmp_path / "vocabulary.json", "w", encoding="utf-8") as f:
+        json.dump({"apple": {"korean": "사과", "category": "fruit"}}, f)
+    with open(tmp_path / "quiz_stats.json", "w", encoding="utf-8") as f:
+        json.dump(stats, f)
+    store = make_json_store(tmp_path)
+    assert "apple" in store and store.stats_count() == 0
+    assert store.record_result("apple", True) == [1, 0]
+    store.close()
+
+def count_reloads(store, monkeypatch) -> list:
+    """store가 전체를 다시 불러온 횟수를 세는 목록"""
+    reloads = []
+    real_reload = store._reload
+    
+    def counting_reload():
+        reloads.append(1)
+        real_reload()
+    
+    monkeypatch.setattr(store, "_reload", counting_reload)
+    return reloads
+
+def test_other_worker_compaction_without_reload(tmp_path, monkeypatch):
+    """다른 워커가 압축하면 열어 둔 이전 저널을 마저 읽고 다시 불러오지 않고 새 저널로 넘어감"""
+    writer = make_json_store(tmp_path, compact_threshold=3)
+    reader = make_json_store(tmp_path)
+    reloads = count_reloads(reader, monkeypatch)
+    with writer.transaction():
+        writer.add_word("apple", "사과", "fruit")
+    writer.record_result("apple", True, now=1000)
+    assert reader.refresh() is True
+    for i in range(7):
+        # 압축 전 저널의 읽지 않은 기록과 압축 뒤 새 저널에 쌓인 기록을 이어서 읽음
+        writer.record_result("apple", i % 2 == 0, now=5000 + i)
+        assert reader.refresh() is True
+        assert store_state(reader) == store_state(writer)
+    assert reloads == []
+    assert reader.get_stats("apple") == [5, 3]
+    
+    # 그 사이 두 번 압축되어 이전 저널을 읽을 수 없으면 다시 불러옴
+    for i in range(6):
+        writer.record_result("apple", True, now=9000 + i)
+    assert reader.refresh() is True
+    assert reloads == [1]
+    assert store_state(reader) == store_state(writer)
+    writer.close()
+    reader.close()
+
+def test_snapshot_without_journal_forces_reload(tmp_path, monkeypatch):
+    """저널 없이 쓴 스냅샷(use_journal=False)에는 저널에 없는 변경이 있으므로 다시 불러옴"""
+    writer = make_json_store(tmp_path, use_journal=False)
+    with writer.transaction():
+        writer.add_word("apple", "사과", "fruit")
+    reader = make_json_store(tmp_path)
+    reloads = count_reloads(reader, monkeypatch)
+    with writer.transaction():
+        writer.add_word("cat", "고양이", "animal")
+    assert reader.refresh() is True
+    assert reloads == [1] and "cat" in reader
+    writer.close()
+    reader.close()
+
+class Crash(BaseException):
+    """프로세스가 갑자기 죽은 것처럼 저장을 중단 (except Exception에 잡히지 않음)"""
+
+@pytest.mark.parametrize("crash_at", ["quiz_stats.journal", "vocabulary.json", "quiz_stats.json"])
+def test_snapshot_crash_window(tmp_path, monkeypatch, crash_at):
+    """스냅샷 저장이 저널 교체 전/후, 파일을 옮기는 도중에 중단되어도 저널이 두 번 재생되지 않음"""
+    store = make_json_store(tmp_path)
+    assert store.save() is True  # 스냅샷이 이미 있는 상태에서 시작
+    with store.transaction():
+        store.add_word("apple", "사과", "fruit")
+    for i in range(3):
+        store.record_result("apple", True, now=1000 * (i + 1))
+    expected = store_state(store)
+    other = make_json_store(tmp_path)  # 이미 불러 둔 다른 워커
+    
+    real_replace = os.replace
+    target = str(tmp_path / crash_at)
+    
+    def crashing_replace(src, dst):
+        if str(dst) == target:
+            raise Crash()
+        real_replace(src, dst)
+    
+    monkeypatch.setattr(os, "replace", crashing_replace)
+    with pytest.raises(Crash):
+        store.save()
+    monkeypatch.undo()
+    store.close()
+    
+    reader = make_json_store(tmp_path)
+    assert store_state(reader) == expected
+    assert reader.get_stats("apple") == [3, 0]
+    assert reader.get_schedule("apple")[0] == 3
+    other.refresh()
+    assert store_state(other) == expected
+    with reader.transaction():
+        reader.record_result("apple", False, now=4000)
+    assert reader.save() is True
+    reader.close()
+    assert make_json_store(tmp_path).get_stats("apple") == [3, 1]
+    if crash_at != "quiz_stats.journal":
+        # 저널 교체 후에 중단된 스냅샷은 다음에 불러올 때 제자리로 옮겨짐
+        assert not [name for name in os.listdir(tmp_path) if ".gen" in name]
+    other.close()
+
+def test_deferred_flush_after_interval(tmp_path):
+    """deferred 모드: max_mutations보다 적은 변경도 주기가 지나면 매번 기록됨"""
+    store = make_json_store(tmp_path, persist_mode='deferred', flush_interval_ms=100, flush_max_mutations=500)
+    try:
+        for i in range(4):
+            with store.transaction():
+                store.add_word(f"word{i}", f"뜻{i}", "")
+            time.sleep(0.4)
+            # 첫 저장 이후의 변경도 주기 안에 기록되어야 함
+            assert journal_lines(tmp_path) == i + 1
+            reader = make_json_store(tmp_path)
+            assert f"word{i}" in reader
+            reader.close()
+    finally:
+        store.close()
+
+def test_deferred_failed_flush_keeps_ops(tmp_path, monkeypatch):
+    """deferred 모드: 저널 기록이 실패하면 변경을 버리지 않고 다음 저장 때 다시 기록함"""
+    store = make_json_store(tmp_path, persist_mode='deferred', flush_interval_ms=60000)
+    real_write = os.write
+    
+    def partial_write(fd, data):
+        # 앞부분만 쓰고 디스크 오류
+        real_write(fd, data[:len(data) // 2])
+        raise OSError(28, "No space left on device")
+    
+    try:
+        with store.transaction():
+            store.add_word("seed", "씨앗", "")
+        assert store.flusher.flush()
+        with store.transaction():
+            store.add_word("apple", "사과", "fruit")
+            store.record_result("seed", True)
+        monkeypatch.setattr(os, "write", partial_write)
+        assert not store.flusher.flush()
+        monkeypatch.undo()
+        assert [op["w"] for op in store.flusher.pending_ops()] == ["apple", "seed"]
+        assert journal_lines(tmp_path) == 1  # 일부만 쓰인 줄은 잘라 냄
+        assert "apple" in store
+        
+        with store.transaction():
+            store.add_word("banana", "바나나", "fruit")
+        assert store.flusher.flush()
+        assert store.flusher.pending_ops() == []
+    finally:
+        store.close()
+    reader = make_json_store(tmp_path)
+    assert list(reader.list_words()) == ["seed", "apple", "banana"]
+    assert reader.get_stats("seed") == [1, 0]
+    reader.close()
+
+def test_deferred_flusher_survives_error(tmp_path, monkeypatch):
+    """deferred 모드: 저장 중 예외가 나도 저장 스레드가 살아 있어 다시 시도하고 대기도 풀림"""
+    store = make_json_store(tmp_path, persist_mode='deferred', flush_interval_ms=50)
+    real_persist = store._persist_ops
+    failures = []
+    
+    def failing_persist(ops):
+        if not failures:
+            failures.append(ops)
+            raise RuntimeError("디스크 오류")
+        return real_persist(ops)
+    
+    monkeypatch.setattr(store, "_persist_ops", failing_persist)
+    try:
+        with store.transaction(durable=True) as txn:
+            store.add_word("apple", "사과", "fruit")
+        assert not txn.ok  # 실패를 알리고 기다리지 않음
+        assert failures and store.flusher._thread.is_alive()
+        deadline = time.time() + 2
+        while store.flusher.pending_ops() and time.time() < deadline:
+            time.sleep(0.01)
+        assert store.flusher.pending_ops() == []
+        
+        with store.transaction(durable=True) as txn:
+            store.add_word("banana", "바나나", "fruit")
+        assert txn.ok
+        reader = make_json_store(tmp_path)
+        assert list(reader.list_words()) == ["apple", "banana"]
+        reader.close()
+    finally:
+        store.close()
+
+WRITER_SCRIPT = """
+import os, sys, time
+sys.path.insert(0, {repo!r})
+import web_vocab_app
+from vocab_store import JsonVocabStore, SqliteVocabStore
+directory = {directory!r}
+store = JsonVocabStore(os.path.join(directory, "vocabulary.json"), os.path.join(directory, "quiz_stats.json"),
+                       os.path.join(directory, "quiz_stats.journal"), persist_mode="deferred",
+                       flush_interval_ms={interval_ms}, flush_max_mutations=500)
+store.load()
+for i in range({count}):
+    with store.transaction():
+        store.add_word(f"word{{i}}", f"뜻{{i}}", "")
+        store.record_result("seed", True)
+    print(time.time(), flush=True)
+    time.sleep({spacing})
+os._exit(0)  # 종료 시 저장(close)에 기대지 않음
+"""
+
+def test_deferred_write_visible_in_other_process(tmp_path):
+    """deferred 모드: 한 프로세스의 변경이 interval + ε 안에 다른 프로세스의 refresh()에 보임"""
+    import subprocess
+    import sys
+    
+    interval_ms, count, spacing = 100, 4, 0.5
+    seed_store = make_json_store(tmp_path)
+    with seed_store.transaction():
+        seed_store.add_word("seed", "씨앗", "")
+    seed_store.close()
+    
+    reader = make_json_store(tmp_path)
+    script = WRITER_SCRIPT.format(repo=os.path.dirname(os.path.abspath(__file__)), directory=str(tmp_path),
+                                  interval_ms=interval_ms, count=count, spacing=spacing)
+    writer = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True)
+    try:
+        for i in range(count):
+            written_at = float(writer.stdout.readline())
+            deadline = written_at + interval_ms / 1000 + 0.3
+            while f"word{i}" not in reader and time.time() < deadline:
+                time.sleep(0.01)
+                reader.refresh()
+            assert f"word{i}" in reader, f"word{i}가 {interval_ms}ms + ε 안에 보이지 않음"
+            assert reader.get_stats("seed")[0] == i + 1
+    finally:
+        writer.wait(timeout=10)
+        reader.close()
+
+def make_sqlite_store(directory, monkeypatch) -> SqliteVocabStore:
+    """앱과 같은 인덱스를 등록한 SQLite 저장소 (같은 폴더로 여러 번 만들면 워커 여럿처럼 씀)"""
+    monkeypatch.setattr(web_vocab_app, "STORAGE_BACKEND", "sqlite")
+    store = web_vocab_app.create_store(str(directory))
+    store.load()
+    return store
+
+def count_rebuilds(store) -> list:
+    """인덱스를 모두 만든 뒤부터 처음부터 다시 만든 기록 (인덱스 이름 목록)"""
+    store.ensure_indexes()
+    calls = []
+    for name, index in store.indexes.items():
+        def rebuild(*args, original=index.rebuild, name=name):
+            calls.append(name)
+            return original(*args)
+        index.rebuild = rebuild
+    return calls
+
+def index_state(store) -> dict:
+    """비교할 수 있는 형태로 모은 메모리 인덱스 내용 (SQL 인덱스는 데이터베이스를 바로 읽으므로 제외)"""
+    with store.lock:
+        store.ensure_indexes()
+        indexes = store.indexes
+        return {
+            "fuzzy": {key: sorted(value) if isinstance(value, list) else [value]
+                      for key, value in indexes["fuzzy"].deletes.items()},
+        }
+
+def test_sqlite_refresh_applies_changes_without_rebuild(tmp_path, monkeypatch):
+    """다른 워커의 변경은 바뀐 단어만 인덱스에 반영하고 처음부터 다시 만들지 않음"""
+    writer = make_sqlite_store(tmp_path, monkeypatch)
+    reader = make_sqlite_store(tmp_path, monkeypatch)
+    rebuilds = count_rebuilds(reader)
+    try:
+        with writer.transaction():
+            writer.add_word("apple", "사과", "fruit")
+            writer.add_word("cat", "고양이", "animal")
+            writer.add_word("dog", "개", "animal")
+        assert reader.refresh() is True
+        assert reader.get_index("search").search("사과") == ["apple"]
+        
+        with writer.transaction():
+            writer.record_result("apple", True)
+            writer.record_result("apple", False)
+            writer.record_result("cat", False)
+        with writer.transaction():
+            writer.update_word("cat", "kitten", "새끼 고양이", "pet")
+            writer.update_word("apple", "apple", "사과나무", "fruit")
+        with writer.transaction():
+            writer.delete_word("dog")
+            writer.add_word("banana", "바나나", "fruit")
+        assert reader.refresh() is True
+        assert reader.refresh() is False
+        
+        fresh = make_sqlite_store(tmp_path, monkeypatch)
+        assert index_state(reader) == index_state(fresh)
+        fresh.close()
+        assert rebuilds == []
+        assert reader.get_index("search").search("고양이") == ["kitten"]
+        assert reader.get_index("prefix").complete("d") == []
+    finally:
+        writer.close()
+        reader.close()
+
+def test_sqlite_own_writes_keep_indexes(tmp_path, monkeypatch):
+    """이 저장소가 커밋한 변경은 인덱스를 무효화하지 않고 refresh()도 변경 없음으로 봄"""
+    store = make_sqlite_store(tmp_path, monkeypatch)
+    rebuilds = count_rebuilds(store)
+    try:
+        for i in range(5):
+            with store.transaction():
+                store.add_word(f"word{i}", f"뜻{i}", "")
+                store.record_result(f"word{i}", i % 2 == 0)
+            assert store.refresh() is False
+        assert store.get_index("prefix").complete("word") == [f"word{i}" for i in range(5)]
+        assert rebuilds == []
+    finally:
+        store.close()
+
+def test_sqlite_refresh_rebuilds_after_log_is_pruned(tmp_path, monkeypatch):
+    """변경 로그가 지워질 만큼 뒤처진 워커는 인덱스를 다시 만듦"""
+    monkeypatch.setattr(SqliteVocabStore, "CHANGE_LOG_KEEP", 2)
+    writer = make_sqlite_store(tmp_path, monkeypatch)
+    reader = make_sqlite_store(tmp_path, monkeypatch)
+    rebuilds = count_rebuilds(reader)
+    try:
+        for i in range(5):
+            with writer.transaction():
+                writer.add_word(f"word{i}", f"뜻{i}", "")
+        assert reader.refresh() is True
+        assert reader.get_index("prefix").complete("word") == [f"word{i}" for i in range(5)]
+        assert rebuilds
+    finally:
+        writer.close()
+        reader.close()
+
+def test_sqlite_load_builds_no_memory_index(tmp_path, monkeypatch):
+    """SQLite 저장소는 불러올 때 단어를 메모리 인덱스에 옮기지 않고, 처음 쓰는 인덱스만 만듦"""
+    store = make_sqlite_store(tmp_path, monkeypatch)
+    with store.transaction():
+        store.add_word("apple", "사과", "fruit")
+    store.close()
+    
+    store = make_sqlite_store(tmp_path, monkeypatch)
+    rebuilds = []
+    for name, index in store.indexes.items():
+        index.rebuild = lambda *args, name=name: rebuilds.append(name)
+    try:
+        assert store.get_index("prefix").complete("a") == ["apple"]
+        assert store.get_index("pool").count("fruit") == 1
+        assert rebuilds == ["prefix", "pool"]  # SQL 인덱스는 다시 만들 것이 없음
+        store.get_index("fuzzy")
+        assert rebuilds == ["prefix", "pool", "fuzzy"]
+    finally:
+        store.close()
+
+WORDS = [("apple", "사과", "fruit"), ("apricot", "살구", "fruit"), ("banana", "바나나", "fruit"),
+         ("cat", "고양이", "animal"), ("cow", "소", "animal"), ("dog", "개", "animal"),
+         ("egg", "달걀", ""), ("eel", "장어", "animal")]
+# (단어, 정답 여부) 순서대로 기록 (1000초 간격)
+RESULTS = [("apple", True), ("apple", False), ("cat", False), ("cat", False), ("dog", True),
+           ("banana", False), ("banana", True), ("banana", True), ("cow", True), ("cow", False)]
+
+def make_filled_store(directory, backend, monkeypatch):
+    monkeypatch.setattr(web_vocab_app, "STORAGE_BACKEND", backend)
+    directory.mkdir()
+    store = web_vocab_app.create_store(str(directory))
+    store.load()
+    with store.transaction():
+        for english, korean, category in WORDS:
+            store.add_word(english, korean, category)
+        for i, (word, is_correct) in enumerate(RESULTS):
+            store.record_result(word, is_correct, now=1_000_000 + 1000 * i)
+    return store
+
+def test_sql_indexes_match_memory_indexes(tmp_path, monkeypatch):
+    """SQL 인덱스는 같은 데이터의 메모리 인덱스와 같은 결과를 돌려줌"""
+    memory = make_filled_store(tmp_path / "json", "json", monkeypatch)
+    sql = make_filled_store(tmp_path / "sqlite", "sqlite", monkeypatch)
+    try:
+        def both(name, call):
+            with memory.lock, sql.lock:
+                return call(memory.get_index(name)), call(sql.get_index(name))
+        
+        def same(name, call):
+            expected, actual = both(name, call)
+            assert actual == expected, name
+        
+        same("prefix", lambda index: list(index.iter_from()))
+        same("prefix", lambda index: list(index.iter_from("banana")))
+        same("prefix", lambda index: index.complete("a"))
+        same("prefix", lambda index: index.complete("", 3, accept=lambda word: word != "apple"))
+        same("category", lambda index: list(index.iter_from("animal", "cow")))
+        same("category", lambda index: index.words("fruit"))
+        same("category", lambda index: [index.count(category) for category in ("fruit", "animal", "", "x")])
+        same("category", lambda index: index.categories())
+        same("pool", lambda index: [index.count(category) for category in (None, "fruit", "animal", "x")])
+        same("weakness", lambda index: [index.count(category) for category in (None, "fruit", "animal")])
+        for seed in range(20):
+            for category in (None, "fruit", "animal"):
+                same("weakness", lambda index: index.draw(category, random.Random(seed)))
+        same("due", lambda index: index.next_due())
+        same("due", lambda index: index.next_due("fruit"))
+        # 처음 보는 단어가 없는 카테고리의 복습 순서는 정해져 있음
+        same("due", lambda index: index.draw(3, 1_004_000, "fruit", random.Random(1)))
+        same("due", lambda index: index.draw(10, 0, "fruit", random.Random(1)))
+        for query in ("a", "an", "apple", "P", "사", "고양", "x", "ca t"):
+            same("search", lambda index: index.search(query))
+            same("search", lambda index: index.search(query, 2, accept=lambda word: word != "apple"))
+        for query in ("ㄱ", "ㄱㅇ", "ㄱㅇㅇ", "ㅂ"):
+            same("choseong", lambda index: index.search(query))
+        
+        unscheduled = {"apricot", "egg", "eel"}
+        for seed in range(20):
+            words = sql.get_index("pool").sample(3, exclude={"apple"}, rng=random.Random(seed))
+            assert len(set(words)) == 3 and "apple" not in words
+            assert sql.get_index("pool").choice("animal", random.Random(seed)) in {"cat", "cow", "dog", "eel"}
+            weak = set(sql.get_index("weakness").sample(2, rng=random.Random(seed)))
+            assert len(weak) == 2 and weak <= {"cat", "apple"}
+            drawn = sql.get_index("due").draw(6, 0, rng=random.Random(seed))
+            assert set(drawn[:3]) == unscheduled and len(set(drawn)) == 6
+    finally:
+        memory.close()
+        sql.close()
+
+def search_row_state(store) -> tuple:
+    conn = store._conn()
+    return tuple(sorted(conn.execute(f"SELECT * FROM {table}"))
+                 for table in ("search_grams", "search_gram_counts", "search_initials"))
+
+def draw_slot_state(store) -> tuple:
+    """추출 집합별 단어 집합과 크기 (위치는 빈틈없이 0부터 채워져 있어야 함)"""
+    conn = store._conn()
+    members = {}
+    for kind, category, bucket, slot, word in conn.execute("SELECT * FROM draw_slots"):
+        members.setdefault((kind, category, bucket), {})[slot] = word
+    sizes = {(kind, category, bucket): size for kind, category, bucket, size in conn.execute("SELECT * FROM draw_counts")}
+    assert {group: len(slots) for group, slots in members.items()} == sizes
+    assert all(sorted(slots) == list(range(len(slots))) for slots in members.values())
+    return {group: set(slots.values()) for group, slots in members.items()}, sizes
+
+def test_sql_draw_slots_follow_writes(tmp_path, monkeypatch):
+    """쓰기마다 맞춘 추출 위치/검색 조각은 처음부터 다시 만든 것과 같고, 뽑을 때 COUNT/OFFSET 조회를 쓰지 않음"""
+    store = make_filled_store(tmp_path / "data", "sqlite", monkeypatch)
+    rng = random.Random(5)
+    try:
+        with store.transaction():
+            for i in range(200):
+                word = rng.choice([english for english, _, _ in WORDS] + ["fig", "gnu"])
+                action = rng.random()
+                if action < 0.3:
+                    store.add_word(word, rng.choice(["뜻", "사과", "고양이"]), rng.choice(["fruit", "animal", ""]))
+                elif action < 0.4:
+                    store.update_word(word, rng.choice([word, word + "s"]), rng.choice(["뜻", "개"]), "animal")
+                elif action < 0.5:
+                    store.delete_word(word)
+                else:
+                    store.record_result(word, rng.random() < 0.5, now=2_000_000 + i)
+        expected = draw_slot_state(store), search_row_state(store)
+        with store.transaction():
+            rebuild_draw_slots(store._conn())
+            rebuild_search_rows(store._conn())
+        assert (draw_slot_state(store), search_row_state(store)) == expected
+        
+        statements = []
+        store._conn().set_trace_callback(statements.append)
+        with store.lock:
+            store.get_index("pool").choice("animal", rng)
+            store.get_index("pool").sample(3, rng=rng)
+            store.get_index("weakness").sample(2, rng=rng)
+            store.get_index("due").draw(3, 0, rng=rng)
+            len(store), store.count_words("fruit")
+        assert statements and not [sql for sql in statements if "COUNT" in sql or "OFFSET" in sql]
+    finally:
+        store.close()
+
+def test_sql_index_tables_migration(tmp_path, monkeypatch):
+    """추출 위치/검색 조각이 없던 데이터베이스는 불러올 때 한 번 채우고 예전 인덱스를 지움"""
+    store = make_filled_store(tmp_path / "data", "sqlite", monkeypatch)
+    expected = draw_slot_state(store), search_row_state(store)
+    store._conn().executescript("""
+        DELETE FROM draw_slots; DELETE FROM draw_counts;
+        DELETE FROM search_grams; DELETE FROM search_gram_counts; DELETE FROM search_initials;
+        UPDATE meta SET value = 0 WHERE key IN ('draw_slots', 'search_rows');
+        CREATE INDEX idx_words_category ON words(category);
+    """)
+    store.close()
+    store = make_sqlite_store(tmp_path / "data", monkeypatch)
+    try:
+        assert (draw_slot_state(store), search_row_state(store)) == expected
+        assert store.get_index("search").search("고양") == ["cat"]
+        assert not store._conn().execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_words_category'").fetchone()
+        assert len(store) == len(WORDS)
+    finally:
+        store.close()
+
+def test_word_record():
+    """WordRecord: __slots__ 객체지만 읽기 전용 dict처럼 읽히고, 카테고리 문자열을 공유함"""
+    record = WordRecord("사과", "".join(["fr", "uit"]))
+    assert record["korean"] == "사과" and record.get("category") == "fruit"
+    assert record.get("missing", "-") == "-"
+    assert dict(record) == record.to_dict() == {"korean": "사과", "category": "fruit"}
+    assert len(record) == 2 and "korean" in record
+    assert record.category is WordRecord("배", "".join(["fru", "it"])).category
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(KeyError):
+        record["english"]
+    assert json.dumps({"apple": record}, default=json_default, ensure_ascii=False) == \
+        '{"apple": {"korean": "사과", "category": "fruit"}}'
+
+def test_store_keeps_word_records(tmp_path, monkeypatch, backend):
+    """저장소는 단어를 WordRecord로 돌려주고, 저장했다 불러와도 같은 내용"""
+    store = make_filled_store(tmp_path / backend, backend, monkeypatch)
+    assert all(isinstance(data, WordRecord) for _, data in store.iter_words())
+    assert isinstance(store.get_word(WORDS[0][0]), WordRecord)
+    expected = {word: data.to_dict() for word, data in store.iter_words()}
+    store.close()
+    reopened = web_vocab_app.create_store(str(tmp_path / backend))
+    reopened.load()
+    assert {word: data.to_dict() for word, data in reopened.iter_words()} == expected
+    reopened.close()
@@ -0,0 +1,367 @@
+"""
+웹 API 테스트 (Flask 테스트 클라이언트)
+
+각 테스트는 임시 폴더의 빈 저장소로 실행됨 (conftest.py의 client 픽스처)
+"""
+
+import gc
+import io
+import json
+import time
+
+import web_vocab_app
+from vocab_decks import DeckCache
+
+def add_words(client, *words) -> None:
+    """(영어, 한국어, 카테고리) 목록을 API로 추가"""
+    for english, korean, category in words:
+        response = client.post('/api/words', json={"english": english, "korean": korean, "category": category})
+        assert response.status_code == 200, response.get_json()
+
+def test_import_raw_body(client):
+    """요청 본문 그대로 보낸 CSV 가져오기"""
+    body = "english,korean,category\napple,사과,fruit\ncat,고양이,animal\n"
+    response = client.post('/api/import?format=csv', data=body.encode('utf-8'), content_type='text/csv')
+    assert response.status_code == 200
+    assert response.get_json()["added"] == 2
+    assert client.get('/api/words/cat').get_json()["korean"] == "고양이"
+
+def test_import_form_urlencoded_body_is_read_raw(client):
+    """application/x-www-form-urlencoded로 보내도 폼으로 해석하지 않고 본문을 읽음"""
+    body = '{"english": "apple", "korean": "사과"}\n'
+    response = client.post('/api/import?format=jsonl', data=body.encode('utf-8'),
+                           content_type='application/x-www-form-urlencoded')
+    assert response.status_code == 200
+    assert response.get_json()["added"] == 1
+
+def test_import_multipart_file(client):
+    """multipart 'file' 필드로 보낸 파일 (형식은 확장자로 추정)"""
+    data = {"file": (io.BytesIO("apple,사과,fruit\n".encode('utf-8')), "words.csv")}
+    response = client.post('/api/import', data=data, content_type='multipart/form-data')
+    assert response.status_code == 200
+    assert response.get_json()["added"] == 1
+
+def test_import_empty_body_is_rejected(client):
+    """파일도 본문도 없으면 400 (0행을 가져오고 성공으로 응답하지 않음)"""
+    for content_type in ('text/csv', 'application/x-www-form-urlencoded'):
+        response = client.post('/api/import?format=csv', data=b"", content_type=content_type)
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+    response = client.post('/api/import?format=csv', data={}, content_type='multipart/form-data')
+    assert response.status_code == 400
+
+def test_import_body_with_read_only_stream(client):
+    """read()만 있는 요청 본문(gunicorn)도 읽을 수 있음"""
+    class ReadOnlyBody:
+        def __init__(self, data: bytes):
+            self.data = io.BytesIO(data)
+        
+        def read(self, size: int = -1) -> bytes:
+            return self.data.read(size)
+    
+    body = "apple,사과,fruit\nbook,책,\n".encode('utf-8')
+    # gunicorn처럼 wsgi.input_terminated를 켜면 request.stream이 wsgi.input 그대로임
+    response = client.post('/api/import?format=csv', content_type='text/csv',
+                           environ_overrides={"wsgi.input": ReadOnlyBody(body), "wsgi.input_terminated": True})
+    assert response.status_code == 200
+    assert response.get_json()["added"] == 2
+
+def test_check_non_string_answer(client):
+    """주관식 답안이 문자열이 아니면 400 (서버 오류가 아님)"""
+    add_words(client, ("apple", "사과", ""))
+    for answer in (42, ["사과"], {"a": 1}, True):
+        response = client.post('/api/quiz/check', json={"word": "apple", "answer": answer, "mode": "text"})
+        assert response.status_code == 400
+        assert response.get_json()["success"] is False
+    response = client.post('/api/quiz/check', json={"word": "apple", "answer": None, "mode": "text"})
+    assert response.status_code == 400
+
+def test_check_batch_non_string_answer(client, store):
+    """일괄 확인: 문자열이 아닌 답안은 해당 결과만 실패하고 나머지는 채점됨"""
+    add_words(client, ("apple", "사과", ""), ("cat", "고양이", ""))
+    answers = [
+        {"word": "apple", "answer": 42},
+        {"word": "cat", "answer": "고양이"},
+        {"word": "apple", "answer": None},
+        {"word": "apple", "answer": ["사과"]},
+        {"word": "apple", "answer": "apple", "type": "korean_to_english"},
+    ]
+    response = client.post('/api/quiz/check/batch', json={"answers": answers})
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [r["success"] for r in data["results"]] == [False, True, False, False, True]
+    assert data["total"] == 2 and data["correct"] == 2
+    # 실패한 답안은 통계에 반영하지 않음
+    assert store.get_stats("apple") == [1, 0]
+    assert store.get_stats("cat") == [1, 0]
+
+def test_check_long_answer_distance_is_bounded(client):
+    """아주 긴 영어 답안도 편집 거리 계산이 단어 길이 근처에서 끝남"""
+    add_words(client, ("apple", "사과", ""))
+    payload = {"word": "apple", "answer": "x" * 1_000_000, "type": "korean_to_english"}
+    started = time.perf_counter()
+    response = client.post('/api/quiz/check', json=payload)
+    assert time.perf_counter() - started < 2
+    data = response.get_json()
+    assert data["is_correct"] is False
+    assert data["distance"] == len("apple") + web_vocab_app.FUZZY_MAX_DISTANCE + 1
+    # 가까운 오답은 실제 거리 그대로
+    response = client.post('/api/quiz/check', json={"word": "apple", "answer": "aple", "type": "korean_to_english"})
+    assert response.get_json()["distance"] == 1
+
+def test_export_holds_deck_while_streaming(client, monkeypatch):
+    """스트리밍 내보내기가 끝날 때까지 덱이 잡혀 있어 다른 덱 요청으로 내보내지지 않음"""
+    decks = DeckCache(web_vocab_app.create_deck_store, max_decks=1)
+    monkeypatch.setattr(web_vocab_app, "decks", decks)
+    monkeypatch.setattr(web_vocab_app, "EXPORT_PAGE_SIZE", 2)
+    for i in range(5):
+        response = client.post('/api/words?deck=a', json={"english": f"word{i}", "korean": f"뜻{i}"})
+        assert response.status_code == 200
+    
+    response = client.get('/api/export?deck=a', buffered=False)
+    chunks = iter(response.response)
+    first = next(chunks)
+    assert decks.entries["a"].pins == 1
+    # 덱이 하나뿐인 캐시에서 다른 덱을 쓰면, 잡혀 있지 않은 덱 a는 내보내짐
+    assert client.get('/api/words?deck=b').status_code == 200
+    assert "a" in decks.entries
+    
+    lines = (first + b"".join(chunks)).decode('utf-8').splitlines()
+    assert [json.loads(line)["english"] for line in lines] == [f"word{i}" for i in range(5)]
+    response.close()
+    assert "a" not in decks.entries or decks.entries["a"].pins == 0
+
+WORDS = [("apple", "사과", "fruit"), ("banana", "바나나", "fruit"), ("cat", "고양이", "animal"),
+         ("dog", "개", "animal"), ("egg", "달걀, \"계란\"", ""), ("fish", "물고기", "animal")]
+
+def test_quiz_batch(client):
+    """문제 여러 개: 같은 단어는 한 번만, 카테고리와 객관식 선택지 반영"""
+    add_words(client, *WORDS)
+    data = client.post('/api/quiz/batch', json={"count": 10}).get_json()
+    assert data["success"] is True
+    words = [question["word"] for question in data["questions"]]
+    assert sorted(words) == sorted(english for english, _, _ in WORDS)
+    
+    data = client.post('/api/quiz/batch', json={"count": 2, "category": "animal", "mode": "multiple"}).get_json()
+    assert len(data["questions"]) == 2
+    for question in data["questions"]:
+        assert question["word"] in ("cat", "dog", "fish")
+        assert len(question["choices"]) == 4
+        assert question["choices"][question["correct_index"]] == question["correct_answer"]
+    
+    for mode in ({"focus_mode": True}, {"review_mode": True}):
+        data = client.post('/api/quiz/batch', json={"count": 3, **mode}).get_json()
+        assert len({question["word"] for question in data["questions"]}) == 3
+
+def test_quiz_batch_errors(client):
+    assert client.post('/api/quiz/batch', json={"count": 3}).status_code == 400  # 빈 단어장
+    add_words(client, *WORDS)
+    assert client.post('/api/quiz/batch', json={"count": "many"}).status_code == 400
+    assert client.post('/api/quiz/batch', json={"category": "없는 카테고리"}).status_code == 400
+    data = client.post('/api/quiz/batch', json={"count": 1000}).get_json()
+    assert len(data["questions"]) == len(WORDS)
+
+def test_check_batch(client, store):
+    """답안 여러 개: 채점 결과와 통계를 한 번에 반영하고, 잘못된 답안은 해당 결과만 실패"""
+    add_words(client, *WORDS)
+    answers = [
+        {"word": "apple", "answer": "사과"},
+        {"word": "banana", "answer": "딸기"},
+        {"word": "cat", "answer": "cat", "type": "korean_to_english"},
+        {"word": "dog", "answer": 2, "mode": "multiple", "correct_index": 2},
+        {"word": "missing", "answer": "없음"},
+        "not an answer",
+        {"word": "apple", "answer": 1, "mode": "multiple"},
+    ]
+    data = client.post('/api/quiz/check/batch', json={"answers": answers}).get_json()
+    assert data["success"] is True
+    assert [r["success"] for r in data["results"]] == [True, True, True, True, False, False, False]
+    assert [r.get("is_correct") for r in data["results"][:4]] == [True, False, True, True]
+    assert data["correct"] == 3 and data["total"] == 4
+    assert data["results"][2]["distance"] == 0
+    assert store.get_stats("apple") == [1, 0]
+    assert store.get_stats("banana") == [0, 1]
+    assert store.get_schedule("banana") is not None
+
+def test_check_batch_errors(client):
+    add_words(client, *WORDS)
+    assert client.post('/api/quiz/check/batch', json={"answers": []}).status_code == 400
+    assert client.post('/api/quiz/check/batch', json={"answers": "apple"}).status_code == 400
+    too_many = [{"word": "apple", "answer": "사과"}] * (web_vocab_app.QUIZ_CHECK_BATCH_MAX_ANSWERS + 1)
+    assert client.post('/api/quiz/check/batch', json={"answers": too_many}).status_code == 400
+
+def test_export_import_round_trip(client, monkeypatch):
+    """내보낸 CSV/NDJSON을 빈 덱에 다시 가져오면 같은 단어장이 됨"""
+    monkeypatch.setattr(web_vocab_app, "decks", DeckCache(web_vocab_app.create_deck_store))
+    add_words(client, *WORDS)
+    client.post('/api/quiz/check', json={"word": "apple", "answer": "사과"})
+    
+    def exported(fmt, deck=None):
+        query = f"&deck={deck}" if deck else ""
+        response = client.get(f'/api/export?format={fmt}{query}')
+        assert response.status_code == 200
+        return response.get_data()
+    
+    for fmt, import_fmt in (("csv", "csv"), ("ndjson", "jsonl")):
+        body = exported(fmt)
+        response = client.post(f'/api/import?format={import_fmt}&deck={fmt}', data=body,
+                               content_type='application/octet-stream')
+        assert response.get_json()["added"] == len(WORDS)
+        copied = exported("ndjson", deck=fmt)
+        rows = [json.loads(line) for line in copied.decode('utf-8').splitlines()]
+        original = [json.loads(line) for line in exported("ndjson").decode('utf-8').splitlines()]
+        fields = ("english", "korean", "category")
+        assert [[row[f] for f in fields] for row in rows] == [[row[f] for f in fields] for row in original]
+        # 통계는 내보내기에만 담기고 가져오지 않음
+        assert original[0]["correct"] == 1 and rows[0]["correct"] == 0
+    
+    csv_body = exported("csv").decode('utf-8')
+    assert csv_body.startswith("﻿english,korean,category,correct,wrong")
+    assert '"달걀, ""계란"""' in csv_body
+
+def test_readyz_and_create_app(client, store, monkeypatch):
+    """준비 전에는 /readyz가 503, create_app()이 데이터를 불러온 뒤에는 200"""
+    assert client.get('/healthz').get_json() == {"status": "ok"}
+    monkeypatch.setattr(web_vocab_app, "data_ready", False)
+    assert client.get('/readyz').status_code == 503
+    
+    add_words(client, ("apple", "사과", "fruit"))
+    try:
+        assert web_vocab_app.create_app() is web_vocab_app.app
+    finally:
+        gc.unfreeze()
+    assert web_vocab_app.data_ready is True
+    data = client.get('/readyz').get_json()
+    assert data["ready"] is True and data["word_count"] == 1
+    assert data["load_seconds"] >= 0
+    assert "entries" in data["response_cache"]
+
+def test_search_route(client):
+    """영어/한국어 부분 검색: 일치 정도 순서, 카테고리 필터, limit"""
+    add_words(client, *WORDS, ("pineapple", "파인애플", "fruit"), ("catfish", "메기", "animal"))
+    words = [row["english"] for row in client.get('/api/search?q=apple').get_json()]
+    assert words == ["apple", "pineapple"]
+    assert [row["english"] for row in client.get('/api/search?q=고양').get_json()] == ["cat"]
+    rows = client.get('/api/search?q=cat&category=animal&limit=1').get_json()
+    assert rows == [{"english": "cat", "korean": "고양이", "category": "animal"}]
+    assert client.get('/api/search?q=fish&category=fruit').get_json() == []
+    assert client.get('/api/search?q=').get_json() == []
+    assert client.get('/api/search?q=cat&limit=x').status_code == 400
+    
+    client.delete('/api/words/cat')
+    assert [row["english"] for row in client.get('/api/search?q=cat').get_json()] == ["catfish"]
+
+def test_search_route_choseong(client):
+    """초성으로만 된 검색어는 한국어 뜻의 초성으로 검색"""
+    add_words(client, *WORDS, ("sand", "모래", ""))
+    assert [row["english"] for row in client.get('/api/search?q=ㄱㅇㅇ').get_json()] == ["cat"]
+    assert [row["english"] for row in client.get('/api/search?q=ㅁ').get_json()] == ["fish", "sand"]
+    assert client.get('/api/search?q=ㅁ&category=animal').get_json()[0]["english"] == "fish"
+
+def test_suggest_route(client):
+    """영어 단어 자동 완성: 사전 순, limit, 수정/삭제 반영"""
+    add_words(client, *WORDS, ("apply", "신청하다", "verb"), ("application", "지원서", ""))
+    rows = client.get('/api/words/suggest?prefix=App').get_json()
+    assert [row["english"] for row in rows] == ["apple", "application", "apply"]
+    assert rows[0] == {"english": "apple", "korean": "사과", "category": "fruit"}
+    assert len(client.get('/api/words/suggest?prefix=a&limit=2').get_json()) == 2
+    assert client.get('/api/words/suggest?prefix=zz').get_json() == []
+    assert client.get('/api/words/suggest?prefix=').get_json() == []
+    assert client.get('/api/words/suggest?prefix=a&limit=x').status_code == 400
+    
+    client.delete('/api/words/apply')
+    client.put('/api/words/application', json={"english": "appendix", "korean": "부록", "category": ""})
+    assert [row["english"] for row in client.get('/api/words/suggest?prefix=app').get_json()] == ["appendix", "apple"]
+
+def test_words_cursor_pagination(client):
+    """limit/cursor로 영어 단어 순 페이지를 빠짐없이, 겹치지 않게 넘김"""
+    add_words(client, *WORDS)
+    
+    def pages(query):
+        words, cursor = [], None
+        while True:
+            url = f'/api/words?{query}' + (f'&cursor={cursor}' if cursor else '')
+            data = client.get(url).get_json()
+            assert len(data["words"]) <= 2
+            words.extend(row["english"] for row in data["words"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return words, data["total"]
+    
+    assert pages('limit=2') == (sorted(english for english, _, _ in WORDS), len(WORDS))
+    assert pages('limit=2&category=animal') == (["cat", "dog", "fish"], 3)
+    
+    # 페이지 사이에 단어가 추가/삭제되어도 커서 다음 단어부터 이어짐
+    first = client.get('/api/words?limit=2').get_json()
+    client.delete('/api/words/cat')
+    add_words(client, ("apricot", "살구", "fruit"), ("cow", "소", "animal"))
+    second = client.get(f'/api/words?limit=2&cursor={first["next_cursor"]}').get_json()
+    assert [row["english"] for row in second["words"]] == ["cow", "dog"]
+    
+    assert client.get('/api/words?cursor=abc').status_code == 400
+    assert client.get('/api/words?limit=many').status_code == 400
+
+def test_words_field_projection(client):
+    """fields로 필요한 항목만 응답 (목록 전체 / 페이지 모두)"""
+    add_words(client, *WORDS)
+    rows = client.get('/api/words?fields=english').get_json()
+    assert rows[0] == {"english": "apple"} and len(rows) == len(WORDS)
+    data = client.get('/api/words?limit=1&fields=korean,english').get_json()
+    assert data["words"] == [{"korean": "사과", "english": "apple"}]
+    rows = client.get('/api/words?category=fruit').get_json()
+    assert rows == [{"english": "apple", "korean": "사과", "category": "fruit"},
+                    {"english": "banana", "korean": "바나나", "category": "fruit"}]
+    assert client.get('/api/words?fields=english,meaning').status_code == 400
+    assert client.get('/api/words?fields=,').status_code == 400
+
+def test_etag_not_modified(client):
+    """같은 ETag로 다시 요청하면 304, 데이터가 바뀌면 새 ETag로 200"""
+    add_words(client, *WORDS)
+    etags = {}
+    for url in ('/api/words', '/api/words?limit=2', '/api/categories', '/api/stats'):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == 'no-cache'
+        etags[url] = response.headers['ETag']
+        response = client.get(url, headers={'If-None-Match': etags[url]})
+        assert response.status_code == 304 and response.get_data() == b""
+        assert response.headers['ETag'] == etags[url]
+    
+    # 퀴즈 결과는 통계 ETag만 바꿈
+    client.post('/api/quiz/check', json={"word": "apple", "answer": "사과"})
+    assert client.get('/api/words', headers={'If-None-Match': etags['/api/words']}).status_code == 304
+    response = client.get('/api/stats', headers={'If-None-Match': etags['/api/stats']})
+    assert response.status_code == 200 and response.headers['ETag'] != etags['/api/stats']
+    
+    # 단어 변경은 모든 ETag를 바꿈
+    client.put('/api/words/cat', json={"english": "cat", "korean": "고양이", "category": "pet"})
+    for url, etag in etags.items():
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200, url
+    assert "pet" in client.get('/api/categories').get_json()
+
+def test_response_cache_invalidation(client):
+    """캐시된 응답은 같은 버전에서만 다시 쓰이고, 변경 뒤에는 새로 만들어짐"""
+    cache = web_vocab_app.response_cache
+    add_words(client, *WORDS)
+    first = client.get('/api/words?fields=english').get_data()
+    hits = cache.hits
+    assert client.get('/api/words?fields=english').get_data() == first
+    assert cache.hits == hits + 1
+    # 쿼리가 다르면 다른 항목
+    assert client.get('/api/words?fields=korean').get_data() != first
+    
+    add_words(client, ("zebra", "얼룩말", "animal"))
+    rows = client.get('/api/words?fields=english').get_json()
+    assert rows[-1] == {"english": "zebra"}
+    
+    # 퀴즈 결과: 통계 응답만 다시 만들고 단어 목록 캐시는 그대로 씀
+    stats = client.get('/api/stats').get_json()
+    client.post('/api/quiz/check', json={"word": "apple", "answer": "사과"})
+    hits = cache.hits
+    client.get('/api/words?fields=english')
+    assert cache.hits == hits + 1
+    assert client.get('/api/stats').get_json() != stats
+    
+    # 덱마다 따로 캐시함
+    assert client.get('/api/words?fields=english&deck=other').get_json() == []
@@ -0,0 +1,92 @@
+"""
+응답 캐시 (직렬화된 JSON 바이트)
+
+자주 읽는 조회 API의 응답 본문을 인코딩된 바이트 그대로 보관함.
+항목마다 만들 당시의 데이터 버전(ETag)을 함께 두고, 조회할 때 현재 버전과 다르면 버림.
+단어장 응답은 단어장 버전, 통계 응답은 단어장+통계 버전을 쓰므로 퀴즈 결과만 바뀌었을 때
+단어 목록 캐시는 그대로 남음. 전체 크기(바이트)와 항목 수가 한도를 넘으면 오래 쓰이지 않은 것부터 버림 (LRU)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+class ResponseCache:
+    """(덱, 엔드포인트, 쿼리) -> (데이터 버전, 응답 바이트) LRU 캐시"""
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 1024):
+        """
+        Args:
+            max_bytes: 보관할 응답 본문 크기 합계 한도
+            max_entries: 보관할 최대 항목 수
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max(1, max_entries)
+        self.entries: "OrderedDict[Hashable, Tuple[str, bytes]]" = OrderedDict()  # 오래 쓰이지 않은 순
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+    
+    def get(self, key: Hashable, version: str) -> Optional[bytes]:
+        """
+        캐시된 응답 본문 찾기
+        
+        Args:
+            key: 캐시 키
+            version: 현재 데이터 버전 (ETag)
+        
+        Returns:
+            Optional[bytes]: 같은 버전으로 만든 응답 본문 (없거나 버전이 다르면 None)
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] != version:
+                # 데이터가 바뀐 뒤라 더 이상 쓸 수 없음
+                self._remove(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: Hashable, version: str, body: bytes) -> None:
+        """응답 본문 저장 (한도를 넘는 큰 응답은 저장하지 않음)"""
+        if len(body) > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (version, body)
+            self.size += len(body)
+            while self.size > self.max_bytes or len(self.entries) > self.max_entries:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+    
+    def _remove(self, key: Hashable) -> None:
+        version, body = self.entries.pop(key)
+        self.size -= len(body)
+    
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+    
+    def info(self) -> Dict:
+        """캐시 상태 (항목 수, 크기, 적중/실패/내보내기 횟수)"""
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
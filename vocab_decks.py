@@ -0,0 +1,183 @@
+"""
+사용자별 단어장 (덱) 저장소 캐시
+
+덱 저장소는 처음 요청될 때 불러오고, 최근에 쓰인 덱만 메모리에 둠 (LRU).
+덱 수나 불러온 단어 수가 한도를 넘으면 가장 오래 쓰이지 않은 덱부터 내보내며,
+변경이 있었던 덱은 스냅샷으로 저장한 뒤 닫음
+"""
+
+import re
+import threading
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from vocab_store import VocabStore
+
+logger = logging.getLogger(__name__)
+
+# 덱 ID로 쓸 수 있는 문자 (디렉터리 이름으로 쓰므로 경로 문자는 허용하지 않음)
+DECK_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+def is_valid_deck_id(deck_id: str) -> bool:
+    """덱 ID 형식 확인"""
+    return bool(DECK_ID_PATTERN.match(deck_id))
+
+class DeckEntry:
+    """캐시에 올라간 덱 하나"""
+    
+    def __init__(self, store: VocabStore):
+        self.store = store
+        self.pins = 0  # 이 덱을 쓰고 있는 요청 수 (0일 때만 내보냄)
+        self.words = 0  # 마지막으로 확인한 단어 수 (메모리 사용량 추정)
+        self.loaded = False
+        self.loaded_version: Optional[Tuple[str, int, int]] = None  # 불러온 직후의 데이터 버전
+        self.load_lock = threading.Lock()
+    
+    def ensure_loaded(self) -> None:
+        """처음 쓰일 때 한 번만 불러오기"""
+        if self.loaded:
+            return
+        with self.load_lock:
+            if self.loaded:
+                return
+            self.store.load()
+            self.loaded_version = self.store.data_version()
+            self.words = len(self.store)
+            self.loaded = True
+    
+    @property
+    def dirty(self) -> bool:
+        return self.loaded and self.store.data_version() != self.loaded_version
+
+class DeckCache:
+    """
+    덱 ID -> 저장소 LRU 캐시
+    
+    요청은 acquire()로 덱을 잡고 끝나면 release()로 놓음. 잡혀 있는 덱은 내보내지 않으므로
+    요청 도중에 저장소가 닫히지 않음
+    """
+    
+    def __init__(self, factory: Callable[[str], VocabStore], max_decks: int = 100,
+                 max_words: int = 1000000):
+        """
+        Args:
+            factory: 덱 ID로 (아직 불러오지 않은) 저장소를 만드는 함수
+            max_decks: 메모리에 둘 최대 덱 수
+            max_words: 메모리에 둘 덱들의 단어 수 합계 한도
+        """
+        self.factory = factory
+        self.max_decks = max(1, max_decks)
+        self.max_words = max_words
+        self.entries: "OrderedDict[str, DeckEntry]" = OrderedDict()  # 오래 쓰이지 않은 순
+        self.lock = threading.Lock()
+        # 내보내는 중(저장/닫기 전)인 덱 ID -> 닫기가 끝나면 set되는 이벤트
+        self.closing: Dict[str, threading.Event] = {}
+        self.loads = 0
+        self.evictions = 0
+    
+    def acquire(self, deck_id: str) -> VocabStore:
+        """
+        덱 저장소 잡기 (메모리에 없으면 불러옴)
+        
+        Args:
+            deck_id: 덱 ID
+        
+        Returns:
+            VocabStore: 불러온 저장소 (다 쓰면 release 호출)
+        """
+        with self.lock:
+            entry = self.entries.get(deck_id)
+            if entry is None:
+                entry = DeckEntry(self.factory(deck_id))
+                self.entries[deck_id] = entry
+            else:
+                self.entries.move_to_end(deck_id)
+            entry.pins += 1
+            closing = self.closing.get(deck_id)
+        
+        try:
+            if not entry.loaded:
+                if closing is not None:
+                    # 같은 덱이 아직 저장 중이면 끝난 뒤에 파일을 읽음
+                    closing.wait()
+                entry.ensure_loaded()
+                with self.lock:
+                    self.loads += 1
+                logger.info(f"덱 불러오기: {deck_id} ({entry.words}개 단어)")
+        except BaseException:
+            self._unpin(deck_id, entry)
+            raise
+        self._evict()
+        return entry.store
+    
+    def release(self, deck_id: str) -> None:
+        """acquire로 잡은 덱 놓기"""
+        with self.lock:
+            entry = self.entries.get(deck_id)
+        if entry is None:
+            return
+        if entry.loaded:
+            entry.words = len(entry.store)
+        self._unpin(deck_id, entry)
+        self._evict()
+    
+    def _unpin(self, deck_id: str, entry: DeckEntry) -> None:
+        with self.lock:
+            entry.pins -= 1
+            if not entry.loaded and entry.pins == 0 and self.entries.get(deck_id) is entry:
+                # 불러오다 실패한 덱은 다음 요청에서 다시 시도
+                del self.entries[deck_id]
+    
+    def _evict(self) -> None:
+        """한도를 넘으면 잡혀 있지 않은 덱을 오래된 순으로 저장 후 닫기"""
+        with self.lock:
+            total_words = sum(entry.words for entry in self.entries.values())
+            victims: List[Tuple[str, DeckEntry]] = []
+            for deck_id, entry in list(self.entries.items()):
+                if len(self.entries) <= self.max_decks and total_words <= self.max_words:
+                    break
+                if entry.pins > 0 or not entry.loaded:
+                    continue
+                del self.entries[deck_id]
+                total_words -= entry.words
+                victims.append((deck_id, entry))
+                self.closing[deck_id] = threading.Event()
+            self.evictions += len(victims)
+        # 저장/닫기는 잠금 밖에서 해 다른 덱 요청을 막지 않음
+        # (같은 덱을 다시 불러오는 요청은 closing 이벤트를 기다림)
+        for deck_id, entry in victims:
+            try:
+                self._close(deck_id, entry)
+            finally:
+                with self.lock:
+                    self.closing.pop(deck_id).set()
+    
+    def _close(self, deck_id: str, entry: DeckEntry) -> None:
+        try:
+            if entry.dirty:
+                if not entry.store.save():
+                    logger.error(f"덱 저장 실패: {deck_id}")
+            entry.store.close()
+            logger.info(f"덱 내보내기: {deck_id}")
+        except Exception as e:
+            logger.error(f"덱 닫기 실패 ({deck_id}): {e}")
+    
+    def close_all(self) -> None:
+        """모든 덱 저장 후 닫기 (종료 시)"""
+        with self.lock:
+            entries = list(self.entries.items())
+            self.entries.clear()
+        for deck_id, entry in entries:
+            if entry.loaded:
+                self._close(deck_id, entry)
+    
+    def info(self) -> Dict:
+        """캐시 상태 (메모리에 있는 덱 수, 단어 수 합계, 불러오기/내보내기 횟수)"""
+        with self.lock:
+            return {
+                "open_decks": len(self.entries),
+                "open_words": sum(entry.words for entry in self.entries.values()),
+                "loads": self.loads,
+                "evictions": self.evictions
+            }
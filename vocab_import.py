@@ -0,0 +1,259 @@
+"""
+단어 일괄 가져오기 (CSV / JSONL)
+
+파일을 한 줄씩 읽으면서 검증하고 chunk_size개마다 한 번의 트랜잭션으로 반영함
+(한 청크에 저장 한 번, 파일 크기와 상관없이 메모리 사용량이 일정함)
+
+CSV: english,korean,category 열 (첫 줄이 헤더가 아니면 이 순서로 읽음)
+JSONL: 한 줄에 {"english": ..., "korean": ..., "category": ...} 하나
+
+CLI 사용법:
+    python vocab_import.py words.csv [--format csv|jsonl] [--on-conflict skip|overwrite|fail] [--chunk-size 500]
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import argparse
+from typing import Dict, List, Tuple, Optional, Callable, Iterator, TextIO
+from vocab_store import VocabStore
+
+# 지원하는 파일 형식
+IMPORT_FORMATS = ("csv", "jsonl")
+# 이미 있는 단어 처리 방법: 건너뛰기 / 덮어쓰기 / 중단
+CONFLICT_POLICIES = ("skip", "overwrite", "fail")
+# 한 번의 트랜잭션(저장)으로 반영하는 행 수
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 5000
+# 결과에 담는 행별 오류 수 (나머지는 개수만 셈)
+MAX_REPORTED_ERRORS = 100
+
+# 검증 함수: (영어 단어, 한국어 뜻) -> (검증 성공 여부, 에러 메시지)
+Validator = Callable[[str, str], Tuple[bool, Optional[str]]]
+
+class ImportResult:
+    """
+    가져오기 결과
+    
+    행별 오류는 MAX_REPORTED_ERRORS개까지만 보관하고 나머지는 개수만 셈
+    """
+    
+    def __init__(self):
+        self.rows = 0  # 읽은 행 수
+        self.added = 0
+        self.updated = 0
+        self.skipped = 0  # 이미 있어서 건너뛴 행 수
+        self.failed = 0  # 형식/검증 오류 행 수
+        self.chunks = 0  # 저장한 청크 수
+        self.errors: List[Dict] = []  # [{"line": 줄 번호, "word": 단어, "message": 오류}, ...]
+        self.stopped_at: Optional[int] = None  # 중단된 줄 번호 (끝까지 읽었으면 None)
+        self.message: Optional[str] = None  # 중단 사유
+        self.save_failed = False  # 저장 실패로 중단되었는지 여부
+    
+    @property
+    def ok(self) -> bool:
+        return self.stopped_at is None
+    
+    def add_error(self, line: int, word: str, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "word": word, "message": message})
+    
+    def to_dict(self) -> Dict:
+        result = {
+            "success": self.ok,
+            "rows": self.rows,
+            "added": self.added,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "chunks": self.chunks,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors)
+        }
+        if not self.ok:
+            result["stopped_at"] = self.stopped_at
+            result["message"] = self.message
+        return result
+
+def detect_format(filename: Optional[str]) -> Optional[str]:
+    """파일 이름의 확장자로 형식 추정 (모르면 None)"""
+    if not filename:
+        return None
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return None
+
+def iter_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Optional[Dict], Optional[str]]]:
+    """
+    파일을 한 줄씩 읽어 행 단위로 반환
+    
+    Args:
+        stream: 텍스트 스트림
+        fmt: 'csv' or 'jsonl'
+    
+    Yields:
+        Tuple[int, Optional[Dict], Optional[str]]: (줄 번호, 행 데이터, 형식 오류 메시지)
+    """
+    if fmt == "jsonl":
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_no, None, "JSON 형식이 아닙니다."
+                continue
+            if not isinstance(row, dict):
+                yield line_no, None, "JSON 객체가 아닙니다."
+                continue
+            yield line_no, row, None
+        return
+    
+    reader = csv.reader(stream)
+    columns = ["english", "korean", "category"]
+    for record in reader:
+        if not record or not any(cell.strip() for cell in record):
+            continue
+        if reader.line_num == 1 and "english" in [cell.strip().lower() for cell in record]:
+            # 헤더 행: 열 이름으로 읽음
+            columns = [cell.strip().lower() for cell in record]
+            continue
+        yield reader.line_num, dict(zip(columns, record)), None
+
+def import_words(store: VocabStore, stream: TextIO, fmt: str, validate: Validator,
+                 on_conflict: str = "skip", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 durable: bool = False,
+                 progress: Optional[Callable[[ImportResult], None]] = None) -> ImportResult:
+    """
+    CSV/JSONL 스트림의 단어를 저장소에 가져오기
+    
+    chunk_size개 행마다 트랜잭션 하나로 반영함. 'fail' 정책에서 이미 있는 단어를 만나면
+    그 앞까지 반영하고 중단함 (앞서 저장된 청크는 그대로 남음)
+    
+    Args:
+        store: 단어 저장소
+        stream: 텍스트 스트림
+        fmt: 'csv' or 'jsonl'
+        validate: 입력 검증 함수 (validate_word_input)
+        on_conflict: 'skip', 'overwrite', 'fail'
+        chunk_size: 한 번에 저장하는 행 수
+        durable: 청크마다 디스크에 기록될 때까지 대기할지 여부
+        progress: 청크를 저장할 때마다 호출할 함수
+    
+    Returns:
+        ImportResult: 가져오기 결과
+    """
+    result = ImportResult()
+    rows = iter_rows(stream, fmt)
+    while result.ok:
+        chunk = []
+        for item in rows:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                break
+        if not chunk:
+            break
+        
+        added = updated = 0
+        with store.transaction(durable=durable) as txn:
+            for line_no, row, error_message in chunk:
+                result.rows += 1
+                if error_message:
+                    result.add_error(line_no, "", error_message)
+                    continue
+                
+                english = str(row.get("english") or "").strip().lower()
+                korean = str(row.get("korean") or "").strip()
+                category = str(row.get("category") or "").strip()
+                is_valid, error_message = validate(english, korean)
+                if not is_valid:
+                    result.add_error(line_no, english, error_message)
+                    continue
+                
+                if english in store:
+                    if on_conflict == "fail":
+                        result.rows -= 1
+                        result.stopped_at = line_no
+                        result.message = f"'{english}' 단어가 이미 존재합니다."
+                        break
+                    if on_conflict == "skip":
+                        result.skipped += 1
+                        continue
+                    updated += 1
+                else:
+                    added += 1
+                store.add_word(english, korean, category)
+        
+        if not txn.ok:
+            result.stopped_at = chunk[0][0]
+            result.message = "파일 저장에 실패했습니다."
+            result.save_failed = True
+            break
+        result.added += added
+        result.updated += updated
+        result.chunks += 1
+        if progress:
+            progress(result)
+    
+    return result
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    CLI 진입점
+    
+    web_vocab_app과 같은 설정(STORAGE_BACKEND 등)의 저장소에 가져옴
+    
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 중단됨)
+    """
+    parser = argparse.ArgumentParser(description="CSV/JSONL 파일의 단어를 단어장에 가져오기")
+    parser.add_argument("file", help="가져올 파일 ('-'이면 표준 입력)")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="파일 형식 (기본: 확장자로 추정)")
+    parser.add_argument("--on-conflict", choices=CONFLICT_POLICIES, default="skip",
+                        help="이미 있는 단어 처리 방법 (기본: skip)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"한 번에 저장하는 행 수 (기본: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+    
+    fmt = args.format or detect_format(args.file)
+    if fmt is None:
+        parser.error("파일 형식을 알 수 없습니다. --format을 지정해주세요.")
+    chunk_size = max(1, min(args.chunk_size, MAX_CHUNK_SIZE))
+    
+    import web_vocab_app
+    web_vocab_app.load_data()
+    store = web_vocab_app.get_store()
+    
+    def report(result: ImportResult) -> None:
+        print(f"\r{result.rows}행 처리 (추가 {result.added}, 수정 {result.updated}, "
+              f"건너뜀 {result.skipped}, 오류 {result.failed})", end="", file=sys.stderr, flush=True)
+    
+    if args.file == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", newline="")
+        result = import_words(store, stream, fmt, web_vocab_app.validate_word_input,
+                              args.on_conflict, chunk_size, progress=report)
+    else:
+        with open(args.file, "r", encoding="utf-8-sig", newline="") as f:
+            result = import_words(store, f, fmt, web_vocab_app.validate_word_input,
+                                  args.on_conflict, chunk_size, progress=report)
+    print(file=sys.stderr)
+    store.close()
+    
+    for error in result.errors:
+        print(f"{error['line']}행 {error['word']}: {error['message']}", file=sys.stderr)
+    if result.failed > len(result.errors):
+        print(f"... 외 {result.failed - len(result.errors)}개 오류", file=sys.stderr)
+    if not result.ok:
+        print(f"{result.stopped_at}행에서 중단: {result.message}", file=sys.stderr)
+    print(json.dumps(result.to_dict(), ensure_ascii=False))
+    return 0 if result.ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
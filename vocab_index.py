@@ -0,0 +1,967 @@
+"""
+단어장 보조 인덱스
+
+저장소(VocabStore)는 단어나 통계, 복습 일정이 바뀔 때마다 등록된 인덱스의 add/remove/set_stats/set_schedule을 호출해
+인덱스를 점진적으로 갱신하고, 데이터를 통째로 다시 불러온 경우에만 처음부터 다시 만듦.
+인덱스 조회는 저장소 잠금(store.lock)을 잡은 상태에서 수행해야 함
+"""
+
+import heapq
+import random
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Dict, List, Tuple, Optional, Set, Callable, Iterable, Iterator, Collection, Any
+
+class WordIndex:
+    """저장소 변경에 맞춰 갱신되는 인덱스 공통 인터페이스"""
+    
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        raise NotImplementedError
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        """단어 추가 (같은 단어가 이미 있으면 remove가 먼저 호출됨)"""
+        raise NotImplementedError
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        """단어 제거 (data는 제거되기 전의 값)"""
+        raise NotImplementedError
+    
+    def set_stats(self, word: str, stats: Optional[List[int]]) -> None:
+        """단어의 퀴즈 통계 변경 (None이면 통계 삭제)"""
+    
+    def set_schedule(self, word: str, schedule: Optional[List]) -> None:
+        """단어의 복습 일정 변경 (None이면 일정 삭제)"""
+    
+    def rebuild(self, words: Iterable[Tuple[str, Dict[str, str]]],
+                stats: Iterable[Tuple[str, List[int]]],
+                schedules: Iterable[Tuple[str, List]] = ()) -> None:
+        """전체 데이터로 다시 만들기"""
+        self.clear()
+        for word, data in words:
+            self.add(word, data)
+        for word, word_stats in stats:
+            self.set_stats(word, word_stats)
+        for word, schedule in schedules:
+            self.set_schedule(word, schedule)
+
+def is_hangul(ch: str) -> bool:
+    """한글 음절 또는 호환 자모인지 확인"""
+    return '가' <= ch <= '힣' or 'ㄱ' <= ch <= 'ㆎ'
+
+# 한글 음절의 초성 (유니코드 음절 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+def choseong_key(text: str) -> str:
+    """
+    한글 음절을 초성으로 바꾼 문자열 (예: "사과 주스" -> "ㅅㄱ ㅈㅅ")
+    
+    한글 음절이 아닌 문자는 그대로 둠
+    """
+    return "".join(
+        CHOSEONG[(ord(ch) - 0xAC00) // 588] if '가' <= ch <= '힣' else ch
+        for ch in text
+    )
+
+def is_choseong_query(query: str) -> bool:
+    """초성(과 공백)으로만 이루어진 검색어인지 확인"""
+    query = query.strip()
+    return bool(query) and all(ch in CHOSEONG or ch == ' ' for ch in query)
+
+def split_script_runs(text: str) -> List[Tuple[bool, str]]:
+    """
+    문자열을 한글 구간과 그 외 구간으로 나누기
+    
+    Returns:
+        List[Tuple[bool, str]]: (한글 구간 여부, 구간 문자열) 목록
+    """
+    runs = []
+    start = 0
+    for i in range(1, len(text) + 1):
+        if i == len(text) or is_hangul(text[i]) != is_hangul(text[start]):
+            runs.append((is_hangul(text[start]), text[start:i]))
+            start = i
+    return runs
+
+class NgramIndex(WordIndex):
+    """
+    영어 단어/한국어 뜻 부분 문자열 검색용 n-gram 역색인
+    
+    영어 등은 2~3글자, 정보량이 많은 한글은 1~2글자 조각으로 색인함.
+    검색어 조각들의 포스팅 목록을 작은 것부터 교집합한 뒤 실제 포함 여부를 확인하고,
+    일치 정도(완전 일치 > 앞부분 일치 > 단어 경계 일치 > 부분 일치) 순으로 상위 결과만 반환함.
+    조각으로 색인하지 않는 영어 등의 한 글자 검색어는 첫 글자별로 정렬해 둔 목록에서 그 글자로 시작하는 단어만 찾음
+    """
+    
+    GRAM_SIZES = (2, 3)
+    HANGUL_GRAM_SIZES = (1, 2)
+    
+    def __init__(self):
+        self.postings: Dict[str, Set[str]] = {}
+        self.texts: Dict[str, Tuple[str, ...]] = {}  # {단어: 색인한 문자열들}
+        # {첫 글자: [(일치 정도, 단어 길이, 단어)] 정렬 목록} (한 글자 검색어용)
+        self.initials: Dict[str, List[Tuple[int, int, str]]] = {}
+    
+    def clear(self) -> None:
+        self.postings = {}
+        self.texts = {}
+        self.initials = {}
+    
+    def _grams(self, text: str) -> Set[str]:
+        """색인할 조각들"""
+        grams = set()
+        for hangul, run in split_script_runs(text):
+            for n in (self.HANGUL_GRAM_SIZES if hangul else self.GRAM_SIZES):
+                for i in range(len(run) - n + 1):
+                    grams.add(run[i:i + n])
+        return grams
+    
+    def _query_grams(self, query: str) -> Set[str]:
+        """검색어에서 찾아볼 조각들 (구간마다 색인된 가장 긴 길이 사용)"""
+        grams = set()
+        for hangul, run in split_script_runs(query):
+            sizes = self.HANGUL_GRAM_SIZES if hangul else self.GRAM_SIZES
+            n = min(len(run), sizes[-1])
+            if n < sizes[0]:
+                continue  # 너무 짧은 구간은 조건에서 제외 (결과 확인 단계에서 걸러짐)
+            for i in range(len(run) - n + 1):
+                grams.add(run[i:i + n])
+        return grams
+    
+    def _fields(self, word: str, data: Dict[str, str]) -> Tuple[str, ...]:
+        """색인할 문자열들"""
+        return (word.lower(), data.get("korean", "").lower())
+    
+    def _word_grams(self, texts: Tuple[str, ...]) -> Set[str]:
+        grams = set()
+        for text in texts:
+            grams |= self._grams(text)
+        return grams
+    
+    @staticmethod
+    def _initial_entries(word: str, texts: Tuple[str, ...]) -> Iterator[Tuple[str, Tuple[int, int, str]]]:
+        """(첫 글자, 정렬 항목) 목록 (한글은 한 글자 조각으로 색인되므로 제외)"""
+        for initial in {text[0] for text in texts if text and not is_hangul(text[0])}:
+            # 목록이 첫 글자별로 나뉘므로 그 글자 하나뿐인 문자열이 있는지로 완전 일치 여부가 정해짐
+            yield initial, (0 if initial in texts else 1, len(word), word)
+    
+    def _index_word(self, word: str, data: Dict[str, str]) -> Iterator[Tuple[str, Tuple[int, int, str]]]:
+        """조각 포스팅에 추가하고 첫 글자 목록에 넣을 항목 반환"""
+        texts = self._fields(word, data)
+        self.texts[word] = texts
+        for gram in self._word_grams(texts):
+            self.postings.setdefault(gram, set()).add(word)
+        return self._initial_entries(word, texts)
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        for initial, entry in self._index_word(word, data):
+            insort(self.initials.setdefault(initial, []), entry)
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        texts = self.texts.pop(word, None)
+        if texts is None:
+            return
+        for gram in self._word_grams(texts):
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.discard(word)
+                if not posting:
+                    del self.postings[gram]
+        for initial, entry in self._initial_entries(word, texts):
+            entries = self.initials.get(initial)
+            if entries is None:
+                continue
+            position = bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
+                if not entries:
+                    del self.initials[initial]
+    
+    def rebuild(self, words: Iterable[Tuple[str, Dict[str, str]]],
+                stats: Iterable[Tuple[str, List[int]]],
+                schedules: Iterable[Tuple[str, List]] = ()) -> None:
+        self.clear()
+        for word, data in words:
+            for initial, entry in self._index_word(word, data):
+                self.initials.setdefault(initial, []).append(entry)
+        # 하나씩 삽입하지 않고 한 번에 정렬
+        for entries in self.initials.values():
+            entries.sort()
+    
+    @staticmethod
+    def _match_rank(query: str, text: str) -> Optional[int]:
+        """일치 정도 (작을수록 좋음, 포함하지 않으면 None)"""
+        if text == query:
+            return 0
+        if text.startswith(query):
+            return 1
+        position = text.find(query)
+        if position < 0:
+            return None
+        return 2 if text[position - 1] == ' ' else 3
+    
+    def search(self, query: str, limit: int = 20,
+               accept: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """
+        부분 문자열 검색
+        
+        Args:
+            query: 검색어 (영어 또는 한글)
+            limit: 최대 결과 수
+            accept: 결과에 포함할 단어인지 확인하는 함수 (예: 카테고리 필터)
+        
+        Returns:
+            List[str]: 순위가 높은 순서의 영어 단어 목록
+        """
+        query = query.strip().lower()
+        if not query or limit <= 0:
+            return []
+        
+        grams = self._query_grams(query)
+        if not grams:
+            # 조각으로 색인하지 않는 한 글자 검색어: 이미 순위대로 정렬된 첫 글자 목록에서 limit개만 꺼냄
+            results = []
+            for _, _, word in self.initials.get(query, ()):
+                if accept is None or accept(word):
+                    results.append(word)
+                    if len(results) >= limit:
+                        break
+            return results
+        
+        postings = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:]) if len(postings) > 1 else postings[0]
+        
+        ranked = []
+        for word in candidates:
+            ranks = [r for r in (self._match_rank(query, text) for text in self.texts[word])
+                     if r is not None]
+            if not ranks or (accept is not None and not accept(word)):
+                continue
+            ranked.append((min(ranks), len(word), word))
+        return [word for _, _, word in heapq.nsmallest(limit, ranked)]
+
+class ChoseongIndex(NgramIndex):
+    """
+    한국어 뜻 초성 검색용 n-gram 역색인 (예: "ㅅㄱ" -> 사과)
+    
+    뜻마다 초성 문자열을 미리 만들어 색인하므로 검색할 때 모든 뜻을 분해하지 않음.
+    초성은 19가지뿐이라 조각 하나가 가리키는 단어가 많으므로 3글자 조각까지 색인함
+    """
+    
+    HANGUL_GRAM_SIZES = (1, 2, 3)
+    
+    def _fields(self, word: str, data: Dict[str, str]) -> Tuple[str, ...]:
+        return (choseong_key(data.get("korean", "")),)
+
+class PrefixIndex(WordIndex):
+    """
+    영어 단어 자동 완성용 정렬 배열
+    
+    트라이 대신 정렬된 단어 목록 하나만 두고 이진 탐색으로 접두사 범위를 찾으므로
+    메모리를 적게 쓰고, 조회는 O(log n + 결과 수)임
+    """
+    
+    def __init__(self):
+        self.keys: List[str] = []
+    
+    def clear(self) -> None:
+        self.keys = []
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        position = bisect_left(self.keys, word)
+        if position == len(self.keys) or self.keys[position] != word:
+            self.keys.insert(position, word)
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        position = bisect_left(self.keys, word)
+        if position < len(self.keys) and self.keys[position] == word:
+            del self.keys[position]
+    
+    def rebuild(self, words: Iterable[Tuple[str, Dict[str, str]]],
+                stats: Iterable[Tuple[str, List[int]]],
+                schedules: Iterable[Tuple[str, List]] = ()) -> None:
+        # 하나씩 삽입하지 않고 한 번에 정렬
+        self.keys = sorted(word for word, _ in words)
+    
+    def iter_from(self, after: Optional[str] = None) -> Iterator[str]:
+        """after 다음 단어부터 사전 순으로 순회 (after가 없으면 처음부터)"""
+        start = 0 if after is None else bisect_right(self.keys, after)
+        for i in range(start, len(self.keys)):
+            yield self.keys[i]
+    
+    def complete(self, prefix: str, limit: int = 10,
+                 accept: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """
+        접두사로 시작하는 단어 (사전 순)
+        
+        Args:
+            prefix: 접두사
+            limit: 최대 결과 수
+            accept: 결과에 포함할 단어인지 확인하는 함수
+        
+        Returns:
+            List[str]: 영어 단어 목록
+        """
+        results = []
+        if limit <= 0:
+            return results
+        for i in range(bisect_left(self.keys, prefix), len(self.keys)):
+            word = self.keys[i]
+            if not word.startswith(prefix):
+                break
+            if accept is None or accept(word):
+                results.append(word)
+                if len(results) >= limit:
+                    break
+        return results
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    두 문자열의 편집 거리 (Levenshtein)
+    
+    같은 앞부분/뒷부분은 떼어 내고, max_distance가 있으면 대각선에서 그 거리 안의 칸만 계산함
+    
+    Args:
+        a, b: 비교할 문자열
+        max_distance: 이 값을 넘는 것이 확실해지면 계산을 멈추고 max_distance + 1 반환
+    
+    Returns:
+        int: 편집 거리
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+    
+    start = 0
+    while start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    
+    over = len(a) + 1 if max_distance is None else max_distance + 1
+    band = len(a) if max_distance is None else min(max_distance, len(a))
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        ca = a[i - 1]
+        current = [over] * (len(b) + 1)
+        if i <= band:
+            current[0] = i
+        best = current[0]
+        for j in range(max(1, i - band), min(len(b), i + band) + 1):
+            cost = previous[j - 1] + (ca != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+            if cost < best:
+                best = cost
+        if best >= over:
+            return over
+        previous = current
+    return min(previous[-1], over)
+
+class FuzzyIndex(WordIndex):
+    """
+    철자가 틀린 영어 단어와 비슷한 단어 찾기 (SymSpell 방식의 삭제 사전)
+    
+    단어마다 앞부분 prefix_length글자에서 max_distance개 이하의 글자를 지운 문자열을 미리 색인해 두고,
+    검색어도 같은 방식으로 지운 문자열만 찾아본 뒤 후보의 실제 편집 거리를 확인함.
+    앞부분만 색인하므로 단어 수가 많아도 메모리가 크게 늘지 않음.
+    짧은 지운 문자열에는 단어가 많이 모이므로, 조회할 때 한 문자열에서 확인하는 후보는
+    먼저 색인된 bucket_limit개까지로 제한해 단어장이 커져도 조회 시간이 일정 수준을 넘지 않음
+    """
+    
+    def __init__(self, max_distance: int = 2, prefix_length: int = 5, bucket_limit: int = 512):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.bucket_limit = bucket_limit
+        # {지운 문자열: 단어 또는 {단어: None}} (대부분 단어 하나이므로 dict를 만들지 않음,
+        # dict는 추가된 순서를 유지하고 추가/삭제가 O(1)임)
+        self.deletes: Dict[str, object] = {}
+    
+    def clear(self) -> None:
+        self.deletes = {}
+    
+    def _deletes(self, word: str) -> Set[str]:
+        """앞부분에서 max_distance개 이하의 글자를 지운 문자열들"""
+        results = {word[:self.prefix_length]}
+        frontier = results
+        for _ in range(self.max_distance):
+            frontier = {text[:i] + text[i + 1:] for text in frontier for i in range(len(text))}
+            results |= frontier
+        return results
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        for key in self._deletes(word):
+            entry = self.deletes.get(key)
+            if entry is None:
+                self.deletes[key] = word
+            elif isinstance(entry, dict):
+                entry[word] = None
+            elif entry != word:
+                self.deletes[key] = {entry: None, word: None}
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        for key in self._deletes(word):
+            entry = self.deletes.get(key)
+            if entry == word:
+                del self.deletes[key]
+            elif isinstance(entry, dict) and word in entry:
+                del entry[word]
+                if len(entry) == 1:
+                    self.deletes[key] = next(iter(entry))
+    
+    def rebuild(self, words: Iterable[Tuple[str, Dict[str, str]]],
+                stats: Iterable[Tuple[str, List[int]]],
+                schedules: Iterable[Tuple[str, List]] = ()) -> None:
+        # 앞부분이 같은 단어들은 지운 문자열도 같으므로 앞부분별로 묶어 한 번에 색인함
+        groups: Dict[str, List[str]] = {}
+        for word, _ in words:
+            groups.setdefault(word[:self.prefix_length], []).append(word)
+        buckets: Dict[str, List[str]] = {}
+        for prefix, members in groups.items():
+            for key in self._deletes(prefix):
+                buckets.setdefault(key, []).extend(members)
+        self.deletes = {key: bucket[0] if len(bucket) == 1 else dict.fromkeys(bucket)
+                        for key, bucket in buckets.items()}
+    
+    def lookup(self, query: str, max_distance: Optional[int] = None,
+               limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        편집 거리가 가까운 단어 찾기
+        
+        Args:
+            query: 찾을 단어
+            max_distance: 최대 편집 거리 (색인한 거리 이하, 기본값은 색인한 거리)
+            limit: 최대 결과 수
+        
+        Returns:
+            List[Tuple[str, int]]: (단어, 편집 거리) 목록 (가까운 순서)
+        """
+        query = query.strip().lower()
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+        if not query or max_distance < 0:
+            return []
+        
+        candidates = set()
+        for key in self._deletes(query):
+            entry = self.deletes.get(key)
+            if entry is None:
+                continue
+            if isinstance(entry, dict):
+                candidates.update(islice(entry, self.bucket_limit))
+            else:
+                candidates.add(entry)
+        
+        # 편집 한 번으로 글자 종류는 많아야 두 개(지운 글자, 넣은 글자) 달라지므로,
+        # 길이나 글자 종류 차이가 너무 큰 후보는 편집 거리를 계산하지 않고 버림
+        letters = set(query)
+        matches = []
+        for word in candidates:
+            if (abs(len(word) - len(query)) > max_distance
+                    or len(letters.symmetric_difference(word)) > 2 * max_distance):
+                continue
+            distance = edit_distance(query, word, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, word))
+        return [(word, distance) for distance, word in heapq.nsmallest(limit, matches)]
+
+class CategoryIndex(WordIndex):
+    """
+    카테고리별 단어 목록과 개수
+    
+    카테고리마다 단어를 추가된 순서로 두고, 영어 단어 순 목록은 필요할 때 만들어
+    그 카테고리가 바뀔 때까지 재사용함
+    """
+    
+    def __init__(self):
+        self.members: Dict[str, Dict[str, None]] = {}  # {카테고리: {단어: None}} (추가된 순서)
+        self._sorted: Dict[str, List[str]] = {}  # {카테고리: 정렬된 단어 목록}
+    
+    def clear(self) -> None:
+        self.members = {}
+        self._sorted = {}
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        category = data.get("category", "")
+        self.members.setdefault(category, {})[word] = None
+        self._sorted.pop(category, None)
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        category = data.get("category", "")
+        members = self.members.get(category)
+        if members is None or word not in members:
+            return
+        del members[word]
+        if not members:
+            del self.members[category]
+        self._sorted.pop(category, None)
+    
+    def words(self, category: str) -> List[str]:
+        """카테고리의 단어 목록 (추가된 순서)"""
+        return list(self.members.get(category, ()))
+    
+    def count(self, category: str) -> int:
+        """카테고리의 단어 수"""
+        return len(self.members.get(category, ()))
+    
+    def categories(self) -> List[str]:
+        """비어 있지 않은 카테고리 목록 (정렬됨)"""
+        return sorted({category.strip() for category in self.members if category.strip()})
+    
+    def iter_from(self, category: str, after: Optional[str] = None) -> Iterator[str]:
+        """카테고리 안에서 after 다음 단어부터 사전 순으로 순회"""
+        keys = self._sorted.get(category)
+        if keys is None:
+            keys = self._sorted[category] = sorted(self.members.get(category, ()))
+        start = 0 if after is None else bisect_right(keys, after)
+        for i in range(start, len(keys)):
+            yield keys[i]
+
+class RankedList:
+    """
+    순위로 조회할 수 있는 정렬 목록
+    
+    값을 최대 2 * BUCKET_SIZE개씩 정렬된 구간에 나눠 담고, 구간 크기의 누적합을 펜윅 트리로
+    관리하므로 삽입/삭제는 구간 하나 안에서만 일어나고 k번째 값 조회는 O(log n)임
+    """
+    
+    BUCKET_SIZE = 512
+    
+    def __init__(self):
+        self.buckets: List[List[Any]] = []
+        self.maxes: List[Any] = []  # 구간별 최댓값 (구간 찾기용)
+        self._tree: List[int] = [0]  # 구간 크기의 펜윅 트리 (1부터 시작)
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _rebuild_tree(self) -> None:
+        tree = [0] + [len(bucket) for bucket in self.buckets]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+    
+    def _tree_add(self, position: int, delta: int) -> None:
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+    
+    def add(self, value: Any) -> None:
+        """값 추가"""
+        self.size += 1
+        if not self.buckets:
+            self.buckets.append([value])
+            self.maxes.append(value)
+            self._rebuild_tree()
+            return
+        position = min(bisect_left(self.maxes, value), len(self.buckets) - 1)
+        bucket = self.buckets[position]
+        insort(bucket, value)
+        self.maxes[position] = bucket[-1]
+        if len(bucket) > 2 * self.BUCKET_SIZE:
+            # 구간이 너무 커지면 반으로 나눔
+            self.buckets.insert(position + 1, bucket[self.BUCKET_SIZE:])
+            del bucket[self.BUCKET_SIZE:]
+            self.maxes[position] = bucket[-1]
+            self.maxes.insert(position + 1, self.buckets[position + 1][-1])
+            self._rebuild_tree()
+        else:
+            self._tree_add(position, 1)
+    
+    def remove(self, value: Any) -> bool:
+        """값 제거 (없으면 False)"""
+        position = bisect_left(self.maxes, value)
+        if position == len(self.buckets):
+            return False
+        bucket = self.buckets[position]
+        i = bisect_left(bucket, value)
+        if i == len(bucket) or bucket[i] != value:
+            return False
+        del bucket[i]
+        self.size -= 1
+        if bucket:
+            self.maxes[position] = bucket[-1]
+            self._tree_add(position, -1)
+        else:
+            del self.buckets[position]
+            del self.maxes[position]
+            self._rebuild_tree()
+        return True
+    
+    def __getitem__(self, k: int) -> Any:
+        """k번째(0부터) 값"""
+        if not 0 <= k < self.size:
+            raise IndexError(k)
+        # 펜윅 트리를 내려가며 k번째 값이 들어 있는 구간 찾기
+        position = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(self._tree) and self._tree[nxt] <= k:
+                position = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return self.buckets[position][k]
+
+class WeaknessIndex(WordIndex):
+    """
+    틀린 단어 집중 학습용 약점 순위 (정답률 낮은 순, 같으면 틀린 횟수 많은 순)
+    
+    퀴즈 결과가 바뀔 때마다 해당 단어의 순위만 O(log n)으로 갱신하고,
+    전체와 카테고리별 순위에서 하위 50% 중 하나를 O(log n)으로 뽑음
+    """
+    
+    def __init__(self):
+        self.keys: Dict[str, Tuple[float, int, str]] = {}  # {단어: 순위 키} (풀어 본 단어)
+        self.word_categories: Dict[str, str] = {}  # {단어: 카테고리} (단어장에 있는 단어)
+        self.ranked = RankedList()
+        self.ranked_by_category: Dict[str, RankedList] = {}
+    
+    def clear(self) -> None:
+        self.keys = {}
+        self.word_categories = {}
+        self.ranked = RankedList()
+        self.ranked_by_category = {}
+    
+    def _insert(self, word: str) -> None:
+        key = self.keys[word]
+        self.ranked.add(key)
+        self.ranked_by_category.setdefault(self.word_categories[word], RankedList()).add(key)
+    
+    def _discard(self, word: str) -> None:
+        key = self.keys[word]
+        category = self.word_categories[word]
+        self.ranked.remove(key)
+        ranked = self.ranked_by_category[category]
+        ranked.remove(key)
+        if not ranked:
+            del self.ranked_by_category[category]
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        self.word_categories[word] = data.get("category", "")
+        if word in self.keys:
+            self._insert(word)
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        if word not in self.word_categories:
+            return
+        if word in self.keys:
+            self._discard(word)
+        del self.word_categories[word]
+    
+    def set_stats(self, word: str, stats: Optional[List[int]]) -> None:
+        known = word in self.word_categories
+        if word in self.keys:
+            if known:
+                self._discard(word)
+            del self.keys[word]
+        if stats is None:
+            return
+        correct, wrong = stats
+        if correct + wrong == 0:
+            return
+        self.keys[word] = (correct / (correct + wrong), -wrong, word)
+        if known:
+            self._insert(word)
+    
+    def count(self, category: Optional[str] = None) -> int:
+        """풀어 본 단어 수 (category가 주어지면 해당 카테고리만)"""
+        if not category:
+            return len(self.ranked)
+        ranked = self.ranked_by_category.get(category)
+        return len(ranked) if ranked is not None else 0
+    
+    def draw(self, category: Optional[str] = None, rng: random.Random = random) -> Optional[str]:
+        """
+        약점 단어 하나 뽑기 (순위 하위 50% 중에서 무작위)
+        
+        Args:
+            category: 카테고리 (없으면 전체)
+            rng: 난수 생성기
+        
+        Returns:
+            Optional[str]: 영어 단어 (풀어 본 단어가 없으면 None)
+        """
+        ranked = self._ranked(category)
+        if not ranked:
+            return None
+        return ranked[rng.randrange(max(1, len(ranked) // 2))][2]
+    
+    def sample(self, k: int, category: Optional[str] = None, rng: random.Random = random) -> List[str]:
+        """
+        서로 다른 약점 단어 k개 (순위 하위 50%가 모자라면 있는 만큼)
+        
+        Args:
+            k: 뽑을 단어 수
+            category: 카테고리 (없으면 전체)
+            rng: 난수 생성기
+        
+        Returns:
+            List[str]: 영어 단어 목록
+        """
+        ranked = self._ranked(category)
+        if not ranked:
+            return []
+        bottom = max(1, len(ranked) // 2)
+        if bottom <= 2 * k:
+            positions = rng.sample(range(bottom), min(k, bottom))
+        else:
+            positions = set()
+            while len(positions) < k:
+                positions.add(rng.randrange(bottom))
+        return [ranked[position][2] for position in positions]
+    
+    def _ranked(self, category: Optional[str]) -> Optional[RankedList]:
+        return self.ranked_by_category.get(category) if category else self.ranked
+
+class SamplingPool:
+    """
+    무작위 추출용 단어 배열 (삭제할 때 마지막 단어를 빈자리로 옮겨 O(1) 유지)
+    """
+    
+    def __init__(self):
+        self.words: List[str] = []
+        self.positions: Dict[str, int] = {}  # {단어: 배열 위치}
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def add(self, word: str) -> None:
+        if word not in self.positions:
+            self.positions[word] = len(self.words)
+            self.words.append(word)
+    
+    def remove(self, word: str) -> None:
+        position = self.positions.pop(word, None)
+        if position is None:
+            return
+        last = self.words.pop()
+        if last != word:
+            self.words[position] = last
+            self.positions[last] = position
+    
+    def choice(self, rng: random.Random = random) -> str:
+        return self.words[rng.randrange(len(self.words))]
+    
+    def sample(self, k: int, exclude: Collection[str] = (), rng: random.Random = random) -> List[str]:
+        """
+        exclude에 없는 서로 다른 단어 k개 (단어가 모자라면 있는 만큼)
+        
+        단어가 충분히 많으면 다시 뽑기(rejection sampling)로 O(k)에 끝남
+        """
+        others = len(self.words) - sum(1 for word in exclude if word in self.positions)
+        if others <= 2 * k:
+            candidates = [word for word in self.words if word not in exclude]
+            return rng.sample(candidates, min(k, len(candidates)))
+        picked: List[str] = []
+        seen = set(exclude)
+        while len(picked) < k:
+            word = self.choice(rng)
+            if word not in seen:
+                seen.add(word)
+                picked.append(word)
+        return picked
+
+class WordPool(WordIndex):
+    """전체/카테고리별 무작위 단어 추출 (목록을 만들지 않고 O(1)에 뽑음)"""
+    
+    def __init__(self):
+        self.pool = SamplingPool()
+        self.pools_by_category: Dict[str, SamplingPool] = {}
+    
+    def clear(self) -> None:
+        self.pool = SamplingPool()
+        self.pools_by_category = {}
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        self.pool.add(word)
+        self.pools_by_category.setdefault(data.get("category", ""), SamplingPool()).add(word)
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        self.pool.remove(word)
+        category = data.get("category", "")
+        pool = self.pools_by_category.get(category)
+        if pool is not None:
+            pool.remove(word)
+            if not pool:
+                del self.pools_by_category[category]
+    
+    def _pool(self, category: Optional[str]) -> SamplingPool:
+        if not category:
+            return self.pool
+        return self.pools_by_category.get(category) or SamplingPool()
+    
+    def count(self, category: Optional[str] = None) -> int:
+        """단어 수 (category가 주어지면 해당 카테고리만)"""
+        return len(self._pool(category))
+    
+    def choice(self, category: Optional[str] = None, rng: random.Random = random) -> Optional[str]:
+        """무작위 단어 하나 (없으면 None)"""
+        pool = self._pool(category)
+        return pool.choice(rng) if pool else None
+    
+    def sample(self, k: int, exclude: Collection[str] = (), category: Optional[str] = None,
+               rng: random.Random = random) -> List[str]:
+        """exclude에 없는 서로 다른 무작위 단어 k개 (단어가 모자라면 있는 만큼)"""
+        return self._pool(category).sample(k, exclude, rng)
+
+class DueQueue(WordIndex):
+    """
+    간격 반복 복습 대기열 (다음 복습 시각이 이른 순)
+    
+    복습 일정이 있는 단어는 (복습 시각, 단어) 최소 힙에 두고, 일정이 바뀌면 새 항목을 넣은 뒤
+    이전 항목은 꺼낼 때 버림 (지연 삭제). 다음 문제 꺼내기와 결과 반영 모두 O(log n)임.
+    아직 풀어 보지 않은 단어는 무작위 추출용 배열에 따로 둠
+    """
+    
+    def __init__(self):
+        self.due: Dict[str, int] = {}  # {단어: 다음 복습 시각} (일정이 있는 단어)
+        self.word_categories: Dict[str, str] = {}  # {단어: 카테고리} (단어장에 있는 단어)
+        self.heap: List[Tuple[int, str]] = []
+        self.heaps_by_category: Dict[str, List[Tuple[int, str]]] = {}
+        self.new_words = WordPool()  # 일정이 없는 단어
+    
+    def clear(self) -> None:
+        self.due = {}
+        self.word_categories = {}
+        self.heap = []
+        self.heaps_by_category = {}
+        self.new_words = WordPool()
+    
+    def _push(self, word: str) -> None:
+        entry = (self.due[word], word)
+        heapq.heappush(self.heap, entry)
+        heapq.heappush(self.heaps_by_category.setdefault(self.word_categories[word], []), entry)
+        if len(self.heap) > 2 * len(self.due) + 64:
+            # 버려진 항목이 너무 많이 쌓이면 힙을 새로 만듦
+            self._compact()
+    
+    def _compact(self) -> None:
+        """유효한 항목만으로 힙 다시 만들기"""
+        self.heap = []
+        self.heaps_by_category = {}
+        for word, due in self.due.items():
+            category = self.word_categories.get(word)
+            if category is None:
+                continue
+            self.heap.append((due, word))
+            self.heaps_by_category.setdefault(category, []).append((due, word))
+        heapq.heapify(self.heap)
+        for heap in self.heaps_by_category.values():
+            heapq.heapify(heap)
+    
+    def _is_current(self, entry: Tuple[int, str], category: Optional[str]) -> bool:
+        due, word = entry
+        if self.due.get(word) != due:
+            return False
+        current = self.word_categories.get(word)
+        return current is not None and (not category or current == category)
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        self.word_categories[word] = data.get("category", "")
+        if word in self.due:
+            self._push(word)
+        else:
+            self.new_words.add(word, data)
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        if self.word_categories.pop(word, None) is None:
+            return
+        # 힙 항목은 꺼낼 때 버림
+        self.new_words.remove(word, data)
+    
+    def set_schedule(self, word: str, schedule: Optional[List]) -> None:
+        category = self.word_categories.get(word)
+        if category is None:
+            # 단어장에 없는 단어는 일정만 기억해 둠 (rebuild 순서와 무관하게 동작)
+            if schedule is None:
+                self.due.pop(word, None)
+            else:
+                self.due[word] = int(schedule[3])
+            return
+        data = {"category": category}
+        if schedule is None:
+            if self.due.pop(word, None) is not None:
+                self.new_words.add(word, data)
+            return
+        if word not in self.due:
+            self.new_words.remove(word, data)
+        self.due[word] = int(schedule[3])
+        self._push(word)
+    
+    def rebuild(self, words: Iterable[Tuple[str, Dict[str, str]]],
+                stats: Iterable[Tuple[str, List[int]]],
+                schedules: Iterable[Tuple[str, List]] = ()) -> None:
+        # 하나씩 넣지 않고 한 번에 힙으로 만듦
+        self.clear()
+        self.due = {word: int(schedule[3]) for word, schedule in schedules}
+        for word, data in words:
+            self.word_categories[word] = data.get("category", "")
+            if word not in self.due:
+                self.new_words.add(word, data)
+        self._compact()
+    
+    def next_due(self, category: Optional[str] = None) -> Optional[Tuple[int, str]]:
+        """
+        복습 시각이 가장 이른 단어
+        
+        Returns:
+            Optional[Tuple[int, str]]: (복습 시각, 영어 단어) (일정이 있는 단어가 없으면 None)
+        """
+        heap = self.heaps_by_category.get(category, []) if category else self.heap
+        while heap and not self._is_current(heap[0], category):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+    
+    def draw(self, k: int, now: float, category: Optional[str] = None,
+             rng: random.Random = random) -> List[str]:
+        """
+        다음에 풀 단어 k개 (단어가 모자라면 있는 만큼)
+        
+        복습 시각이 지난 단어(오래된 순) -> 처음 보는 단어(무작위) -> 곧 복습할 단어 순으로 채움.
+        꺼낸 항목은 다시 넣으므로 답을 제출해 일정이 바뀌기 전까지는 대기열에 그대로 남음
+        
+        Args:
+            k: 단어 수
+            now: 현재 시각 (epoch 초)
+            category: 카테고리 (없으면 전체)
+            rng: 난수 생성기
+        
+        Returns:
+            List[str]: 영어 단어 목록
+        """
+        heap = self.heaps_by_category.get(category, []) if category else self.heap
+        popped: List[Tuple[int, str]] = []
+        seen: Set[str] = set()
+        while heap and len(popped) < k:
+            entry = heapq.heappop(heap)
+            if not self._is_current(entry, category) or entry[1] in seen:
+                continue
+            seen.add(entry[1])
+            popped.append(entry)
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        
+        words = [word for due, word in popped if due <= now]
+        if len(words) < k:
+            words += self.new_words.sample(k - len(words), category=category, rng=rng)
+        if len(words) < k:
+            words += [word for due, word in popped if due > now][:k - len(words)]
+        return words
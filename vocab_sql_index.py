@@ -0,0 +1,485 @@
+"""
+SQLite 저장소용 보조 인덱스 (SQL 조회)
+
+vocab_index의 접두사/카테고리/무작위 추출/약점 순위/복습 대기열과 같은 조회 메서드를 두지만,
+단어를 메모리에 옮겨 두지 않고 SqliteVocabStore 스키마의 인덱스로 바로 조회함.
+데이터베이스가 곧 인덱스이므로 add/remove/rebuild는 아무 일도 하지 않고, 불러올 때도 비용이 없음.
+조회는 저장소 잠금(store.lock)을 잡은 상태에서 수행해야 함
+
+무작위 추출은 COUNT나 OFFSET처럼 단어 수에 비례하는 조회를 쓰지 않도록, 추출 집합마다 단어를
+0부터 빈틈없는 위치(draw_slots)에 두고 크기(draw_counts)를 함께 유지함. 저장소는 단어/통계/복습 일정을
+바꾼 쓰기 트랜잭션 안에서 update_draw_slots를 호출해 해당 단어의 위치를 맞춤.
+추출 집합 (kind, category, bucket):
+    pool / pool*   카테고리별 / 전체 단어
+    new / new*     복습 일정이 없는(처음 보는) 단어
+    weak / weak*   풀어 본 단어, bucket은 정답률 백분율 구간 (구간 순서가 약점 순위 순서)
+    (*가 붙은 전체 집합은 category가 '')
+
+부분 문자열/초성 검색도 메모리 인덱스(NgramIndex/ChoseongIndex)와 같은 조각으로 search_grams 테이블에
+색인하고(update_search_rows), 조각별 단어 수와 한 글자 검색어용 첫 글자 목록을 함께 유지함
+"""
+
+import heapq
+import random
+import sqlite3
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from vocab_index import WordIndex, NgramIndex, ChoseongIndex
+
+DrawGroup = Tuple[str, str, int]  # (kind, category, bucket)
+
+def weakness_bucket(correct: int, wrong: int) -> int:
+    """약점 구간 (정답률 백분율 0~100)"""
+    return correct * 100 // (correct + wrong)
+
+def _draw_groups(category: str, new: bool, correct: Optional[int], wrong: Optional[int]) -> Set[DrawGroup]:
+    """단어가 속하는 추출 집합들"""
+    groups = {("pool", category, 0), ("pool*", "", 0)}
+    if new:
+        groups.update((("new", category, 0), ("new*", "", 0)))
+    if correct is not None and correct + wrong > 0:
+        bucket = weakness_bucket(correct, wrong)
+        groups.update((("weak", category, bucket), ("weak*", "", bucket)))
+    return groups
+
+# 단어마다 추출 집합을 정하는 데 필요한 값 (분류, 처음 보는 단어인지, 맞춘/틀린 횟수)
+_DRAW_SOURCE = ("SELECT w.english, w.category, r.word IS NULL, s.correct, s.wrong FROM words w "
+                "LEFT JOIN review_schedule r ON r.word = w.english "
+                "LEFT JOIN quiz_stats s ON s.word = w.english")
+
+def _group_size(conn: sqlite3.Connection, group: DrawGroup) -> int:
+    row = conn.execute(
+        "SELECT size FROM draw_counts WHERE kind = ? AND category = ? AND bucket = ?", group
+    ).fetchone()
+    return row[0] if row else 0
+
+def update_draw_slots(conn: sqlite3.Connection, word: str) -> None:
+    """
+    단어의 추출 위치를 현재 데이터에 맞춤 (쓰기 트랜잭션 안에서 호출)
+    
+    빠진 집합에서는 마지막 위치의 단어를 빈 위치로 옮기고, 새로 속한 집합에는 끝에 추가함
+    """
+    current = {(kind, category, bucket): slot for kind, category, bucket, slot in conn.execute(
+        "SELECT kind, category, bucket, slot FROM draw_slots WHERE word = ?", (word,)
+    )}
+    row = conn.execute(f"{_DRAW_SOURCE} WHERE w.english = ?", (word,)).fetchone()
+    groups = _draw_groups(*row[1:]) if row else set()
+    for group, slot in current.items():
+        if group in groups:
+            continue
+        last = _group_size(conn, group) - 1
+        conn.execute(
+            "DELETE FROM draw_slots WHERE kind = ? AND category = ? AND bucket = ? AND slot = ?", group + (slot,)
+        )
+        if slot != last:
+            conn.execute(
+                "UPDATE draw_slots SET slot = ? WHERE kind = ? AND category = ? AND bucket = ? AND slot = ?",
+                (slot,) + group + (last,)
+            )
+        if last:
+            conn.execute(
+                "UPDATE draw_counts SET size = ? WHERE kind = ? AND category = ? AND bucket = ?", (last,) + group
+            )
+        else:
+            conn.execute("DELETE FROM draw_counts WHERE kind = ? AND category = ? AND bucket = ?", group)
+    for group in groups:
+        if group in current:
+            continue
+        size = _group_size(conn, group)
+        conn.execute(
+            "INSERT INTO draw_slots (kind, category, bucket, slot, word) VALUES (?, ?, ?, ?, ?)",
+            group + (size, word)
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO draw_counts (kind, category, bucket, size) VALUES (?, ?, ?, ?)",
+            group + (size + 1,)
+        )
+
+def rebuild_draw_slots(conn: sqlite3.Connection) -> None:
+    """추출 위치 전체를 다시 만듦 (쓰기 트랜잭션 안에서 호출, 한꺼번에 가져온 뒤 등)"""
+    conn.execute("DELETE FROM draw_slots")
+    conn.execute("DELETE FROM draw_counts")
+    sizes: Dict[DrawGroup, int] = {}
+    slots = []
+    for english, category, new, correct, wrong in conn.execute(f"{_DRAW_SOURCE} ORDER BY w.rowid").fetchall():
+        for group in _draw_groups(category, new, correct, wrong):
+            slot = sizes.get(group, 0)
+            sizes[group] = slot + 1
+            slots.append(group + (slot, english))
+    conn.executemany("INSERT INTO draw_slots (kind, category, bucket, slot, word) VALUES (?, ?, ?, ?, ?)", slots)
+    conn.executemany("INSERT INTO draw_counts (kind, category, bucket, size) VALUES (?, ?, ?, ?)",
+                     (group + (size,) for group, size in sizes.items()))
+
+# {검색 인덱스 이름: 조각 나누기/순위 규칙을 빌려 올 메모리 인덱스}
+SEARCH_SCHEMES: Dict[str, NgramIndex] = {"search": NgramIndex(), "choseong": ChoseongIndex()}
+
+SearchEntries = Tuple[Set[Tuple[str, str]], Set[Tuple[str, str, int, int]]]
+
+def _search_entries(word: str, data: Optional[Dict[str, str]]) -> SearchEntries:
+    """단어의 ({(인덱스, 조각)}, {(인덱스, 첫 글자, 일치 정도, 단어 길이)}) (data가 None이면 빈 집합)"""
+    grams: Set[Tuple[str, str]] = set()
+    initials: Set[Tuple[str, str, int, int]] = set()
+    if data is None:
+        return grams, initials
+    for kind, scheme in SEARCH_SCHEMES.items():
+        texts = scheme._fields(word, data)
+        grams.update((kind, gram) for gram in scheme._word_grams(texts))
+        initials.update((kind, initial, rank, length) for initial, (rank, length, _) in scheme._initial_entries(word, texts))
+    return grams, initials
+
+def update_search_rows(conn: sqlite3.Connection, word: str, old: Optional[Dict[str, str]],
+                       new: Optional[Dict[str, str]]) -> None:
+    """
+    단어 데이터가 old에서 new로 바뀐 만큼 검색 조각을 고침 (쓰기 트랜잭션 안에서 호출, 없던/지운 단어는 None)
+    """
+    old_grams, old_initials = _search_entries(word, old)
+    new_grams, new_initials = _search_entries(word, new)
+    removed = list(old_grams - new_grams)
+    added = list(new_grams - old_grams)
+    conn.executemany("DELETE FROM search_grams WHERE kind = ? AND gram = ? AND word = ?",
+                     (key + (word,) for key in removed))
+    conn.executemany("UPDATE search_gram_counts SET size = size - 1 WHERE kind = ? AND gram = ?", removed)
+    conn.executemany("DELETE FROM search_gram_counts WHERE kind = ? AND gram = ? AND size <= 0", removed)
+    conn.executemany("INSERT INTO search_grams (kind, gram, word) VALUES (?, ?, ?)", (key + (word,) for key in added))
+    conn.executemany(
+        "INSERT INTO search_gram_counts (kind, gram, size) VALUES (?, ?, 1) "
+        "ON CONFLICT (kind, gram) DO UPDATE SET size = size + 1", added
+    )
+    conn.executemany(
+        "DELETE FROM search_initials WHERE kind = ? AND initial = ? AND rank = ? AND length = ? AND word = ?",
+        (entry + (word,) for entry in old_initials - new_initials)
+    )
+    conn.executemany(
+        "INSERT INTO search_initials (kind, initial, rank, length, word) VALUES (?, ?, ?, ?, ?)",
+        (entry + (word,) for entry in new_initials - old_initials)
+    )
+
+def rebuild_search_rows(conn: sqlite3.Connection) -> None:
+    """검색 조각 전체를 다시 만듦 (쓰기 트랜잭션 안에서 호출, 한꺼번에 가져온 뒤 등)"""
+    for table in ("search_grams", "search_gram_counts", "search_initials"):
+        conn.execute(f"DELETE FROM {table}")
+    sizes: Dict[Tuple[str, str], int] = {}
+    grams = []
+    initials = []
+    for english, korean in conn.execute("SELECT english, korean FROM words").fetchall():
+        word_grams, word_initials = _search_entries(english, {"korean": korean})
+        for key in word_grams:
+            sizes[key] = sizes.get(key, 0) + 1
+            grams.append(key + (english,))
+        initials.extend(entry + (english,) for entry in word_initials)
+    conn.executemany("INSERT INTO search_grams (kind, gram, word) VALUES (?, ?, ?)", grams)
+    conn.executemany("INSERT INTO search_gram_counts (kind, gram, size) VALUES (?, ?, ?)",
+                     (key + (size,) for key, size in sizes.items()))
+    conn.executemany("INSERT INTO search_initials (kind, initial, rank, length, word) VALUES (?, ?, ?, ?, ?)",
+                     initials)
+
+class SqlIndex(WordIndex):
+    """SQL로 조회하는 인덱스 공통 부분 (변경은 데이터베이스에 이미 반영되어 있음)"""
+    
+    def __init__(self, connect: Callable[[], sqlite3.Connection]):
+        """
+        Args:
+            connect: 현재 스레드의 데이터베이스 연결을 돌려주는 함수
+        """
+        self.connect = connect
+    
+    def clear(self) -> None:
+        pass
+    
+    def add(self, word: str, data: Dict[str, str]) -> None:
+        pass
+    
+    def remove(self, word: str, data: Dict[str, str]) -> None:
+        pass
+    
+    def rebuild(self, words: Iterable[Tuple[str, Dict[str, str]]],
+                stats: Iterable[Tuple[str, List[int]]],
+                schedules: Iterable[Tuple[str, List]] = ()) -> None:
+        pass
+    
+    def _column(self, sql: str, params: Tuple = ()) -> List:
+        """첫 번째 열 목록"""
+        return [row[0] for row in self.connect().execute(sql, params)]
+    
+    def _scalar(self, sql: str, params: Tuple = ()) -> Any:
+        """첫 번째 행의 첫 번째 값"""
+        return self.connect().execute(sql, params).fetchone()[0]
+    
+    def _size(self, group: DrawGroup) -> int:
+        """추출 집합의 단어 수"""
+        return _group_size(self.connect(), group)
+    
+    def _slot(self, group: DrawGroup, slot: int) -> Optional[str]:
+        """추출 집합의 slot번째 단어"""
+        row = self.connect().execute(
+            "SELECT word FROM draw_slots WHERE kind = ? AND category = ? AND bucket = ? AND slot = ?", group + (slot,)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def _members(self, group: DrawGroup) -> List[str]:
+        """추출 집합의 모든 단어 (작은 집합에만 사용)"""
+        return self._column("SELECT word FROM draw_slots WHERE kind = ? AND category = ? AND bucket = ?", group)
+
+class SqlPrefixIndex(SqlIndex):
+    """영어 단어 자동 완성/사전 순 순회 (words 기본 키 사용, PrefixIndex와 같은 조회)"""
+    
+    def iter_from(self, after: Optional[str] = None) -> Iterator[str]:
+        """after 다음 단어부터 사전 순으로 순회 (after가 없으면 처음부터)"""
+        if after is None:
+            cursor = self.connect().execute("SELECT english FROM words ORDER BY english")
+        else:
+            cursor = self.connect().execute(
+                "SELECT english FROM words WHERE english > ? ORDER BY english", (after,)
+            )
+        for row in cursor:
+            yield row[0]
+    
+    def complete(self, prefix: str, limit: int = 10,
+                 accept: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """접두사로 시작하는 단어 (사전 순, 최대 limit개)"""
+        results = []
+        if limit <= 0:
+            return results
+        cursor = self.connect().execute(
+            "SELECT english FROM words WHERE english >= ? ORDER BY english", (prefix,)
+        )
+        for (word,) in cursor:
+            if not word.startswith(prefix):
+                break
+            if accept is None or accept(word):
+                results.append(word)
+                if len(results) >= limit:
+                    break
+        return results
+
+class SqlCategoryIndex(SqlIndex):
+    """카테고리별 단어 목록과 개수 (idx_words_category_english 사용, CategoryIndex와 같은 조회)"""
+    
+    def words(self, category: str) -> List[str]:
+        """카테고리의 단어 목록 (추가된 순서)"""
+        return self._column("SELECT english FROM words WHERE category = ? ORDER BY rowid", (category,))
+    
+    def count(self, category: str) -> int:
+        """카테고리의 단어 수"""
+        return self._size(("pool", category, 0))
+    
+    def categories(self) -> List[str]:
+        """비어 있지 않은 카테고리 목록 (정렬됨)"""
+        return sorted({category.strip() for category in self._column("SELECT DISTINCT category FROM words")
+                       if category.strip()})
+    
+    def iter_from(self, category: str, after: Optional[str] = None) -> Iterator[str]:
+        """카테고리 안에서 after 다음 단어부터 사전 순으로 순회"""
+        if after is None:
+            cursor = self.connect().execute(
+                "SELECT english FROM words WHERE category = ? ORDER BY english", (category,)
+            )
+        else:
+            cursor = self.connect().execute(
+                "SELECT english FROM words WHERE category = ? AND english > ? ORDER BY english",
+                (category, after)
+            )
+        for row in cursor:
+            yield row[0]
+
+class SqlWordPool(SqlIndex):
+    """
+    전체/카테고리별 무작위 단어 추출 (WordPool과 같은 조회)
+    
+    추출 집합의 크기와 무작위 위치 하나만 읽으므로 단어 수와 상관없이 O(log n)임
+    """
+    
+    @staticmethod
+    def _group(category: Optional[str]) -> DrawGroup:
+        return ("pool", category, 0) if category else ("pool*", "", 0)
+    
+    def count(self, category: Optional[str] = None) -> int:
+        """단어 수 (category가 주어지면 해당 카테고리만)"""
+        return self._size(self._group(category))
+    
+    def choice(self, category: Optional[str] = None, rng: random.Random = random) -> Optional[str]:
+        """무작위 단어 하나 (없으면 None)"""
+        group = self._group(category)
+        size = self._size(group)
+        return self._slot(group, rng.randrange(size)) if size else None
+    
+    def sample(self, k: int, exclude: Collection[str] = (), category: Optional[str] = None,
+               rng: random.Random = random) -> List[str]:
+        """exclude에 없는 서로 다른 무작위 단어 k개 (단어가 모자라면 있는 만큼)"""
+        if k <= 0:
+            return []
+        group = self._group(category)
+        total = self._size(group)
+        if total - len(exclude) <= 2 * k:
+            # 단어가 적으면 전부 읽어서 뽑음
+            candidates = [word for word in self._members(group) if word not in exclude]
+            return rng.sample(candidates, min(k, len(candidates)))
+        picked: List[str] = []
+        seen = set(exclude)
+        while len(picked) < k:
+            word = self._slot(group, rng.randrange(total))
+            if word is None:
+                break
+            if word not in seen:
+                seen.add(word)
+                picked.append(word)
+        return picked
+
+class SqlWeaknessIndex(SqlIndex):
+    """
+    틀린 단어 집중 학습용 약점 순위 (WeaknessIndex와 같은 조회)
+    
+    풀어 본 단어를 정답률 백분율 구간별 추출 집합에 나눠 두고, 구간 크기를 낮은 정답률부터 더해
+    순위 위치가 속한 구간을 찾음. 구간 안에서는 순위 대신 추출 위치 순서를 쓰므로
+    하위 50% 경계가 걸친 구간에서만 메모리 인덱스와 뽑히는 단어가 다를 수 있음
+    """
+    
+    def _buckets(self, category: Optional[str]) -> Tuple[str, str, List[Tuple[int, int]]]:
+        """(kind, category, 정답률 낮은 순 [(구간, 단어 수)])"""
+        kind, category = ("weak", category) if category else ("weak*", "")
+        rows = self.connect().execute(
+            "SELECT bucket, size FROM draw_counts WHERE kind = ? AND category = ? ORDER BY bucket", (kind, category)
+        ).fetchall()
+        return kind, category, rows
+    
+    @staticmethod
+    def _locate(buckets: List[Tuple[int, int]], position: int) -> Tuple[int, int]:
+        """순위 위치 -> (구간, 구간 안의 위치)"""
+        for bucket, size in buckets:
+            if position < size:
+                return bucket, position
+            position -= size
+        raise IndexError(position)
+    
+    def count(self, category: Optional[str] = None) -> int:
+        """풀어 본 단어 수 (category가 주어지면 해당 카테고리만)"""
+        return sum(size for _, size in self._buckets(category)[2])
+    
+    def draw(self, category: Optional[str] = None, rng: random.Random = random) -> Optional[str]:
+        """약점 단어 하나 뽑기 (순위 하위 50% 중에서 무작위, 풀어 본 단어가 없으면 None)"""
+        return next(iter(self.sample(1, category, rng)), None)
+    
+    def sample(self, k: int, category: Optional[str] = None, rng: random.Random = random) -> List[str]:
+        """서로 다른 약점 단어 k개 (순위 하위 50%가 모자라면 있는 만큼)"""
+        kind, group_category, buckets = self._buckets(category)
+        total = sum(size for _, size in buckets)
+        if not total or k <= 0:
+            return []
+        bottom = max(1, total // 2)
+        words = []
+        for position in rng.sample(range(bottom), min(k, bottom)):
+            bucket, slot = self._locate(buckets, position)
+            word = self._slot((kind, group_category, bucket), slot)
+            if word is not None:
+                words.append(word)
+        return words
+
+class SqlDueQueue(SqlIndex):
+    """
+    간격 반복 복습 대기열 (DueQueue와 같은 조회)
+    
+    복습 일정이 있는 단어는 idx_schedule_due(다음 복습 시각, 단어) 순서대로 읽고,
+    아직 풀어 보지 않은 단어는 일정이 없는 단어의 추출 집합에서 무작위 위치로 뽑음
+    """
+    
+    def _scheduled(self, limit: int, category: Optional[str]) -> List[Tuple[int, str]]:
+        """복습 시각이 이른 순서의 (복습 시각, 단어) limit개 (단어장에 있는 단어만)"""
+        sql = "SELECT r.due, r.word FROM review_schedule r JOIN words w ON w.english = r.word"
+        params: Tuple = ()
+        if category:
+            sql += " WHERE w.category = ?"
+            params = (category,)
+        return [tuple(row) for row in self.connect().execute(
+            f"{sql} ORDER BY r.due, r.word LIMIT ?", params + (limit,)
+        )]
+    
+    def next_due(self, category: Optional[str] = None) -> Optional[Tuple[int, str]]:
+        """복습 시각이 가장 이른 (복습 시각, 영어 단어) (일정이 있는 단어가 없으면 None)"""
+        rows = self._scheduled(1, category)
+        return rows[0] if rows else None
+    
+    def _sample_new(self, k: int, category: Optional[str], rng: random.Random) -> List[str]:
+        """복습 일정이 없는 서로 다른 무작위 단어 k개"""
+        group = ("new", category, 0) if category else ("new*", "", 0)
+        size = self._size(group)
+        slots = rng.sample(range(size), min(k, size))
+        return [word for word in (self._slot(group, slot) for slot in slots) if word is not None]
+    
+    def draw(self, k: int, now: float, category: Optional[str] = None,
+             rng: random.Random = random) -> List[str]:
+        """
+        다음에 풀 단어 k개 (단어가 모자라면 있는 만큼)
+        
+        복습 시각이 지난 단어(오래된 순) -> 처음 보는 단어(무작위) -> 곧 복습할 단어 순으로 채움
+        """
+        if k <= 0:
+            return []
+        scheduled = self._scheduled(k, category)
+        words = [word for due, word in scheduled if due <= now]
+        if len(words) < k:
+            words += self._sample_new(k - len(words), category, rng)
+        if len(words) < k:
+            words += [word for due, word in scheduled if due > now][:k - len(words)]
+        return words
+
+class SqlSearchIndex(SqlIndex):
+    """
+    부분 문자열/초성 검색 (NgramIndex/ChoseongIndex와 같은 조회와 순위)
+    
+    검색어 조각 중 단어 수가 가장 적은 조각의 단어를 차례로 읽으면서 나머지 조각은 기본 키로 확인하고,
+    실제 포함 여부와 일치 정도는 메모리 인덱스와 같은 규칙으로 계산함
+    """
+    
+    def __init__(self, connect: Callable[[], sqlite3.Connection], kind: str = "search"):
+        super().__init__(connect)
+        self.kind = kind
+        self.scheme = SEARCH_SCHEMES[kind]
+    
+    def search(self, query: str, limit: int = 20,
+               accept: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """부분 문자열 검색 (순위가 높은 순서의 영어 단어 목록, NgramIndex.search 참고)"""
+        query = query.strip().lower()
+        if not query or limit <= 0:
+            return []
+        conn = self.connect()
+        
+        grams = self.scheme._query_grams(query)
+        if not grams:
+            # 조각으로 색인하지 않는 한 글자 검색어: 순위대로 정렬된 첫 글자 목록에서 limit개만 꺼냄
+            results = []
+            for (word,) in conn.execute(
+                "SELECT word FROM search_initials WHERE kind = ? AND initial = ? ORDER BY rank, length, word",
+                (self.kind, query)
+            ):
+                if accept is None or accept(word):
+                    results.append(word)
+                    if len(results) >= limit:
+                        break
+            return results
+        
+        sizes = []
+        for gram in grams:
+            row = conn.execute(
+                "SELECT size FROM search_gram_counts WHERE kind = ? AND gram = ?", (self.kind, gram)
+            ).fetchone()
+            if row is None:
+                return []
+            sizes.append((row[0], gram))
+        sizes.sort()
+        rest = [gram for _, gram in sizes[1:]]
+        sql = ("SELECT w.english, w.korean FROM search_grams g JOIN words w ON w.english = g.word "
+               "WHERE g.kind = ? AND g.gram = ?")
+        sql += " AND EXISTS (SELECT 1 FROM search_grams WHERE kind = ? AND gram = ? AND word = g.word)" * len(rest)
+        params: List[str] = [self.kind, sizes[0][1]]
+        for gram in rest:
+            params += [self.kind, gram]
+        
+        ranked = []
+        for word, korean in conn.execute(sql, params).fetchall():
+            ranks = [r for r in (self.scheme._match_rank(query, text)
+                                 for text in self.scheme._fields(word, {"korean": korean}))
+                     if r is not None]
+            if not ranks or (accept is not None and not accept(word)):
+                continue
+            ranked.append((min(ranks), len(word), word))
+        return [word for _, _, word in heapq.nsmallest(limit, ranked)]
@@ -0,0 +1,52 @@
+"""
+간격 반복 학습 (SM-2) 복습 일정 계산
+
+단어마다 [반복 횟수, 간격(일), 난이도 계수(ease), 다음 복습 시각(epoch 초)]을 두고
+퀴즈 결과가 나올 때마다 다음 복습 시각을 다시 정함.
+저장소는 결과와 함께 기록한 시각으로 계산하므로 저널을 다시 재생해도 같은 일정이 나옴
+"""
+
+from typing import List, Optional
+
+# 처음 보는 단어의 난이도 계수와 최솟값
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# 연속으로 맞춘 첫 번째, 두 번째 복습 간격 (일)
+FIRST_INTERVAL_DAYS = 1
+SECOND_INTERVAL_DAYS = 6
+# 복습 간격 상한 (일): 계속 맞춰도 다음 복습 시각이 SQLite INTEGER 범위를 넘지 않게 함
+MAX_INTERVAL_DAYS = 36500
+# 틀린 단어를 다시 낼 때까지의 시간 (초)
+RELEARN_SECONDS = 600
+# 정답/오답을 SM-2 응답 품질(0~5)로 바꾼 값
+CORRECT_QUALITY = 4
+WRONG_QUALITY = 1
+DAY_SECONDS = 86400
+
+def next_schedule(schedule: Optional[List], is_correct: bool, now: float) -> List:
+    """
+    퀴즈 결과로 다음 복습 일정 계산 (SM-2)
+    
+    Args:
+        schedule: 현재 일정 [반복 횟수, 간격(일), 난이도 계수, 다음 복습 시각] (처음이면 None)
+        is_correct: 정답 여부
+        now: 결과를 기록한 시각 (epoch 초)
+    
+    Returns:
+        List: 새 일정
+    """
+    reps, interval, ease = (schedule[0], schedule[1], schedule[2]) if schedule else (0, 0, DEFAULT_EASE)
+    quality = CORRECT_QUALITY if is_correct else WRONG_QUALITY
+    ease = max(MIN_EASE, round(ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02), 2))
+    
+    if not is_correct:
+        # 처음부터 다시 외우고 잠시 뒤에 다시 냄
+        return [0, 0, ease, int(now) + RELEARN_SECONDS]
+    
+    if reps == 0:
+        interval = FIRST_INTERVAL_DAYS
+    elif reps == 1:
+        interval = SECOND_INTERVAL_DAYS
+    else:
+        interval = min(MAX_INTERVAL_DAYS, max(1, round(interval * ease)))
+    return [reps + 1, interval, ease, int(now) + interval * DAY_SECONDS]
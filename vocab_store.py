@@ -0,0 +1,1784 @@
+"""
+단어장 저장소 (Storage backends)
+
+web_vocab_app.py의 모든 라우트는 VocabStore 인터페이스를 통해서만 데이터에 접근함
+
+- VocabStore: 저장소 공통 인터페이스
+- JsonVocabStore: vocabulary.json / quiz_stats.json 스냅샷 + 퀴즈 결과 저널
+- SqliteVocabStore: SQLite (WAL 모드), 변경은 한 행 단위로 기록
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import logging
+import threading
+import time
+import uuid
+from array import array
+from collections.abc import Mapping
+from contextlib import contextmanager
+from typing import Any, Dict, List, Set, Tuple, Optional, Iterator, Sequence
+
+from vocab_index import WordIndex, CategoryIndex
+from vocab_sql_index import (SqlIndex, SqlCategoryIndex, SqlDueQueue, SqlPrefixIndex, SqlSearchIndex, SqlWeaknessIndex,
+                             SqlWordPool, rebuild_draw_slots, rebuild_search_rows, update_draw_slots, update_search_rows)
+from vocab_srs import next_schedule
+
+try:
+    import fcntl  # 워커(프로세스) 간 파일 잠금 (Windows에는 없음)
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+class WordRecord(Mapping):
+    """
+    단어 데이터 (뜻, 카테고리)
+    
+    단어마다 dict를 두지 않고 __slots__ 객체 하나만 두며, 카테고리 문자열은 intern해
+    같은 카테고리의 단어들이 문자열 하나를 공유함. 기존 코드와 호환되도록
+    읽기 전용 dict처럼 data["korean"], data.get("category", "")로도 읽을 수 있음
+    """
+    
+    __slots__ = ("korean", "category")
+    
+    def __init__(self, korean: str, category: str = ""):
+        self.korean = korean
+        self.category = sys.intern(category)
+    
+    def __getitem__(self, key: str) -> str:
+        if key == "korean":
+            return self.korean
+        if key == "category":
+            return self.category
+        raise KeyError(key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "korean":
+            return self.korean
+        if key == "category":
+            return self.category
+        return default
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(("korean", "category"))
+    
+    def __len__(self) -> int:
+        return 2
+    
+    def __repr__(self) -> str:
+        return f"WordRecord({self.korean!r}, {self.category!r})"
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {"korean": self.korean, "category": self.category}
+
+def json_default(value: Any) -> Any:
+    """json.dump의 default: WordRecord를 dict로 바꿈"""
+    if isinstance(value, WordRecord):
+        return value.to_dict()
+    raise TypeError(f"JSON으로 바꿀 수 없는 값: {type(value).__name__}")
+
+class Transaction:
+    """
+    저장소 변경 묶음
+    
+    with store.transaction() 블록 안의 변경은 블록을 벗어날 때 한 번에 저장됨
+    """
+    
+    def __init__(self, durable: bool = False):
+        self.durable = durable  # deferred 모드에서 디스크 기록까지 대기할지 여부
+        self.ok = True  # 저장 성공 여부
+        self.changed = False
+        self.ops: List[Dict] = []  # 변경 레코드 (json 저장소: 저널, sqlite 저장소: 변경 로그)
+        self.generation = 0  # deferred 모드에서 대기할 세대 번호
+
+class VocabStore:
+    """
+    단어장/통계 저장소 공통 인터페이스
+    
+    단어 데이터는 WordRecord(뜻, 카테고리), 통계는 [맞춘 횟수, 틀린 횟수],
+    복습 일정은 [반복 횟수, 간격(일), 난이도 계수, 다음 복습 시각] 형태 (vocab_srs 참고)
+    """
+    
+    def __init__(self):
+        # 변경과 스냅샷 캡처를 직렬화하는 잠금
+        self.lock = threading.RLock()
+        self._local = threading.local()
+        # 변경에 맞춰 갱신되는 보조 인덱스 {이름: 인덱스}
+        self.indexes: Dict[str, WordIndex] = {}
+        # 카테고리별 단어 목록/개수 (모든 저장소에 기본으로 둠)
+        self.category_index = CategoryIndex()
+        self.indexes["category"] = self.category_index
+        # 데이터를 통째로 다시 불러온 뒤 아직 다시 만들지 않은 인덱스 이름
+        self._stale_indexes: Set[str] = set(self.indexes)
+        # 응답 캐시(ETag)용 버전: 단어장/통계가 바뀔 때마다 증가
+        self.vocab_version = 0
+        self.stats_version = 0
+        self._version_epoch = uuid.uuid4().hex[:8]
+    
+    # ---- 생명주기 ----
+    def load(self) -> None:
+        """저장된 데이터 불러오기"""
+        raise NotImplementedError
+    
+    def save(self) -> bool:
+        """전체 데이터를 즉시 저장"""
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """남은 변경을 기록하고 자원 정리"""
+    
+    # ---- 트랜잭션 ----
+    @contextmanager
+    def transaction(self, durable: bool = False) -> Iterator[Transaction]:
+        """
+        변경 묶음 시작 (중첩 호출 시 바깥 트랜잭션에 합류)
+        
+        확인 후 변경(check-then-act)이 다른 요청과 섞이지 않도록 잠금을 잡고,
+        블록을 벗어날 때 저장함. durable 대기는 잠금을 푼 뒤에 수행함
+        
+        Args:
+            durable: 디스크에 기록될 때까지 대기할지 여부
+        
+        Yields:
+            Transaction: 블록이 끝난 뒤 txn.ok로 저장 성공 여부 확인
+        """
+        outer = getattr(self._local, 'txn', None)
+        if outer is not None:
+            outer.durable = outer.durable or durable
+            yield outer
+            return
+        
+        txn = Transaction(durable)
+        self._local.txn = txn
+        try:
+            with self.lock:
+                self._begin(txn)
+                try:
+                    yield txn
+                except BaseException:
+                    self._abort(txn)
+                    raise
+                self._commit(txn)
+        finally:
+            self._local.txn = None
+        
+        if txn.changed and txn.durable:
+            txn.ok = self._wait_durable(txn) and txn.ok
+    
+    def _begin(self, txn: Transaction) -> None:
+        """트랜잭션 시작 (잠금을 잡은 상태)"""
+    
+    def _commit(self, txn: Transaction) -> None:
+        """트랜잭션 변경 저장 (잠금을 잡은 상태)"""
+    
+    def _abort(self, txn: Transaction) -> None:
+        """예외로 끝난 트랜잭션 정리 (잠금을 잡은 상태)"""
+    
+    def _wait_durable(self, txn: Transaction) -> bool:
+        """트랜잭션 변경이 디스크에 기록될 때까지 대기 (잠금 밖)"""
+        return True
+    
+    def refresh(self) -> bool:
+        """
+        다른 워커(프로세스)가 저장한 변경이 있으면 반영
+        
+        Returns:
+            bool: 변경이 있었는지 여부
+        """
+        return False
+    
+    # ---- 데이터 버전 ----
+    def data_version(self) -> Tuple[str, int, int]:
+        """
+        현재 데이터 버전
+        
+        기준 문자열이 같을 때만 버전 번호를 비교할 수 있음. 메모리에 데이터를 두는 저장소는
+        워커(프로세스)마다 따로 세므로 기준 문자열에 프로세스 번호를 넣음
+        
+        Returns:
+            Tuple[str, int, int]: (기준, 단어장 버전, 통계 버전)
+        """
+        return (f"{self._version_epoch}.{os.getpid()}", self.vocab_version, self.stats_version)
+    
+    def _bump_versions(self, vocab: bool, stats: bool) -> None:
+        if vocab:
+            self.vocab_version += 1
+        if stats:
+            self.stats_version += 1
+    
+    # ---- 보조 인덱스 ----
+    def add_index(self, name: str, index: WordIndex) -> WordIndex:
+        """인덱스 등록 (다음 조회 때 전체 데이터로 채워짐)"""
+        with self.lock:
+            self.indexes[name] = index
+            self._stale_indexes.add(name)
+        return index
+    
+    def get_index(self, name: str) -> WordIndex:
+        """
+        최신 상태의 인덱스 (잠금을 잡은 상태에서 호출)
+        
+        데이터를 다시 불러온 뒤 그 인덱스를 처음 조회할 때만 전체를 다시 만듦
+        """
+        self.ensure_indexes(name)
+        return self.indexes[name]
+    
+    def ensure_indexes(self, *names: str) -> None:
+        """필요하면 인덱스를 다시 만들기 (이름을 주지 않으면 모든 인덱스)"""
+        with self.lock:
+            for name in names or list(self.indexes):
+                if name in self._stale_indexes:
+                    self.indexes[name].rebuild(self.iter_words(), self.iter_stats(), self.iter_schedules())
+                    self._stale_indexes.discard(name)
+    
+    def _invalidate_indexes(self) -> None:
+        """모든 인덱스를 다음 조회 때 다시 만들도록 표시"""
+        self._stale_indexes = set(self.indexes)
+    
+    def _live_indexes(self) -> List[WordIndex]:
+        """변경을 하나씩 반영해야 하는 (이미 만들어진) 인덱스"""
+        return [index for name, index in self.indexes.items() if name not in self._stale_indexes]
+    
+    def _index_put(self, word: str, old: Optional[WordRecord], data: WordRecord) -> None:
+        """단어 추가/수정을 인덱스에 반영"""
+        for index in self._live_indexes():
+            if old is not None:
+                index.remove(word, old)
+            index.add(word, data)
+    
+    def _index_remove(self, word: str, old: Optional[WordRecord]) -> None:
+        """단어와 통계 삭제를 인덱스에 반영"""
+        if old is None:
+            return
+        for index in self._live_indexes():
+            index.remove(word, old)
+            index.set_stats(word, None)
+            index.set_schedule(word, None)
+    
+    def _index_stats(self, word: str, stats: Optional[List[int]]) -> None:
+        """통계 변경을 인덱스에 반영"""
+        for index in self._live_indexes():
+            index.set_stats(word, stats)
+    
+    def _index_schedule(self, word: str, schedule: Optional[List]) -> None:
+        """복습 일정 변경을 인덱스에 반영"""
+        for index in self._live_indexes():
+            index.set_schedule(word, schedule)
+    
+    # ---- 단어 조회 ----
+    def __len__(self) -> int:
+        raise NotImplementedError
+    
+    def __contains__(self, word: str) -> bool:
+        raise NotImplementedError
+    
+    def get_word(self, word: str) -> Optional[WordRecord]:
+        """단어 데이터 조회 (없으면 None)"""
+        raise NotImplementedError
+    
+    def iter_words(self, category: Optional[str] = None) -> Iterator[Tuple[str, WordRecord]]:
+        """(단어, 데이터) 순회 (category가 주어지면 해당 카테고리만)"""
+        raise NotImplementedError
+    
+    def list_words(self, category: Optional[str] = None) -> List[str]:
+        """영어 단어 목록 (category가 주어지면 해당 카테고리만)"""
+        return [word for word, _ in self.iter_words(category)]
+    
+    def count_words(self, category: Optional[str] = None) -> int:
+        """단어 수 (category가 주어지면 해당 카테고리만)"""
+        if not category:
+            return len(self)
+        return sum(1 for _ in self.iter_words(category))
+    
+    def categories(self) -> List[str]:
+        """비어 있지 않은 카테고리 목록 (정렬됨)"""
+        raise NotImplementedError
+    
+    # ---- 단어 변경 (트랜잭션 안에서 호출) ----
+    def add_word(self, word: str, korean: str, category: str) -> None:
+        """단어 추가 (이미 있으면 덮어씀)"""
+        raise NotImplementedError
+    
+    def update_word(self, word: str, new_word: str, korean: str, category: str) -> None:
+        """단어 수정 (영어 단어가 바뀌면 통계도 이전)"""
+        raise NotImplementedError
+    
+    def delete_word(self, word: str) -> None:
+        """단어와 통계 삭제"""
+        raise NotImplementedError
+    
+    # ---- 통계 ----
+    def get_stats(self, word: str) -> Optional[List[int]]:
+        """단어의 [맞춘 횟수, 틀린 횟수] (기록이 없으면 None)"""
+        raise NotImplementedError
+    
+    def iter_stats(self) -> Iterator[Tuple[str, List[int]]]:
+        """(단어, [맞춘 횟수, 틀린 횟수]) 순회"""
+        raise NotImplementedError
+    
+    def stats_count(self) -> int:
+        """통계 기록이 있는 단어 수"""
+        raise NotImplementedError
+    
+    def stats_columns(self) -> Tuple[List[str], Sequence[int], Sequence[int]]:
+        """
+        통계를 열 단위로 가져오기 (iter_stats와 같은 순서)
+        
+        Returns:
+            Tuple[List[str], Sequence[int], Sequence[int]]: (단어 목록, 맞춘 횟수 열, 틀린 횟수 열)
+        """
+        words: List[str] = []
+        correct = array('I')
+        wrong = array('I')
+        for word, stats in self.iter_stats():
+            words.append(word)
+            correct.append(stats[0])
+            wrong.append(stats[1])
+        return words, correct, wrong
+    
+    def record_result(self, word: str, is_correct: bool, now: Optional[float] = None) -> List[int]:
+        """
+        퀴즈 결과 반영 (복습 일정도 다시 계산)
+        
+        Args:
+            word: 영어 단어
+            is_correct: 정답 여부
+            now: 결과 시각 (epoch 초, 기본은 현재 시각)
+        
+        Returns:
+            List[int]: 갱신된 [맞춘 횟수, 틀린 횟수]
+        """
+        raise NotImplementedError
+    
+    # ---- 복습 일정 ----
+    def get_schedule(self, word: str) -> Optional[List]:
+        """단어의 복습 일정 (풀어 본 적이 없으면 None)"""
+        raise NotImplementedError
+    
+    def iter_schedules(self) -> Iterator[Tuple[str, List]]:
+        """(단어, 복습 일정) 순회"""
+        raise NotImplementedError
+
+class StatsTable:
+    """
+    퀴즈 통계 열 저장소
+    
+    단어마다 [맞춘 횟수, 틀린 횟수] 리스트를 두지 않고, 단어 -> 위치 색인과
+    array('I') 두 열에 나눠 담음 (항목당 정수 두 개 8바이트). 삭제한 위치는 비워 두고
+    빈 위치가 절반을 넘으면 압축하므로 위치 순서가 항상 추가 순서와 같음
+    """
+    
+    def __init__(self):
+        self.slots: Dict[str, int] = {}  # {단어: 위치}
+        self.words: List[Optional[str]] = []  # 위치별 단어 (삭제된 위치는 None)
+        self.correct = array('I')
+        self.wrong = array('I')
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[int]]) -> "StatsTable":
+        """{단어: [맞춘 횟수, 틀린 횟수]}에서 만들기"""
+        table = cls()
+        for word, stats in data.items():
+            table.put(word, stats)
+        return table
+    
+    def to_dict(self) -> Dict[str, List[int]]:
+        """{단어: [맞춘 횟수, 틀린 횟수]} (JSON 스냅샷용)"""
+        return {word: [self.correct[slot], self.wrong[slot]] for word, slot in self.slots.items()}
+    
+    def __len__(self) -> int:
+        return len(self.slots)
+    
+    def __contains__(self, word: str) -> bool:
+        return word in self.slots
+    
+    def get(self, word: str) -> Optional[List[int]]:
+        slot = self.slots.get(word)
+        if slot is None:
+            return None
+        return [self.correct[slot], self.wrong[slot]]
+    
+    def put(self, word: str, stats: List[int]) -> None:
+        """통계 설정 (이미 있으면 위치를 유지한 채 덮어씀)"""
+        slot = self.slots.get(word)
+        if slot is None:
+            self.slots[word] = len(self.words)
+            self.words.append(word)
+            self.correct.append(stats[0])
+            self.wrong.append(stats[1])
+        else:
+            self.correct[slot] = stats[0]
+            self.wrong[slot] = stats[1]
+    
+    def increment(self, word: str, is_correct: bool) -> List[int]:
+        """
+        맞춘/틀린 횟수 1 증가 (기록이 없으면 새로 만듦)
+        
+        Returns:
+            List[int]: 갱신된 [맞춘 횟수, 틀린 횟수]
+        """
+        slot = self.slots.get(word)
+        if slot is None:
+            self.put(word, [0, 0])
+            slot = self.slots[word]
+        if is_correct:
+            self.correct[slot] += 1
+        else:
+            self.wrong[slot] += 1
+        return [self.correct[slot], self.wrong[slot]]
+    
+    def pop(self, word: str) -> Optional[List[int]]:
+        """통계 삭제 (없으면 None)"""
+        slot = self.slots.pop(word, None)
+        if slot is None:
+            return None
+        stats = [self.correct[slot], self.wrong[slot]]
+        self.words[slot] = None
+        self.correct[slot] = 0
+        self.wrong[slot] = 0
+        if len(self.words) > 64 and len(self.slots) * 2 < len(self.words):
+            self._compact()
+        return stats
+    
+    def _compact(self) -> None:
+        """빈 위치를 없애고 열을 다시 채움 (순서 유지)"""
+        live = [slot for slot, word in enumerate(self.words) if word is not None]
+        self.words = [self.words[slot] for slot in live]
+        self.correct = array('I', [self.correct[slot] for slot in live])
+        self.wrong = array('I', [self.wrong[slot] for slot in live])
+        self.slots = {word: slot for slot, word in enumerate(self.words)}
+    
+    def items(self) -> List[Tuple[str, List[int]]]:
+        """(단어, [맞춘 횟수, 틀린 횟수]) 목록 (추가 순서)"""
+        correct, wrong = self.correct, self.wrong
+        return [(word, [correct[slot], wrong[slot]])
+                for slot, word in enumerate(self.words) if word is not None]
+    
+    def columns(self) -> Tuple[List[str], array, array]:
+        """(단어 목록, 맞춘 횟수 열, 틀린 횟수 열) 복사본 (빈 위치 제외)"""
+        if len(self.slots) != len(self.words):
+            self._compact()
+        return list(self.words), array('I', self.correct), array('I', self.wrong)
+
+class JsonVocabStore(VocabStore):
+    """
+    JSON 파일 저장소
+    
+    전체 데이터는 메모리의 dict에 두고 vocabulary.json/quiz_stats.json/복습 일정 스냅샷으로 저장함.
+    모든 변경은 저널(작업 로그)에 한 줄씩 추가하고 일정 개수가 쌓이면 스냅샷으로 압축함
+    
+    여러 워커(프로세스)가 같은 파일을 공유할 수 있도록 쓰기는 파일 잠금 안에서 하고,
+    요청마다 refresh()로 스냅샷/저널의 inode·크기·수정 시각을 확인해
+    다른 워커가 추가한 저널 부분만 이어 읽거나(압축된 경우) 전체를 다시 불러옴
+    """
+    
+    def __init__(self, vocab_file: str, stats_file: str, journal_file: str,
+                 use_journal: bool = True, compact_threshold: int = 1000,
+                 persist_mode: str = 'sync', flush_interval_ms: int = 1000,
+                 flush_max_mutations: int = 500, schedule_file: Optional[str] = None):
+        super().__init__()
+        self.vocab_file = vocab_file
+        self.stats_file = stats_file
+        # 복습 일정 스냅샷 (기본: 통계 파일 이름 뒤에 _schedule)
+        self.schedule_file = schedule_file or "{}_schedule{}".format(*os.path.splitext(stats_file))
+        self.journal_file = journal_file
+        self.lock_file = f"{journal_file}.lock"
+        self.use_journal = use_journal
+        self.compact_threshold = compact_threshold
+        self.persist_mode = persist_mode
+        self.vocabulary: Dict[str, WordRecord] = {}
+        self.quiz_stats = StatsTable()  # 열 단위 통계 (단어 -> 위치 + array 열)
+        self.schedules: Dict[str, List] = {}
+        self.journal_record_count = 0  # 마지막 압축 이후 저널에 쌓인 레코드 수
+        self.flusher = DataFlusher(self, flush_interval_ms, flush_max_mutations)
+        # 변경 감지용: 마지막으로 읽은 스냅샷 상태와 저널 위치
+        self._snapshot_stamp: Optional[Tuple] = None
+        # 읽고 있는 저널을 열어 두면 교체된 뒤에도 inode 번호가 재사용되지 않아 변경 감지가 확실함
+        self._journal_fd: Optional[int] = None
+        self._journal_ino: Optional[int] = None
+        self._journal_offset = 0
+        # 저널 세대: 스냅샷을 쓸 때마다 1씩 늘어 새 저널의 첫 줄에 기록됨 (첫 줄이 없는 저널은 0)
+        self._journal_generation = 0
+        # sync 모드에서 기록에 실패해 메모리에만 있는 변경이 있는지 (있으면 압축을 다른 워커가 따라오지 못함)
+        self._unjournaled = False
+        # 프로세스 간 파일 잠금 (같은 프로세스 안에서는 재진입 가능)
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+    
+    # ---- 생명주기 ----
+    def load(self) -> None:
+        with self._file_lock(exclusive=False):
+            self._reload()
+            self.ensure_indexes()
+    
+    def _reload(self) -> None:
+        """스냅샷을 읽고 저널을 처음부터 재생 (파일 잠금을 잡은 상태)"""
+        self._open_journal()
+        if self._install_snapshot(self._journal_generation):
+            logger.warning("중단된 스냅샷 저장을 마무리했습니다.")
+        self._snapshot_stamp = self._snapshot_stamp_now()
+        self._unjournaled = False
+        self.vocabulary = self._load_vocabulary()
+        self.quiz_stats = self._load_stats()
+        self.schedules = self._load_schedules()
+        self.journal_record_count = 0
+        # 재생하는 동안에는 인덱스를 하나씩 갱신하지 않고 다음 조회 때 다시 만듦
+        self._invalidate_indexes()
+        self._bump_versions(vocab=True, stats=True)
+        # 마지막 스냅샷 이후의 변경 재생
+        applied = self._read_journal()
+        if applied:
+            logger.info(f"저널 재생: {applied}개 기록")
+        # 아직 기록되지 않은 이 워커의 변경 다시 적용 (deferred 모드)
+        for op in self.flusher.pending_ops():
+            self._apply_op(op)
+    
+    def _load_vocabulary(self) -> Dict[str, WordRecord]:
+        vocabulary = {}
+        try:
+            if os.path.exists(self.vocab_file):
+                with open(self.vocab_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    # 기존 형식({word: meaning})과 새 형식({word: {korean, category}}) 호환
+                    for word, value in data.items():
+                        if isinstance(value, str):
+                            # 기존 형식: {word: meaning} -> {word: {korean: meaning, category: ""}}
+                            vocabulary[word] = WordRecord(value)
+                        elif isinstance(value, dict):
+                            # 새 형식: {word: {korean: meaning, category: category}}
+                            vocabulary[word] = WordRecord(value.get("korean", ""), value.get("category", ""))
+                logger.info(f"단어장 불러오기 성공: {len(vocabulary)}개 단어")
+            else:
+                logger.info("단어장 파일이 없습니다. 새로 생성합니다.")
+        except json.JSONDecodeError as e:
+            logger.error(f"단어장 JSON 파싱 오류: {e}")
+            vocabulary = {}
+        except Exception as e:
+            logger.error(f"단어장 불러오기 실패: {e}")
+            vocabulary = {}
+        return vocabulary
+    
+    def _load_stats(self) -> StatsTable:
+        quiz_stats = StatsTable()
+        try:
+            if os.path.exists(self.stats_file):
+                with open(self.stats_file, 'r', encoding='utf-8') as f:
+                    # 항목 형식이 잘못된 파일도 JSON 파싱 오류처럼 빈 통계로 복구
+                    quiz_stats = StatsTable.from_dict(json.load(f))
+                logger.info(f"통계 불러오기 성공: {len(quiz_stats)}개 기록")
+            else:
+                logger.info("통계 파일이 없습니다. 새로 생성합니다.")
+        except json.JSONDecodeError as e:
+            logger.error(f"통계 JSON 파싱 오류: {e}")
+            quiz_stats = StatsTable()
+        except Exception as e:
+            logger.error(f"통계 불러오기 실패: {e}")
+            quiz_stats = StatsTable()
+        return quiz_stats
+    
+    def _load_schedules(self) -> Dict[str, List]:
+        schedules = {}
+        try:
+            if os.path.exists(self.schedule_file):
+                with open(self.schedule_file, 'r', encoding='utf-8') as f:
+                    schedules = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error(f"복습 일정 JSON 파싱 오류: {e}")
+            schedules = {}
+        except Exception as e:
+            logger.error(f"복습 일정 불러오기 실패: {e}")
+            schedules = {}
+        return schedules
+    
+    def save(self) -> bool:
+        try:
+            with self._file_lock(exclusive=True):
+                # 아직 기록되지 않은 변경을 먼저 저널에 내보냄 (잠금 안이므로 그 사이 새 변경이 끼어들지 않음)
+                if self.persist_mode == 'deferred' and not self.flusher.flush():
+                    # 스냅샷에 넣으면 나중에 저널에 다시 기록되어 두 번 반영되므로 저장하지 않음
+                    return False
+                self._sync_from_disk()
+                return self._write_snapshot()
+        except Exception as e:
+            logger.error(f"파일 저장 실패: {e}")
+            return False
+    
+    def close(self) -> None:
+        self.flusher.stop()
+        with self.lock:
+            self._close_journal()
+    
+    # ---- 워커 간 일관성 ----
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """
+        프로세스 간 파일 잠금 (fcntl이 없는 환경에서는 스레드 잠금만 사용)
+        
+        이미 잠금을 잡고 있으면 재진입하며, 바깥 잠금은 항상 안쪽보다 강해야 함
+        """
+        with self.lock:
+            self._acquire_file_lock(exclusive)
+            try:
+                yield
+            finally:
+                self._release_file_lock()
+    
+    def _acquire_file_lock(self, exclusive: bool) -> None:
+        self._lock_depth += 1
+        if self._lock_depth > 1 or fcntl is None:
+            return
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        except BaseException:
+            os.close(fd)
+            self._lock_depth -= 1
+            raise
+        self._lock_fd = fd
+    
+    def _release_file_lock(self) -> None:
+        self._lock_depth -= 1
+        if self._lock_depth > 0 or self._lock_fd is None:
+            return
+        fd, self._lock_fd = self._lock_fd, None
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+    
+    def _snapshot_stamp_now(self) -> Tuple:
+        """스냅샷 파일들의 (inode, 수정 시각, 크기)"""
+        return (_file_stamp(self.vocab_file), _file_stamp(self.stats_file), _file_stamp(self.schedule_file))
+    
+    def _disk_changes(self) -> str:
+        """
+        마지막으로 읽은 이후 디스크 상태 비교
+        
+        Returns:
+            str: 'same'(변경 없음), 'tail'(저널에 추가됨), 'reload'(스냅샷이 바뀜)
+        """
+        if self._snapshot_stamp_now() != self._snapshot_stamp:
+            return 'reload'
+        try:
+            st = os.stat(self.journal_file)
+        except FileNotFoundError:
+            return 'same' if self._journal_fd is None else 'reload'
+        if self._journal_fd is None:
+            return 'tail' if st.st_size > 0 else 'same'
+        if st.st_ino != self._journal_ino or st.st_size < self._journal_offset:
+            return 'reload'
+        if st.st_size > self._journal_offset:
+            return 'tail'
+        return 'same'
+    
+    def _sync_from_disk(self) -> bool:
+        """다른 워커의 변경 반영 (파일 잠금을 잡은 상태)"""
+        changes = self._disk_changes()
+        if changes == 'reload' and self._follow_snapshot():
+            changes = 'tail'
+        if changes == 'reload':
+            logger.info("다른 워커의 저장을 감지해 데이터를 다시 불러옵니다.")
+            self._reload()
+        elif changes == 'tail':
+            self._read_journal()
+        return changes != 'same'
+    
+    def _follow_snapshot(self) -> bool:
+        """
+        다른 워커의 압축을 다시 불러오지 않고 따라감 (파일 잠금을 잡은 상태)
+        
+        새 저널의 머리글에 적힌 이전 세대가 이 워커가 읽던 저널이면, 열어 둔 이전 저널을 압축한 위치까지
+        마저 읽은 메모리가 새 스냅샷과 같으므로 새 저널로만 옮겨 감
+        
+        Returns:
+            bool: 따라갔으면 True, 전체를 다시 불러와야 하면 False
+        """
+        if self._journal_fd is None or self._unjournaled:
+            return False
+        try:
+            fd = os.open(self.journal_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+        header, end = _journal_header(fd)
+        if header is None or header.get("base") is None or header["g"] != self._journal_generation + 1:
+            os.close(fd)
+            return False
+        # 교체된 이전 저널에는 더 이상 기록되지 않으므로 압축한 위치까지 읽으면 스냅샷과 같아짐
+        self._read_journal()
+        if self._journal_offset != header["base"]:
+            os.close(fd)
+            return False
+        if self._install_snapshot(header["g"]):
+            logger.warning("중단된 스냅샷 저장을 마무리했습니다.")
+        self._close_journal()
+        self._journal_fd = fd
+        self._journal_ino = os.fstat(fd).st_ino
+        self._journal_generation = header["g"]
+        self._journal_offset = end
+        self.journal_record_count = 0
+        self._snapshot_stamp = self._snapshot_stamp_now()
+        logger.debug(f"다른 워커의 저널 압축을 따라감: 세대 {header['g']}")
+        return True
+    
+    def refresh(self) -> bool:
+        # 잠금 없이 stat만으로 먼저 확인하므로 변경이 없을 때는 비용이 거의 없음
+        if self._disk_changes() == 'same':
+            return False
+        with self._file_lock(exclusive=False):
+            return self._sync_from_disk()
+    
+    # ---- 저널 ----
+    def _apply_op(self, op: Dict) -> None:
+        """
+        저널 레코드 하나를 메모리에 적용
+        
+        레코드 형식:
+            {"w": 단어, "c": 1|0, "t": 시각}                     퀴즈 결과 (정답/오답, 복습 일정 갱신)
+            {"op": "put", "w": 단어, "k": 뜻, "cat": 카테고리}   단어 추가/수정
+            {"op": "mv", "w": 단어, "to": 새 단어, "k", "cat"}   영어 단어 변경 (통계 이전)
+            {"op": "del", "w": 단어}                            단어와 통계 삭제
+        
+        압축으로 새로 만든 저널의 첫 줄 {"op": "gen", "g": 세대, "base": 압축한 이전 저널 위치}는
+        레코드가 아니므로 열 때 건너뜀 (스냅샷에 저널에 없는 변경이 들어간 경우 base는 null)
+        """
+        kind = op.get("op")
+        word = op["w"]
+        if kind is None:
+            if word not in self.vocabulary:
+                return  # 단어가 삭제된 경우 스킵
+            stats = self.quiz_stats.increment(word, bool(op["c"]))
+            self._bump_versions(vocab=False, stats=True)
+            self._index_stats(word, stats)
+            if "t" in op:
+                # 시각이 없는 이전 형식의 기록은 통계만 반영
+                schedule = next_schedule(self.schedules.get(word), bool(op["c"]), op["t"])
+                self.schedules[word] = schedule
+                self._index_schedule(word, schedule)
+        elif kind == "put":
+            data = WordRecord(op["k"], op.get("cat", ""))
+            old = self.vocabulary.get(word)
+            self.vocabulary[word] = data
+            self._bump_versions(vocab=True, stats=False)
+            self._index_put(word, old, data)
+        elif kind == "mv":
+            new_word = op["to"]
+            data = WordRecord(op["k"], op.get("cat", ""))
+            self._index_remove(word, self.vocabulary.pop(word, None))
+            stats = self.quiz_stats.pop(word)
+            if stats is not None:
+                self.quiz_stats.put(new_word, stats)
+            schedule = self.schedules.pop(word, None)
+            if schedule is not None:
+                self.schedules[new_word] = schedule
+            old = self.vocabulary.get(new_word)
+            self.vocabulary[new_word] = data
+            self._bump_versions(vocab=True, stats=stats is not None)
+            self._index_put(new_word, old, data)
+            if stats is not None:
+                self._index_stats(new_word, stats)
+            if schedule is not None:
+                self._index_schedule(new_word, schedule)
+        elif kind == "del":
+            self._index_remove(word, self.vocabulary.pop(word, None))
+            self.quiz_stats.pop(word)
+            self.schedules.pop(word, None)
+            self._bump_versions(vocab=True, stats=True)
+        else:
+            raise ValueError(f"알 수 없는 저널 작업: {kind}")
+    
+    def _open_journal(self) -> None:
+        """현재 저널 파일을 세대 머리글 다음부터 읽도록 열기 (없으면 닫힌 상태)"""
+        self._close_journal()
+        try:
+            self._journal_fd = os.open(self.journal_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        self._journal_ino = os.fstat(self._journal_fd).st_ino
+        header, end = _journal_header(self._journal_fd)
+        if header is not None:
+            self._journal_generation = header["g"]
+            self._journal_offset = end
+    
+    def _close_journal(self) -> None:
+        if self._journal_fd is not None:
+            os.close(self._journal_fd)
+        self._journal_fd = None
+        self._journal_ino = None
+        self._journal_offset = 0
+        self._journal_generation = 0
+    
+    def _read_journal(self) -> int:
+        """
+        저널의 마지막으로 읽은 위치부터 끝까지 적용
+        
+        마지막 줄이 아직 다 쓰이지 않았으면 다음 번에 이어서 읽음
+        
+        Returns:
+            int: 적용한 레코드 수
+        """
+        if self._journal_fd is None:
+            self._open_journal()
+            if self._journal_fd is None:
+                return 0
+        
+        applied = 0
+        try:
+            # fork된 워커와 파일 위치를 공유하지 않도록 pread 사용
+            size = os.fstat(self._journal_fd).st_size
+            data = os.pread(self._journal_fd, size - self._journal_offset, self._journal_offset)
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                try:
+                    self._apply_op(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    # 비정상 종료로 잘린 줄 등은 건너뜀
+                    logger.warning(f"저널 레코드 무시: {line[:50]!r}")
+                    continue
+                applied += 1
+            self._journal_offset += end
+            self.journal_record_count += applied
+        except Exception as e:
+            logger.error(f"저널 재생 실패: {e}")
+        return applied
+    
+    def _append_journal(self, ops: List[Dict]) -> bool:
+        """
+        레코드를 한 번의 쓰기로 저널 끝에 추가하고 필요하면 압축 (쓰기 잠금을 잡은 상태)
+        
+        Args:
+            ops: 저널 레코드 목록
+        
+        Returns:
+            bool: 기록 성공 여부
+        """
+        data = "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops).encode('utf-8')
+        try:
+            fd = os.open(self.journal_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                start = os.fstat(fd).st_size
+                try:
+                    written = 0
+                    while written < len(data):
+                        written += os.write(fd, data[written:])
+                except OSError:
+                    # 일부만 쓰였으면 잘라 내서 다시 기록할 때 잘린 줄과 섞이지 않게 함
+                    os.ftruncate(fd, start)
+                    raise
+            finally:
+                os.close(fd)
+        except IOError as e:
+            logger.error(f"저널 기록 IO 오류: {e}")
+            return False
+        
+        if self._journal_fd is None:
+            # 쓰기 잠금 안에서 동기화된 상태이므로 새로 만든 저널은 이 기록뿐임
+            self._open_journal()
+        self._journal_offset += len(data)
+        self.journal_record_count += len(ops)
+        if self.journal_record_count >= self.compact_threshold:
+            # 저널을 스냅샷으로 압축 (스냅샷 저장이 저널을 비움)
+            logger.info(f"저널 압축: {self.journal_record_count}개 기록")
+            if not self._write_snapshot():
+                # 기록은 이미 저널에 남았으므로 실패로 보지 않음 (다음 기록 때 다시 압축)
+                logger.warning("저널 압축 실패: 저널을 유지합니다.")
+        return True
+    
+    # ---- 스냅샷 ----
+    def _snapshot_files(self) -> Tuple[str, str, str]:
+        return (self.vocab_file, self.stats_file, self.schedule_file)
+    
+    def _install_snapshot(self, generation: int) -> int:
+        """
+        저널 교체까지 끝난 세대의 스냅샷 파일 중 아직 제자리로 옮기지 못한 것을 옮김 (파일 잠금을 잡은 상태)
+        
+        읽기 잠금만 잡은 워커 여럿이 동시에 옮겨도 결과가 같으므로 잠금 종류와 상관없이 수행함
+        
+        Returns:
+            int: 옮긴 파일 수
+        """
+        installed = 0
+        if generation == 0:
+            return installed
+        for path in self._snapshot_files():
+            try:
+                os.replace(_staged_path(path, generation), path)
+            except FileNotFoundError:
+                continue
+            installed += 1
+        return installed
+    
+    def _write_snapshot(self) -> bool:
+        """
+        현재 데이터를 스냅샷 파일에 기록하고 저널 비우기 (쓰기 잠금을 잡은 상태)
+        
+        스냅샷 파일 세 개를 한 번에 바꿀 수는 없으므로, 새 세대 번호를 붙인 파일로 먼저 모두 쓰고
+        그 세대 번호를 첫 줄에 적은 빈 저널로 교체한 뒤(이 시점에 저장이 확정됨) 제자리로 옮김.
+        중간에 중단되면 다음에 불러올 때 저널의 세대로 판단해, 교체 전이면 이전 스냅샷과 저널을 그대로 쓰고
+        교체 후면 남은 파일을 마저 옮기므로 저널이 두 번 재생되지 않음
+        
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            generation = self._journal_generation + 1
+            # 저널을 쓰면 스냅샷은 이전 스냅샷 + 지금까지 읽은 저널과 같음 (다른 워커가 다시 불러오지 않고 따라옴)
+            folded = self.use_journal and not self._unjournaled
+            header = {"op": "gen", "g": generation, "base": self._journal_offset if folded else None}
+            # 단어장, 통계, 복습 일정 저장
+            for path, data in zip(self._snapshot_files(),
+                                  (self.vocabulary, self.quiz_stats.to_dict(), self.schedules)):
+                write_json_atomic(_staged_path(path, generation), data)
+            
+            # 스냅샷에 모두 반영되었으므로 새 세대의 빈 저널로 교체 (다른 워커는 inode 변경으로 감지)
+            tmp_path = f"{self.journal_file}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.journal_file)
+            self._install_snapshot(generation)
+            
+            self._snapshot_stamp = self._snapshot_stamp_now()
+            self._open_journal()
+            self.journal_record_count = 0
+            self._unjournaled = False
+            
+            logger.debug("데이터 저장 성공")
+            return True
+        except IOError as e:
+            logger.error(f"파일 저장 IO 오류: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"파일 저장 실패: {e}")
+            return False
+    
+    def _persist_ops(self, ops: List[Dict]) -> bool:
+        """변경 레코드 기록 (쓰기 잠금을 잡은 상태)"""
+        if self.use_journal:
+            return self._append_journal(ops)
+        return self._write_snapshot()
+    
+    # ---- 트랜잭션 ----
+    def _begin(self, txn: Transaction) -> None:
+        # 다른 워커와의 쓰기를 직렬화하고, 최신 상태에서 확인 후 변경하도록 먼저 동기화
+        self._acquire_file_lock(exclusive=True)
+        try:
+            self._sync_from_disk()
+        except BaseException:
+            self._release_file_lock()
+            raise
+    
+    def _commit(self, txn: Transaction) -> None:
+        try:
+            if not txn.changed:
+                return
+            if self.persist_mode == 'deferred':
+                txn.generation = self.flusher.mark_dirty(txn.ops)
+            else:
+                txn.ok = self._persist_ops(txn.ops)
+                self._unjournaled = self._unjournaled or not txn.ok
+        finally:
+            self._release_file_lock()
+    
+    def _abort(self, txn: Transaction) -> None:
+        try:
+            if txn.changed:
+                # 기록되지 않은 메모리 변경을 버리고 디스크 상태로 되돌림
+                self._reload()
+        finally:
+            self._release_file_lock()
+    
+    def _wait_durable(self, txn: Transaction) -> bool:
+        if self.persist_mode != 'deferred':
+            return True
+        return self.flusher.wait_for(txn.generation)
+    
+    def _mutate(self, op: Dict) -> None:
+        """변경 레코드를 현재 트랜잭션(없으면 새 트랜잭션) 안에서 적용"""
+        with self.transaction() as txn:
+            self._apply_op(op)
+            txn.changed = True
+            txn.ops.append(op)
+    
+    # ---- 단어 조회 ----
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+    
+    def __contains__(self, word: str) -> bool:
+        return word in self.vocabulary
+    
+    def get_word(self, word: str) -> Optional[WordRecord]:
+        return self.vocabulary.get(word)
+    
+    def iter_words(self, category: Optional[str] = None) -> Iterator[Tuple[str, WordRecord]]:
+        if not category:
+            yield from list(self.vocabulary.items())
+            return
+        # 카테고리 인덱스로 해당 카테고리 단어만 읽음
+        with self.lock:
+            items = [(word, self.vocabulary[word]) for word in self.list_words(category)]
+        yield from items
+    
+    def list_words(self, category: Optional[str] = None) -> List[str]:
+        if not category:
+            return list(self.vocabulary.keys())
+        with self.lock:
+            self.ensure_indexes()
+            return self.category_index.words(category)
+    
+    def count_words(self, category: Optional[str] = None) -> int:
+        if not category:
+            return len(self.vocabulary)
+        with self.lock:
+            self.ensure_indexes()
+            return self.category_index.count(category)
+    
+    def categories(self) -> List[str]:
+        with self.lock:
+            self.ensure_indexes()
+            return self.category_index.categories()
+    
+    # ---- 단어 변경 ----
+    def add_word(self, word: str, korean: str, category: str) -> None:
+        self._mutate({"op": "put", "w": word, "k": korean, "cat": category})
+    
+    def update_word(self, word: str, new_word: str, korean: str, category: str) -> None:
+        if new_word != word:
+            self._mutate({"op": "mv", "w": word, "to": new_word, "k": korean, "cat": category})
+        else:
+            self._mutate({"op": "put", "w": word, "k": korean, "cat": category})
+    
+    def delete_word(self, word: str) -> None:
+        self._mutate({"op": "del", "w": word})
+    
+    # ---- 통계 ----
+    def get_stats(self, word: str) -> Optional[List[int]]:
+        return self.quiz_stats.get(word)
+    
+    def iter_stats(self) -> Iterator[Tuple[str, List[int]]]:
+        return iter(self.quiz_stats.items())
+    
+    def stats_count(self) -> int:
+        return len(self.quiz_stats)
+    
+    def stats_columns(self) -> Tuple[List[str], Sequence[int], Sequence[int]]:
+        with self.lock:
+            return self.quiz_stats.columns()
+    
+    def record_result(self, word: str, is_correct: bool, now: Optional[float] = None) -> List[int]:
+        reviewed_at = int(time.time() if now is None else now)
+        with self.transaction():
+            self._mutate({"w": word, "c": 1 if is_correct else 0, "t": reviewed_at})
+            return self.quiz_stats.get(word) or [0, 0]
+    
+    # ---- 복습 일정 ----
+    def get_schedule(self, word: str) -> Optional[List]:
+        return self.schedules.get(word)
+    
+    def iter_schedules(self) -> Iterator[Tuple[str, List]]:
+        return iter(list(self.schedules.items()))
+
+class DataFlusher:
+    """
+    deferred 모드의 백그라운드 저장기
+    
+    변경 레코드를 모아 flush_interval_ms마다 또는 flush_max_mutations개가 쌓이면
+    한 번의 쓰기로 기록함 (그룹 커밋)
+    """
+    
+    def __init__(self, store: JsonVocabStore, interval_ms: int, max_mutations: int):
+        self.store = store
+        self.interval = interval_ms / 1000
+        self.max_mutations = max(1, max_mutations)
+        self._cond = threading.Condition()
+        self._ops: List[Dict] = []  # 아직 기록되지 않은 변경 레코드
+        self._generation = 0  # 트랜잭션마다 증가
+        self._flushed_generation = 0  # 디스크에 반영된 마지막 세대
+        self._last_ok = True
+        self._flush_requested = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+    
+    def _ensure_started(self) -> None:
+        """저장 스레드 시작 (fork된 워커에서는 새로 시작)"""
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="data-flusher", daemon=True)
+        self._thread.start()
+    
+    def mark_dirty(self, ops: List[Dict]) -> int:
+        """
+        변경 표시 (저장소 잠금을 잡은 상태에서 호출)
+        
+        Args:
+            ops: 기록할 변경 레코드
+        
+        Returns:
+            int: 이 변경의 세대 번호 (wait_for에 사용)
+        """
+        with self._cond:
+            self._ensure_started()
+            was_empty = not self._ops
+            self._ops.extend(ops)
+            self._generation += 1
+            # 첫 변경이면 저장 스레드를 깨워 주기를 시작하고, 충분히 쌓였으면 바로 저장하게 함
+            if was_empty or len(self._ops) >= self.max_mutations:
+                self._cond.notify_all()
+            return self._generation
+    
+    def pending_ops(self) -> List[Dict]:
+        """아직 기록되지 않은 변경 레코드"""
+        with self._cond:
+            return list(self._ops)
+    
+    def wait_for(self, generation: int, timeout: Optional[float] = None) -> bool:
+        """
+        주어진 세대가 디스크에 기록될 때까지 즉시 저장을 요청하고 대기
+        
+        Args:
+            generation: mark_dirty가 반환한 세대 번호
+            timeout: 최대 대기 시간(초)
+        
+        Returns:
+            bool: 기록 성공 여부
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: self._flushed_generation >= generation, timeout)
+            return done and self._last_ok
+    
+    def flush(self) -> bool:
+        """대기 중인 변경을 호출한 스레드에서 즉시 기록"""
+        self._flush()
+        return self._last_ok
+    
+    def stop(self) -> None:
+        """남은 변경을 기록하고 저장 스레드 종료"""
+        with self._cond:
+            thread = self._thread
+            if thread is None or self._pid != os.getpid():
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        thread.join()
+    
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ops or self._stopping)
+                if self._last_ok:
+                    # 첫 변경 이후 주기가 끝나거나 충분히 쌓일 때까지 더 모음
+                    self._cond.wait_for(
+                        lambda: self._stopping or self._flush_requested
+                        or len(self._ops) >= self.max_mutations,
+                        self.interval
+                    )
+                else:
+                    # 직전 기록이 실패했으면 쌓인 양과 상관없이 한 주기 쉬고 다시 시도
+                    self._cond.wait_for(lambda: self._stopping, self.interval)
+                self._flush_requested = False
+                stopping = self._stopping
+            try:
+                self._flush()
+            except Exception as e:
+                # 예외로 스레드가 끝나면 이후 변경이 기록되지 않고 durable 대기가 풀리지 않음
+                logger.error(f"백그라운드 저장 실패 (다시 시도합니다): {e}")
+            if stopping:
+                if self._ops:
+                    logger.error(f"기록하지 못한 변경 {len(self._ops)}개를 남기고 저장 스레드를 종료합니다.")
+                return
+    
+    def _flush(self) -> None:
+        """
+        대기 중인 변경 기록
+        
+        기록에 실패하거나 예외가 나면 꺼낸 변경을 대기열 앞에 되돌려 다음 저장 때 다시 기록하고,
+        기다리던 트랜잭션에는 실패를 알림
+        """
+        store = self.store
+        ops: Optional[List[Dict]] = None
+        target = 0
+        ok = False
+        try:
+            with store._file_lock(exclusive=True):
+                # 다른 워커의 변경을 먼저 반영해 저널 위치를 맞춤 (다시 불러오면 대기 중인 변경도 재적용)
+                store._sync_from_disk()
+                with self._cond:
+                    ops = self._ops
+                    target = self._generation
+                    self._ops = []
+                ok = store._persist_ops(ops) if ops else True
+        finally:
+            with self._cond:
+                if ops is None:
+                    # 꺼내기 전에 실패하면 지금까지의 세대 모두 실패로 알림
+                    target = self._generation
+                elif not ok:
+                    # 그 사이 추가된 변경보다 앞에 두어 순서를 유지 (다시 불러와도 대기 중인 변경으로 재적용됨)
+                    self._ops[:0] = ops
+                self._flushed_generation = max(self._flushed_generation, target)
+                self._last_ok = ok
+                self._cond.notify_all()
+
+class SqliteVocabStore(VocabStore):
+    """
+    SQLite 저장소
+    
+    WAL 모드로 열고 단어/카테고리에 인덱스를 둠. 데이터를 메모리에 모두 올리지 않으므로
+    큰 단어장도 다룰 수 있고, 변경은 트랜잭션마다 해당 행만 기록함.
+    접두사/카테고리/부분 문자열/초성 검색/무작위 추출/약점 순위/복습 대기열 조회는 SQL 인덱스로 처리하고
+    (vocab_sql_index), 나머지 메모리 인덱스(철자 검색)는 처음 조회할 때 만듦.
+    트랜잭션마다 바뀐 단어를 버전과 함께 changes 테이블에 남겨, 다른 워커는 보조 인덱스를
+    처음부터 다시 만들지 않고 그 단어들만 갱신함
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS words (
+            english TEXT PRIMARY KEY,
+            korean TEXT NOT NULL,
+            category TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_words_category_english ON words(category, english);
+        CREATE TABLE IF NOT EXISTS quiz_stats (
+            word TEXT PRIMARY KEY,
+            correct INTEGER NOT NULL DEFAULT 0,
+            wrong INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS review_schedule (
+            word TEXT PRIMARY KEY,
+            reps INTEGER NOT NULL,
+            interval INTEGER NOT NULL,
+            ease REAL NOT NULL,
+            due INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_schedule_due ON review_schedule(due, word);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS changes (
+            version INTEGER NOT NULL,
+            word TEXT,
+            vocab INTEGER NOT NULL,
+            existed INTEGER NOT NULL DEFAULT 0,
+            old_korean TEXT,
+            old_category TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_changes_version ON changes(version);
+        CREATE TABLE IF NOT EXISTS draw_slots (
+            kind TEXT NOT NULL,
+            category TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            slot INTEGER NOT NULL,
+            word TEXT NOT NULL,
+            PRIMARY KEY (kind, category, bucket, slot)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_draw_slots_word ON draw_slots(word);
+        CREATE TABLE IF NOT EXISTS draw_counts (
+            kind TEXT NOT NULL,
+            category TEXT NOT NULL,
+            bucket INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            PRIMARY KEY (kind, category, bucket)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS search_grams (
+            kind TEXT NOT NULL,
+            gram TEXT NOT NULL,
+            word TEXT NOT NULL,
+            PRIMARY KEY (kind, gram, word)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS search_gram_counts (
+            kind TEXT NOT NULL,
+            gram TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            PRIMARY KEY (kind, gram)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS search_initials (
+            kind TEXT NOT NULL,
+            initial TEXT NOT NULL,
+            rank INTEGER NOT NULL,
+            length INTEGER NOT NULL,
+            word TEXT NOT NULL,
+            PRIMARY KEY (kind, initial, rank, length, word)
+        ) WITHOUT ROWID;
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('version', 0);
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('vocab_version', 0);
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('stats_version', 0);
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('epoch', abs(random()));
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('draw_slots', 0);
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('search_rows', 0);
+    """
+    # 이전 스키마의 데이터베이스를 불러올 때 한 번 채울 테이블 ((meta 키, 다시 만드는 함수), 새 데이터베이스는 빈 채로 채움)
+    MIGRATIONS = (("draw_slots", rebuild_draw_slots), ("search_rows", rebuild_search_rows))
+    # 이전 스키마에만 있던 인덱스 (고칠 때 함께 지움)
+    OBSOLETE_INDEXES = ("idx_words_category", "idx_stats_rank")
+    # 변경 로그를 남겨 둘 버전 수 (이보다 오래 뒤처진 워커는 인덱스를 다시 만듦)
+    CHANGE_LOG_KEEP = 10000
+    
+    def __init__(self, db_file: str, legacy_store: Optional[JsonVocabStore] = None):
+        super().__init__()
+        self.db_file = db_file
+        # 데이터베이스가 비어 있을 때 한 번 가져올 기존 JSON 저장소
+        self.legacy_store = legacy_store
+        # 마지막으로 확인한 데이터 버전 (변경 트랜잭션마다 meta 테이블에서 1 증가)
+        self._version: Optional[int] = None
+        # 데이터베이스 인덱스로 바로 조회하는 인덱스 (메모리에 단어를 두지 않음)
+        self.pool = SqlWordPool(self._conn)
+        self.category_index = SqlCategoryIndex(self._conn)
+        self.indexes.update({
+            "category": self.category_index,
+            "prefix": SqlPrefixIndex(self._conn),
+            "search": SqlSearchIndex(self._conn, "search"),
+            "choseong": SqlSearchIndex(self._conn, "choseong"),
+            "pool": self.pool,
+            "weakness": SqlWeaknessIndex(self._conn),
+            "due": SqlDueQueue(self._conn),
+        })
+        self._stale_indexes = set(self.indexes)
+    
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (fork된 워커에서는 새로 연결)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_file, isolation_level=None, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    # ---- 생명주기 ----
+    def load(self) -> None:
+        conn = self._conn()
+        conn.executescript(self.SCHEMA)
+        self._migrate()
+        if len(self) == 0:
+            self._import_json()
+        with self.lock:
+            # 메모리 인덱스는 처음 조회할 때 만듦 (불러올 때 전체 단어를 읽지 않음)
+            self._invalidate_indexes()
+            self._version = self._read_version()
+        logger.info(f"SQLite 단어장 불러오기 성공: {len(self)}개 단어, {self.stats_count()}개 기록")
+    
+    def _pending_migrations(self, conn: sqlite3.Connection) -> List[Tuple[str, Any]]:
+        done = dict(conn.execute(
+            f"SELECT key, value FROM meta WHERE key IN ({', '.join('?' * len(self.MIGRATIONS))})",
+            [key for key, _ in self.MIGRATIONS]
+        ))
+        return [(key, rebuild) for key, rebuild in self.MIGRATIONS if not done.get(key)]
+    
+    def _migrate(self) -> None:
+        """이전 스키마로 만든 데이터베이스를 한 번 고침 (SQL 인덱스 테이블 채우기, 쓰지 않는 인덱스 지우기)"""
+        conn = self._conn()
+        if not self._pending_migrations(conn):
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 워커가 먼저 고쳤을 수 있으므로 쓰기 잠금을 잡고 다시 확인
+            for key, rebuild in self._pending_migrations(conn):
+                for name in self.OBSOLETE_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {name}")
+                rebuild(conn)
+                conn.execute("UPDATE meta SET value = 1 WHERE key = ?", (key,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def _import_json(self) -> None:
+        """기존 JSON 단어장/통계를 데이터베이스로 가져오기"""
+        legacy = self.legacy_store
+        if legacy is None or not os.path.exists(legacy.vocab_file):
+            return
+        legacy.load()
+        with self.transaction() as txn:
+            txn.changed = True
+            conn = self._conn()
+            conn.executemany(
+                "INSERT OR REPLACE INTO words (english, korean, category) VALUES (?, ?, ?)",
+                ((word, data.get("korean", ""), data.get("category", ""))
+                 for word, data in legacy.iter_words())
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO quiz_stats (word, correct, wrong) VALUES (?, ?, ?)",
+                ((word, stats[0], stats[1]) for word, stats in legacy.iter_stats())
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO review_schedule (word, reps, interval, ease, due) VALUES (?, ?, ?, ?, ?)",
+                ((word, *schedule) for word, schedule in legacy.iter_schedules())
+            )
+            rebuild_draw_slots(conn)
+            rebuild_search_rows(conn)
+            self._bump_versions(vocab=True, stats=True)
+        logger.info(f"JSON 단어장을 SQLite로 가져옴: {len(legacy)}개 단어")
+    
+    def save(self) -> bool:
+        # 변경은 트랜잭션마다 이미 기록되므로 WAL 체크포인트만 수행
+        try:
+            self._conn().execute("PRAGMA wal_checkpoint(PASSIVE)")
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"SQLite 체크포인트 실패: {e}")
+            return False
+    
+    def close(self) -> None:
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+            self._local.conn = None
+    
+    def _read_version(self) -> int:
+        return self._conn().execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+    
+    def data_version(self) -> Tuple[str, int, int]:
+        # 모든 워커가 같은 데이터베이스 버전을 공유함
+        values = dict(self._conn().execute(
+            "SELECT key, value FROM meta WHERE key IN ('epoch', 'vocab_version', 'stats_version')"
+        ))
+        return (str(values["epoch"]), values["vocab_version"], values["stats_version"])
+    
+    def _bump_versions(self, vocab: bool, stats: bool) -> None:
+        keys = [key for key, bump in (("vocab_version", vocab), ("stats_version", stats)) if bump]
+        self._conn().execute(
+            f"UPDATE meta SET value = value + 1 WHERE key IN ({', '.join('?' * len(keys))})", keys
+        )
+    
+    def refresh(self) -> bool:
+        # 다른 워커가 변경했으면 바뀐 단어만 인덱스에 반영
+        if self._read_version() == self._version:
+            return False
+        with self.lock:
+            with self._read_transaction():
+                return self._catch_up()
+    
+    @contextmanager
+    def _read_transaction(self) -> Iterator[sqlite3.Connection]:
+        """여러 조회가 같은 시점의 데이터를 보도록 읽기 트랜잭션으로 묶음"""
+        conn = self._conn()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        finally:
+            conn.execute("COMMIT")
+    
+    def ensure_indexes(self, *names: str) -> None:
+        # 이미 만든 인덱스를 먼저 최신으로 맞춘 뒤 같은 시점의 데이터로 나머지를 만듦
+        with self.lock:
+            if not self._stale_indexes.intersection(names or self.indexes):
+                return
+            with self._read_transaction():
+                self._catch_up()
+                super().ensure_indexes(*names)
+    
+    def _catch_up(self) -> bool:
+        """
+        다른 워커가 커밋한 변경을 변경 로그로 인덱스에 반영 (잠금과 트랜잭션을 잡은 상태)
+        
+        로그가 이미 지워졌거나 단어를 특정할 수 없는 변경(JSON 가져오기 등)이 있으면
+        인덱스를 다음 조회 때 다시 만들도록 표시함
+        
+        Returns:
+            bool: 변경이 있었는지 여부
+        """
+        version = self._read_version()
+        if version == self._version:
+            return False
+        if any(not isinstance(index, SqlIndex) for index in self._live_indexes()):
+            rows = self._conn().execute(
+                "SELECT version, word, vocab, existed, old_korean, old_category FROM changes "
+                "WHERE version > ? ORDER BY version", (self._version,)
+            ).fetchall()
+            if (not rows or rows[0][0] != self._version + 1
+                    or any(row[1] is None for row in rows)):
+                self._invalidate_indexes()
+            else:
+                self._apply_changes(rows)
+        self._version = version
+        return True
+    
+    def _apply_changes(self, rows: List[Tuple]) -> None:
+        """변경 로그의 단어들을 현재 데이터로 인덱스에 반영"""
+        # 단어마다 첫 단어 변경의 이전 값이 인덱스에 들어 있는 값임
+        olds: Dict[str, Optional[WordRecord]] = {}
+        words: Dict[str, None] = {}
+        for _, word, vocab, existed, korean, category in rows:
+            words[word] = None
+            if vocab and word not in olds:
+                olds[word] = WordRecord(korean, category) if existed else None
+        for word in words:
+            data = self.get_word(word)
+            if word in olds:
+                if data is None:
+                    self._index_remove(word, olds[word])
+                    continue
+                self._index_put(word, olds[word], data)
+            if data is not None:
+                self._index_stats(word, self.get_stats(word))
+                self._index_schedule(word, self.get_schedule(word))
+    
+    def _log_change(self, word: str, old: Optional[WordRecord], vocab: bool = True) -> None:
+        """
+        트랜잭션의 변경 로그에 단어 추가
+        
+        Args:
+            word: 바뀐 단어
+            old: 바뀌기 전 데이터 (없던 단어면 None, 단어 데이터 변경일 때만 기록)
+            vocab: 단어 데이터가 바뀌었는지 여부 (False면 통계/복습 일정만 바뀜)
+        """
+        self._local.txn.ops.append({"w": word, "old": old, "vocab": vocab})
+    
+    def _write_change_log(self, conn: sqlite3.Connection, version: int, ops: List[Dict]) -> None:
+        if ops:
+            rows = [(version, op["w"], op["vocab"], op["old"] is not None,
+                     op["old"].korean if op["vocab"] and op["old"] is not None else None,
+                     op["old"].category if op["vocab"] and op["old"] is not None else None)
+                    for op in ops]
+        else:
+            # 바뀐 단어를 특정할 수 없으면 다른 워커가 인덱스를 다시 만들도록 함
+            rows = [(version, None, True, False, None, None)]
+        conn.executemany(
+            "INSERT INTO changes (version, word, vocab, existed, old_korean, old_category) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+        conn.execute("DELETE FROM changes WHERE version <= ?", (version - self.CHANGE_LOG_KEEP,))
+    
+    # ---- 트랜잭션 ----
+    def _begin(self, txn: Transaction) -> None:
+        self._conn().execute("BEGIN IMMEDIATE")
+        # 쓰기 잠금을 잡은 뒤 다른 워커의 변경을 반영해야 이 트랜잭션의 변경을 인덱스에 하나씩 더할 수 있음
+        try:
+            self._catch_up()
+        except BaseException:
+            self._conn().execute("ROLLBACK")
+            raise
+    
+    def _commit(self, txn: Transaction) -> None:
+        conn = self._conn()
+        try:
+            if txn.changed:
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+                self._write_change_log(conn, self._version + 1, txn.ops)
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"SQLite 커밋 실패: {e}")
+            conn.execute("ROLLBACK")
+            txn.ok = False
+            if txn.changed:
+                self._invalidate_indexes()
+            return
+        if txn.changed:
+            self._version += 1
+    
+    def _abort(self, txn: Transaction) -> None:
+        self._conn().execute("ROLLBACK")
+        if txn.changed:
+            self._invalidate_indexes()
+    
+    @contextmanager
+    def _mutation(self) -> Iterator[sqlite3.Connection]:
+        with self.transaction() as txn:
+            txn.changed = True
+            yield self._conn()
+    
+    # ---- 단어 조회 ----
+    def __len__(self) -> int:
+        return self.pool.count()
+    
+    def __contains__(self, word: str) -> bool:
+        row = self._conn().execute("SELECT 1 FROM words WHERE english = ?", (word,)).fetchone()
+        return row is not None
+    
+    def get_word(self, word: str) -> Optional[WordRecord]:
+        row = self._conn().execute(
+            "SELECT korean, category FROM words WHERE english = ?", (word,)
+        ).fetchone()
+        if row is None:
+            return None
+        return WordRecord(row[0], row[1])
+    
+    def iter_words(self, category: Optional[str] = None) -> Iterator[Tuple[str, WordRecord]]:
+        if category:
+            cursor = self._conn().execute(
+                "SELECT english, korean, category FROM words WHERE category = ? ORDER BY rowid",
+                (category,)
+            )
+        else:
+            cursor = self._conn().execute(
+                "SELECT english, korean, category FROM words ORDER BY rowid"
+            )
+        for english, korean, word_category in cursor:
+            yield english, WordRecord(korean, word_category)
+    
+    def list_words(self, category: Optional[str] = None) -> List[str]:
+        if category:
+            cursor = self._conn().execute(
+                "SELECT english FROM words WHERE category = ?", (category,)
+            )
+        else:
+            cursor = self._conn().execute("SELECT english FROM words")
+        return [row[0] for row in cursor]
+    
+    def count_words(self, category: Optional[str] = None) -> int:
+        return self.pool.count(category)
+    
+    def categories(self) -> List[str]:
+        cursor = self._conn().execute(
+            "SELECT DISTINCT category FROM words WHERE category != '' ORDER BY category"
+        )
+        return [row[0] for row in cursor]
+    
+    # ---- 단어 변경 ----
+    def add_word(self, word: str, korean: str, category: str) -> None:
+        with self._mutation() as conn:
+            old = self.get_word(word)
+            conn.execute(
+                "INSERT OR REPLACE INTO words (english, korean, category) VALUES (?, ?, ?)",
+                (word, korean, category)
+            )
+            update_draw_slots(conn, word)
+            update_search_rows(conn, word, old, WordRecord(korean, category))
+            self._bump_versions(vocab=True, stats=False)
+            self._log_change(word, old)
+            self._index_put(word, old, WordRecord(korean, category))
+    
+    def update_word(self, word: str, new_word: str, korean: str, category: str) -> None:
+        with self._mutation() as conn:
+            old = self.get_word(word)
+            self._log_change(word, old)
+            if old is None:
+                return
+            conn.execute(
+                "UPDATE words SET english = ?, korean = ?, category = ? WHERE english = ?",
+                (new_word, korean, category, word)
+            )
+            update_draw_slots(conn, word)
+            self._bump_versions(vocab=True, stats=new_word != word)
+            if new_word != word:
+                self._log_change(new_word, None)
+                # 통계와 복습 일정 이전
+                stats = self.get_stats(word)
+                schedule = self.get_schedule(word)
+                conn.execute("UPDATE quiz_stats SET word = ? WHERE word = ?", (new_word, word))
+                conn.execute("UPDATE review_schedule SET word = ? WHERE word = ?", (new_word, word))
+                update_draw_slots(conn, new_word)
+                update_search_rows(conn, word, old, None)
+                update_search_rows(conn, new_word, None, WordRecord(korean, category))
+                self._index_remove(word, old)
+                self._index_put(new_word, None, WordRecord(korean, category))
+                if stats is not None:
+                    self._index_stats(new_word, stats)
+                if schedule is not None:
+                    self._index_schedule(new_word, schedule)
+            else:
+                update_search_rows(conn, word, old, WordRecord(korean, category))
+                self._index_put(word, old, WordRecord(korean, category))
+    
+    def delete_word(self, word: str) -> None:
+        with self._mutation() as conn:
+            old = self.get_word(word)
+            conn.execute("DELETE FROM words WHERE english = ?", (word,))
+            # 통계와 복습 일정도 함께 삭제
+            conn.execute("DELETE FROM quiz_stats WHERE word = ?", (word,))
+            conn.execute("DELETE FROM review_schedule WHERE word = ?", (word,))
+            update_draw_slots(conn, word)
+            update_search_rows(conn, word, old, None)
+            self._bump_versions(vocab=True, stats=True)
+            self._log_change(word, old)
+            self._index_remove(word, old)
+    
+    # ---- 통계 ----
+    def get_stats(self, word: str) -> Optional[List[int]]:
+        row = self._conn().execute(
+            "SELECT correct, wrong FROM quiz_stats WHERE word = ?", (word,)
+        ).fetchone()
+        return [row[0], row[1]] if row else None
+    
+    def iter_stats(self) -> Iterator[Tuple[str, List[int]]]:
+        for word, correct, wrong in self._conn().execute(
+            "SELECT word, correct, wrong FROM quiz_stats ORDER BY rowid"
+        ):
+            yield word, [correct, wrong]
+    
+    def stats_count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM quiz_stats").fetchone()[0]
+    
+    def record_result(self, word: str, is_correct: bool, now: Optional[float] = None) -> List[int]:
+        column = "correct" if is_correct else "wrong"
+        reviewed_at = int(time.time() if now is None else now)
+        with self._mutation() as conn:
+            conn.execute("INSERT OR IGNORE INTO quiz_stats (word) VALUES (?)", (word,))
+            conn.execute(f"UPDATE quiz_stats SET {column} = {column} + 1 WHERE word = ?", (word,))
+            self._bump_versions(vocab=False, stats=True)
+            self._log_change(word, None, vocab=False)
+            row = conn.execute(
+                "SELECT correct, wrong FROM quiz_stats WHERE word = ?", (word,)
+            ).fetchone()
+            self._index_stats(word, [row[0], row[1]])
+            schedule = next_schedule(self.get_schedule(word), is_correct, reviewed_at)
+            conn.execute(
+                "INSERT OR REPLACE INTO review_schedule (word, reps, interval, ease, due) VALUES (?, ?, ?, ?, ?)",
+                (word, *schedule)
+            )
+            update_draw_slots(conn, word)
+            self._index_schedule(word, schedule)
+        return [row[0], row[1]]
+    
+    # ---- 복습 일정 ----
+    def get_schedule(self, word: str) -> Optional[List]:
+        row = self._conn().execute(
+            "SELECT reps, interval, ease, due FROM review_schedule WHERE word = ?", (word,)
+        ).fetchone()
+        return list(row) if row else None
+    
+    def iter_schedules(self) -> Iterator[Tuple[str, List]]:
+        for word, reps, interval, ease, due in self._conn().execute(
+            "SELECT word, reps, interval, ease, due FROM review_schedule ORDER BY rowid"
+        ):
+            yield word, [reps, interval, ease, due]
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    """파일의 (inode, 수정 시각, 크기) (없으면 None)"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _journal_header(fd: int) -> Tuple[Optional[Dict], int]:
+    """저널 첫 줄의 세대 머리글과 그 길이 (머리글이 없으면 (None, 0))"""
+    first = os.pread(fd, 256, 0)
+    end = first.find(b"\n") + 1
+    try:
+        header = json.loads(first[:end]) if end else None
+    except ValueError:
+        return None, 0
+    if not isinstance(header, dict) or header.get("op") != "gen":
+        return None, 0
+    return header, end
+
+def _staged_path(path: str, generation: int) -> str:
+    """저널 교체 전에 먼저 써 두는 스냅샷 파일 경로"""
+    return f"{path}.gen{generation}"
+
+def write_json_atomic(path: str, data: Dict) -> None:
+    """
+    임시 파일에 쓴 뒤 rename하여 JSON 파일을 원자적으로 교체
+    
+    Args:
+        path: 대상 파일 경로
+        data: 저장할 데이터
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, default=json_default)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
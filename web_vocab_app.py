@@ -9,15 +9,41 @@
 - 다크 모드 지원
 """
 
-from flask import Flask, render_template, request, jsonify
-import json
+from flask import Flask, Response, render_template, request, jsonify, g, has_request_context
 import random
 import os
+import base64
+import binascii
+import csv
+import json
+import gc
+import io
+import time
 import logging
-from typing import Dict, List, Tuple, Optional
+import operator
+import atexit
+from typing import Any, Callable, Dict, List, Tuple, Optional, Iterator
+from flask.json.provider import DefaultJSONProvider
+from vocab_store import VocabStore, JsonVocabStore, SqliteVocabStore, WordRecord
+from vocab_decks import DeckCache, is_valid_deck_id
+from vocab_cache import ResponseCache
+from vocab_import import (import_words, detect_format, IMPORT_FORMATS, CONFLICT_POLICIES,
+                          DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE)
+from vocab_index import (NgramIndex, ChoseongIndex, PrefixIndex, FuzzyIndex, WeaknessIndex,
+                         WordPool, DueQueue, is_choseong_query, edit_distance)
+
+class VocabJSONProvider(DefaultJSONProvider):
+    """단어 데이터(WordRecord)도 그대로 jsonify할 수 있는 JSON 변환기"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, WordRecord):
+            return o.to_dict()
+        return DefaultJSONProvider.default(o)
 
 # Flask 앱 초기화
 app = Flask(__name__)
+app.json = VocabJSONProvider(app)
 
 # 로깅 설정
 logging.basicConfig(
@@ -29,14 +55,131 @@ logger = logging.getLogger(__name__)
 # 상수 정의
 VOCAB_FILE = "vocabulary.json"
 STATS_FILE = "quiz_stats.json"
+STATS_JOURNAL_FILE = "quiz_stats.journal"  # 퀴즈 결과 추가 전용 로그
+SCHEDULE_FILE = "review_schedule.json"  # 간격 반복 복습 일정
 DEFAULT_PORT = 5000
 FALLBACK_PORT = 5001
 
-# 전역 변수
-vocabulary: Dict[str, Dict] = {}  # {word: {"korean": meaning, "category": category}}
-quiz_stats: Dict[str, List[int]] = {}  # {word: [correct_count, wrong_count]}
+# 저장소 설정
+# STORAGE_BACKEND: 'json'(기본, vocabulary.json/quiz_stats.json) 또는 'sqlite'
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'json')
+SQLITE_FILE = os.environ.get('SQLITE_FILE', "vocabulary.db")
 CATEGORIES_FILE = "categories.json"
 
+# 사용자별 단어장(덱) 설정
+# ?deck=ID, X-Deck 헤더 또는 deck 쿠키로 덱을 고르면 DECKS_DIR/ID/ 아래의 별도 저장소를 씀 (없으면 기본 단어장)
+DECKS_DIR = os.environ.get('DECKS_DIR', "decks")
+# 메모리에 둘 최대 덱 수와 단어 수 합계 (넘으면 가장 오래 쓰이지 않은 덱을 저장 후 내보냄)
+DECK_CACHE_MAX_DECKS = int(os.environ.get('DECK_CACHE_MAX_DECKS', 100))
+DECK_CACHE_MAX_WORDS = int(os.environ.get('DECK_CACHE_MAX_WORDS', 1000000))
+
+# 조회 응답 캐시 (/api/words, /api/categories, /api/stats의 직렬화된 응답)
+# 본문 크기 합계와 항목 수 한도 (RESPONSE_CACHE_MAX_BYTES=0 이면 캐시하지 않음)
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 1024))
+
+# 퀴즈 결과 저널 설정 (json 저장소)
+# STATS_JOURNAL=0 이면 기존처럼 답변마다 전체 파일을 다시 씀
+USE_STATS_JOURNAL = os.environ.get('STATS_JOURNAL', '1') != '0'
+# 저널 레코드가 이 개수를 넘으면 스냅샷(quiz_stats.json)으로 압축
+JOURNAL_COMPACT_THRESHOLD = int(os.environ.get('JOURNAL_COMPACT_THRESHOLD', 1000))
+
+# 저장 모드 (json 저장소): 'sync'(요청마다 즉시 저장) 또는 'deferred'(백그라운드에서 모아서 저장)
+PERSIST_MODE = os.environ.get('PERSIST_MODE', 'sync')
+# deferred 모드에서 이 시간(ms)이 지나거나 변경이 이 개수만큼 쌓이면 저장
+FLUSH_INTERVAL_MS = int(os.environ.get('FLUSH_INTERVAL_MS', 1000))
+FLUSH_MAX_MUTATIONS = int(os.environ.get('FLUSH_MAX_MUTATIONS', 500))
+
+# 단어 목록 페이지 크기 (기본값, 최대값)와 응답 항목
+WORDS_DEFAULT_LIMIT = 100
+WORDS_MAX_LIMIT = 1000
+WORD_FIELDS = ("english", "korean", "category")
+
+# 단어 검색 결과 수 (기본값, 최대값)
+SEARCH_DEFAULT_LIMIT = 50
+SEARCH_MAX_LIMIT = 200
+# 자동 완성 결과 수 (기본값, 최대값)
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+# 한 번에 가져오는 퀴즈 문제 수 (기본값, 최대값)
+QUIZ_BATCH_DEFAULT_COUNT = 10
+QUIZ_BATCH_MAX_COUNT = 50
+# 한 번에 확인하는 퀴즈 답안 수 (최대값)
+QUIZ_CHECK_BATCH_MAX_ANSWERS = 100
+# "혹시 이 단어?" 추천에서 허용하는 최대 편집 거리와 결과 수
+FUZZY_MAX_DISTANCE = 2
+FUZZY_DEFAULT_LIMIT = 5
+# 내보내기에서 잠금을 한 번 잡고 읽는 단어 수
+EXPORT_PAGE_SIZE = 1000
+EXPORT_FIELDS = ("english", "korean", "category", "correct", "wrong")
+
+def create_store(data_dir: str = "") -> VocabStore:
+    """
+    설정에 맞는 저장소 생성
+    
+    Args:
+        data_dir: 데이터 파일을 둘 디렉터리 (기본: 현재 디렉터리)
+    
+    Returns:
+        VocabStore: json 또는 sqlite 저장소
+    """
+    def path(name: str) -> str:
+        return os.path.join(data_dir, name)
+    
+    if STORAGE_BACKEND == 'sqlite':
+        # 데이터베이스가 비어 있으면 기존 JSON 단어장을 가져옴
+        legacy_store = JsonVocabStore(path(VOCAB_FILE), path(STATS_FILE), path(STATS_JOURNAL_FILE),
+                                      schedule_file=path(SCHEDULE_FILE))
+        new_store = SqliteVocabStore(path(SQLITE_FILE), legacy_store=legacy_store)
+    else:
+        new_store = JsonVocabStore(path(VOCAB_FILE), path(STATS_FILE), path(STATS_JOURNAL_FILE),
+                                   use_journal=USE_STATS_JOURNAL,
+                                   compact_threshold=JOURNAL_COMPACT_THRESHOLD,
+                                   persist_mode=PERSIST_MODE,
+                                   flush_interval_ms=FLUSH_INTERVAL_MS,
+                                   flush_max_mutations=FLUSH_MAX_MUTATIONS,
+                                   schedule_file=path(SCHEDULE_FILE))
+    # 보조 인덱스 등록 (저장소 변경에 맞춰 자동 갱신)
+    # 철자 검색 인덱스는 SQLite 저장소에서도 메모리에 둠: 단어마다 앞 5글자에서 지운 문자열(최대 16개)을
+    # 색인하므로 단어 10만 개에 수십 MB(무작위 단어로 잰 최악의 경우 약 85MB)를 쓰고, 처음 조회할 때 만듦
+    new_store.add_index("fuzzy", FuzzyIndex(max_distance=FUZZY_MAX_DISTANCE))
+    if STORAGE_BACKEND != 'sqlite':
+        # SQLite 저장소는 검색/접두사/약점 순위/무작위 추출/복습 대기열을 SQL 인덱스로 조회함
+        new_store.add_index("search", NgramIndex())
+        new_store.add_index("choseong", ChoseongIndex())
+        new_store.add_index("prefix", PrefixIndex())
+        new_store.add_index("weakness", WeaknessIndex())
+        new_store.add_index("pool", WordPool())
+        new_store.add_index("due", DueQueue())
+    return new_store
+
+def create_deck_store(deck_id: str) -> VocabStore:
+    """덱 저장소 생성 (DECKS_DIR/덱 ID/ 아래에 데이터 파일을 둠)"""
+    data_dir = os.path.join(DECKS_DIR, deck_id)
+    os.makedirs(data_dir, exist_ok=True)
+    return create_store(data_dir)
+
+# 전역 저장소 (모든 라우트는 get_store()를 통해 접근)
+store: VocabStore = create_store()
+# 덱 저장소 캐시 (처음 쓰일 때 불러오고 오래 쓰이지 않은 덱부터 내보냄)
+decks = DeckCache(create_deck_store, max_decks=DECK_CACHE_MAX_DECKS, max_words=DECK_CACHE_MAX_WORDS)
+# 종료 시 남은 변경 기록
+atexit.register(lambda: store.close())
+atexit.register(lambda: decks.close_all())
+response_cache = ResponseCache(max_bytes=RESPONSE_CACHE_MAX_BYTES, max_entries=RESPONSE_CACHE_MAX_ENTRIES)
+
+def get_store() -> VocabStore:
+    """현재 요청이 사용할 저장소 (덱을 고른 요청이면 덱 저장소)"""
+    if has_request_context():
+        deck_store = g.get('deck_store')
+        if deck_store is not None:
+            return deck_store
+    return store
+
+# 데이터 준비 상태 (/readyz에서 보고)
+data_ready = False
+data_load_seconds: Optional[float] = None
+
 def load_data() -> None:
     """
     파일에서 단어장 및 통계 데이터 불러오기
@@ -44,50 +187,11 @@ def load_data() -> None:
     Returns:
         None
     """
-    global vocabulary, quiz_stats
-    vocabulary = {}
-    quiz_stats = {}
-    
-    # 단어장 데이터 로드
-    try:
-        if os.path.exists(VOCAB_FILE):
-            with open(VOCAB_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # 기존 형식({word: meaning})과 새 형식({word: {korean, category}}) 호환
-                for word, value in data.items():
-                    if isinstance(value, str):
-                        # 기존 형식: {word: meaning} -> {word: {korean: meaning, category: ""}}
-                        vocabulary[word] = {"korean": value, "category": ""}
-                    elif isinstance(value, dict):
-                        # 새 형식: {word: {korean: meaning, category: category}}
-                        vocabulary[word] = {
-                            "korean": value.get("korean", ""),
-                            "category": value.get("category", "")
-                        }
-            logger.info(f"단어장 불러오기 성공: {len(vocabulary)}개 단어")
-        else:
-            logger.info("단어장 파일이 없습니다. 새로 생성합니다.")
-    except json.JSONDecodeError as e:
-        logger.error(f"단어장 JSON 파싱 오류: {e}")
-        vocabulary = {}
-    except Exception as e:
-        logger.error(f"단어장 불러오기 실패: {e}")
-        vocabulary = {}
-    
-    # 통계 데이터 로드
-    try:
-        if os.path.exists(STATS_FILE):
-            with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                quiz_stats = json.load(f)
-            logger.info(f"통계 불러오기 성공: {len(quiz_stats)}개 기록")
-        else:
-            logger.info("통계 파일이 없습니다. 새로 생성합니다.")
-    except json.JSONDecodeError as e:
-        logger.error(f"통계 JSON 파싱 오류: {e}")
-        quiz_stats = {}
-    except Exception as e:
-        logger.error(f"통계 불러오기 실패: {e}")
-        quiz_stats = {}
+    global data_ready, data_load_seconds
+    started = time.perf_counter()
+    store.load()
+    data_load_seconds = time.perf_counter() - started
+    data_ready = True
 
 def save_data() -> bool:
     """
@@ -96,50 +200,285 @@ def save_data() -> bool:
     Returns:
         bool: 저장 성공 여부
     """
+    return store.save()
+
+def create_app() -> Flask:
+    """
+    애플리케이션 팩토리 (gunicorn: web_vocab_app:create_app())
+    
+    gunicorn.conf.py의 preload_app 설정과 함께 쓰면 마스터 프로세스에서 데이터를
+    한 번만 불러오고, fork된 워커들은 그 메모리를 copy-on-write로 공유함
+    
+    Returns:
+        Flask: 데이터가 준비된 앱
+    """
+    if not data_ready:
+        load_data()
+        # 불러온 객체들을 GC 추적 대상에서 빼서, 워커에서 GC가 페이지를 건드려
+        # 복사되는 일(copy-on-write 깨짐)을 줄임
+        gc.collect()
+        gc.freeze()
+        logger.info(f"데이터 준비 완료 ({data_load_seconds:.2f}초, pid {os.getpid()})")
+    return app
+
+def requested_deck() -> Optional[str]:
+    """요청이 고른 덱 ID (?deck=, X-Deck 헤더, deck 쿠키 순, 없으면 None)"""
+    return (request.args.get('deck') or request.headers.get('X-Deck')
+            or request.cookies.get('deck') or None)
+
+@app.before_request
+def select_deck():
+    """덱을 고른 요청이면 요청이 끝날 때까지 덱 저장소를 잡아 둠"""
+    deck_id = requested_deck()
+    if deck_id is None:
+        return None
+    if not is_valid_deck_id(deck_id):
+        return jsonify({"success": False, "message": "덱 ID는 영문, 숫자, _, - 로 64자 이하여야 합니다."}), 400
+    g.deck_store = decks.acquire(deck_id)
+    g.deck_id = deck_id
+    return None
+
+@app.teardown_request
+def release_deck(exc: Optional[BaseException] = None) -> None:
+    deck_id = g.pop('deck_id', None)
+    if deck_id is not None:
+        g.pop('deck_store', None)
+        decks.release(deck_id)
+
+def hold_deck_until_closed(response: Response) -> Response:
+    """
+    스트리밍 응답을 다 보낼 때까지 덱을 잡아 둠
+    
+    응답 본문 생성기는 요청이 끝난(teardown) 뒤에 돌기 때문에, 덱을 한 번 더 잡고
+    응답이 닫힐 때 놓아서 내보내는 도중에 덱 저장소가 닫히지 않게 함
+    """
+    deck_id = g.get('deck_id')
+    if deck_id is not None:
+        decks.acquire(deck_id)
+        response.call_on_close(lambda: decks.release(deck_id))
+    return response
+
+@app.before_request
+def sync_store() -> None:
+    """
+    요청 처리 전에 다른 워커가 저장한 변경 반영
+    
+    gunicorn 멀티 워커에서는 워커마다 데이터를 따로 들고 있으므로,
+    파일 상태(inode/크기/수정 시각)가 바뀐 경우에만 다시 읽음
+    """
     try:
-        # 단어장 저장
-        with open(VOCAB_FILE, 'w', encoding='utf-8') as f:
-            json.dump(vocabulary, f, ensure_ascii=False, indent=2)
-        
-        # 통계 저장
-        with open(STATS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(quiz_stats, f, ensure_ascii=False, indent=2)
+        get_store().refresh()
+    except Exception as e:
+        logger.error(f"저장소 동기화 실패: {e}")
+
+# 상태 확인 API
+@app.route('/healthz', methods=['GET'])
+def healthz():
+    """프로세스 생존 확인"""
+    return jsonify({"status": "ok"})
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """데이터 준비 여부 확인 (준비 전에는 503)"""
+    if not data_ready:
+        return jsonify({"ready": False}), 503
+    return jsonify({
+        "ready": True,
+        "pid": os.getpid(),
+        "word_count": len(get_store()),
+        "load_seconds": round(data_load_seconds, 3),
+        "decks": decks.info(),
+        "response_cache": response_cache.info()
+    })
+
+def wants_durable(data: Optional[Dict] = None) -> bool:
+    """
+    요청이 저장 완료까지 대기를 원하는지 확인 (?durable=1 또는 {"durable": true})
+    
+    Args:
+        data: 요청 JSON 본문
         
-        logger.debug("데이터 저장 성공")
+    Returns:
+        bool: 대기 여부
+    """
+    if request.args.get('durable', '').lower() in ('1', 'true', 'yes'):
         return True
-    except IOError as e:
-        logger.error(f"파일 저장 IO 오류: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"파일 저장 실패: {e}")
-        return False
+    return bool(data and data.get('durable'))
+
+def data_etag(include_stats: bool = False) -> str:
+    """
+    현재 데이터 버전으로 만든 ETag
+    
+    응답을 만들기 전에 구해야 함 (그 사이 변경이 있어도 새 응답에 이전 ETag가 붙을 뿐이라 안전함)
+    
+    Args:
+        include_stats: 퀴즈 통계 버전도 포함할지 여부 (통계 응답)
+        
+    Returns:
+        str: ETag 값 (따옴표 제외)
+    """
+    epoch, vocab_version, stats_version = get_store().data_version()
+    if include_stats:
+        return f"s{epoch}-{vocab_version}-{stats_version}"
+    return f"v{epoch}-{vocab_version}"
+
+def not_modified(etag: str):
+    """If-None-Match가 현재 ETag와 같으면 304 응답, 아니면 None"""
+    if request.if_none_match.contains(etag):
+        return with_etag(app.response_class(status=304), etag)
+    return None
+
+def with_etag(response, etag: str):
+    """응답에 ETag 붙이기 (브라우저가 매번 ETag로 재검증하도록 no-cache 지정)"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def cached_json(etag: str, build: Callable[[], Any]):
+    """
+    직렬화된 응답 캐시를 거친 JSON 응답
+    
+    같은 덱, 엔드포인트, 쿼리의 응답이 같은 데이터 버전(etag)으로 캐시되어 있으면 그 바이트를
+    그대로 보내고, 없으면 build()로 만든 뒤 저장함
+    
+    Args:
+        etag: 응답이 기준으로 삼는 데이터 버전 (data_etag)
+        build: 응답 데이터를 만드는 함수
+        
+    Returns:
+        Response: ETag가 붙은 JSON 응답
+    """
+    if not response_cache.enabled:
+        return with_etag(jsonify(build()), etag)
+    
+    key = (g.get('deck_id'), request.endpoint, tuple(sorted(request.args.items(multi=True))))
+    body = response_cache.get(key, etag)
+    if body is not None:
+        return with_etag(app.response_class(body, mimetype=app.json.mimetype), etag)
+    
+    response = jsonify(build())
+    response_cache.put(key, etag, response.get_data())
+    return with_etag(response, etag)
 
 # 메인 페이지
 @app.route('/')
 def index():
-    """메인 페이지"""
-    return render_template('index.html', 
-                         word_count=len(vocabulary),
-                         stats_count=len(quiz_stats))
+    """메인 페이지 (?deck=ID로 열면 이후 요청도 그 덱을 쓰도록 쿠키에 기억)"""
+    store = get_store()
+    response = app.make_response(render_template('index.html', 
+                         word_count=len(store),
+                         stats_count=store.stats_count()))
+    deck_id = request.args.get('deck')
+    if deck_id is not None:
+        response.set_cookie('deck', deck_id, samesite='Lax')
+    return response
+
+def encode_cursor(word: str) -> str:
+    """단어 목록 페이지 커서 만들기 (마지막으로 보낸 단어를 감춘 문자열)"""
+    return base64.urlsafe_b64encode(word.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str) -> str:
+    """
+    페이지 커서에서 마지막으로 보낸 단어 꺼내기
+    
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """
+    fields 쿼리 파라미터 해석 (예: "english,korean")
+    
+    Raises:
+        ValueError: 알 수 없는 필드
+    """
+    if not fields:
+        return WORD_FIELDS
+    selected = tuple(field.strip() for field in fields.split(',') if field.strip())
+    unknown = [field for field in selected if field not in WORD_FIELDS]
+    if unknown or not selected:
+        raise ValueError(f"알 수 없는 필드: {', '.join(unknown)}")
+    return selected
+
+def project_word(eng: str, data: WordRecord, fields: Tuple[str, ...] = WORD_FIELDS) -> Dict[str, str]:
+    """단어 데이터를 응답용 dict로 변환 (fields에 있는 항목만)"""
+    word = {
+        "english": eng,
+        "korean": data.korean,
+        "category": data.category
+    }
+    if fields is WORD_FIELDS:
+        return word
+    return {field: word[field] for field in fields}
 
 # 단어 목록 API
 @app.route('/api/words', methods=['GET'])
 def get_words():
-    """모든 단어 가져오기"""
+    """
+    단어 목록 가져오기
+    
+    Query:
+        category: 카테고리 (선택)
+        fields: 응답에 포함할 항목 (예: "english,korean", 기본은 전체)
+        limit: 페이지 크기 (최대 1000). limit이나 cursor가 있으면 영어 단어 순으로 나눠서 반환
+        cursor: 이전 페이지 응답의 next_cursor
+        
+    Returns:
+        JSON: 단어 목록, 또는 {"words": 단어 목록, "next_cursor": 다음 페이지 커서, "total": 전체 단어 수}
+    """
     category = request.args.get('category', None)
-    words_list = []
+    try:
+        fields = parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return jsonify({"success": False, "message": str(e)}), 400
     
-    for eng, data in vocabulary.items():
-        word_data = {
-            "english": eng,
-            "korean": data.get("korean", ""),
-            "category": data.get("category", "")
-        }
-        # 카테고리 필터링
-        if category is None or category == "" or word_data["category"] == category:
-            words_list.append(word_data)
+    paged = 'limit' in request.args or 'cursor' in request.args
+    if paged:
+        try:
+            limit = int(request.args.get('limit', WORDS_DEFAULT_LIMIT))
+            cursor = request.args.get('cursor')
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            return jsonify({"success": False, "message": "limit 또는 cursor 값이 잘못되었습니다."}), 400
+        limit = max(1, min(limit, WORDS_MAX_LIMIT))
     
-    return jsonify(words_list)
+    # 단어장이 바뀌지 않았으면 목록을 다시 만들지 않음
+    etag = data_etag()
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+    
+    store = get_store()
+    if not paged:
+        # 페이지 없이 전체 목록 (카테고리 필터링은 저장소에서 처리)
+        return cached_json(etag, lambda: [project_word(eng, data, fields)
+                                          for eng, data in store.iter_words(category)])
+    
+    def build_page() -> Dict:
+        words_list = []
+        next_cursor = None
+        with store.lock:
+            # 정렬된 영어 단어 인덱스에서 커서 다음 위치부터 읽으므로 페이지마다 비용이 일정함
+            if category:
+                keys = store.get_index("category").iter_from(category, after)
+            else:
+                keys = store.get_index("prefix").iter_from(after)
+            last = None
+            for eng in keys:
+                data = store.get_word(eng)
+                if len(words_list) == limit:
+                    next_cursor = encode_cursor(last)
+                    break
+                words_list.append(project_word(eng, data, fields))
+                last = eng
+            total = store.count_words(category)
+        return {"words": words_list, "next_cursor": next_cursor, "total": total}
+    
+    return cached_json(etag, build_page)
 
 def validate_word_input(english: str, korean: str) -> Tuple[bool, Optional[str]]:
     """
@@ -190,16 +529,15 @@ def add_word():
         if not is_valid:
             return jsonify({"success": False, "message": error_message}), 400
         
-        # 중복 확인
-        if english in vocabulary:
-            return jsonify({"success": False, "message": f"'{english}' 단어가 이미 존재합니다."}), 409
-        
-        # 단어 추가
-        vocabulary[english] = {
-            "korean": korean,
-            "category": category
-        }
-        if save_data():
+        store = get_store()
+        with store.transaction(durable=wants_durable(data)) as txn:
+            # 중복 확인
+            if english in store:
+                return jsonify({"success": False, "message": f"'{english}' 단어가 이미 존재합니다."}), 409
+            
+            # 단어 추가
+            store.add_word(english, korean, category)
+        if txn.ok:
             logger.info(f"단어 추가 성공: {english}")
             return jsonify({"success": True, "message": f"'{english}' 단어가 추가되었습니다!"})
         else:
@@ -209,6 +547,75 @@ def add_word():
         logger.error(f"단어 추가 오류: {e}")
         return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
 
+class RequestBodyReader(io.RawIOBase):
+    """read()만 있는 WSGI 요청 본문을 io.BufferedReader로 감쌀 수 있게 하는 어댑터"""
+    
+    def __init__(self, body):
+        self.body = body
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        data = self.body.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+# 단어 일괄 가져오기 API
+@app.route('/api/import', methods=['POST'])
+def import_words_file():
+    """
+    CSV/JSONL 파일로 단어 일괄 가져오기
+    
+    파일은 multipart의 'file' 필드 또는 요청 본문 그대로 보냄.
+    한 줄씩 읽으며 chunk_size개마다 한 번 저장하므로 파일 전체를 메모리에 올리지 않음
+    
+    Query:
+        format: 'csv' or 'jsonl' (기본: 파일 확장자로 추정)
+        on_conflict: 'skip' (기본), 'overwrite', 'fail'
+        chunk_size: 한 번에 저장하는 행 수 (기본 500, 최대 5000)
+        
+    Returns:
+        JSON: {"success", "rows", "added", "updated", "skipped", "failed", "chunks",
+               "errors": [{"line", "word", "message"}, ...] (최대 100개), "errors_truncated"}
+        ('fail' 정책으로 중단되면 success: false와 stopped_at, message 포함, 이미 저장된 청크는 유지)
+    """
+    try:
+        # multipart가 아니면 폼으로 해석하지 않고 본문을 그대로 읽음 (폼 해석이 본문을 소비하므로)
+        upload = request.files.get('file') if request.mimetype == 'multipart/form-data' else None
+        fmt = request.args.get('format') or detect_format(upload.filename if upload else None)
+        if fmt not in IMPORT_FORMATS:
+            return jsonify({"success": False, "message": "format은 csv 또는 jsonl이어야 합니다."}), 400
+        on_conflict = request.args.get('on_conflict', 'skip')
+        if on_conflict not in CONFLICT_POLICIES:
+            return jsonify({"success": False, "message": "on_conflict는 skip, overwrite, fail 중 하나여야 합니다."}), 400
+        try:
+            chunk_size = int(request.args.get('chunk_size', DEFAULT_CHUNK_SIZE))
+        except ValueError:
+            return jsonify({"success": False, "message": "chunk_size는 숫자여야 합니다."}), 400
+        chunk_size = max(1, min(chunk_size, MAX_CHUNK_SIZE))
+        
+        # gunicorn의 요청 본문처럼 read()만 있는 객체도 TextIOWrapper로 감쌀 수 있게 함
+        raw = io.BufferedReader(RequestBodyReader(upload.stream if upload else request.stream))
+        if not raw.peek(1):
+            return jsonify({"success": False, "message": "가져올 파일이 없습니다."}), 400
+        stream = io.TextIOWrapper(raw, encoding='utf-8-sig', errors='replace', newline='')
+        
+        def report(result) -> None:
+            logger.info(f"단어 가져오기 진행: {result.rows}행 (추가 {result.added}, 수정 {result.updated}, "
+                        f"건너뜀 {result.skipped}, 오류 {result.failed})")
+        
+        result = import_words(get_store(), stream, fmt, validate_word_input, on_conflict,
+                              chunk_size, durable=wants_durable(), progress=report)
+        if result.ok:
+            logger.info(f"단어 가져오기 완료: 추가 {result.added}개, 수정 {result.updated}개")
+            return jsonify(result.to_dict())
+        return jsonify(result.to_dict()), 500 if result.save_failed else 409
+        
+    except Exception as e:
+        logger.error(f"단어 가져오기 오류: {e}")
+        return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
+
 @app.route('/api/words/<word>', methods=['DELETE'])
 def delete_word(word: str):
     """
@@ -226,17 +633,15 @@ def delete_word(word: str):
         if not word:
             return jsonify({"success": False, "message": "단어를 입력해주세요."}), 400
         
-        if word not in vocabulary:
-            return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
-        
-        # 단어 삭제
-        del vocabulary[word]
-        
-        # 통계도 함께 삭제
-        if word in quiz_stats:
-            del quiz_stats[word]
+        store = get_store()
+        with store.transaction(durable=wants_durable()) as txn:
+            if word not in store:
+                return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
+            
+            # 단어 삭제 (통계도 함께 삭제)
+            store.delete_word(word)
         
-        if save_data():
+        if txn.ok:
             logger.info(f"단어 삭제 성공: {word}")
             return jsonify({"success": True, "message": f"'{word}' 단어가 삭제되었습니다!"})
         else:
@@ -279,39 +684,24 @@ def update_word(word: str):
         if not is_valid:
             return jsonify({"success": False, "message": error_message}), 400
         
-        if word not in vocabulary:
-            return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
-        
-        # 기존 카테고리 유지 (카테고리가 제공되지 않은 경우)
-        if not new_category:
-            new_category = vocabulary[word].get("category", "")
-        
-        # 단어가 변경된 경우
-        if new_english != word:
-            # 새 단어가 이미 존재하는지 확인
-            if new_english in vocabulary and new_english != word:
-                return jsonify({"success": False, "message": f"'{new_english}' 단어가 이미 존재합니다."}), 409
+        store = get_store()
+        with store.transaction(durable=wants_durable(data)) as txn:
+            old_data = store.get_word(word)
+            if old_data is None:
+                return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
             
-            # 기존 단어 삭제
-            del vocabulary[word]
+            # 기존 카테고리 유지 (카테고리가 제공되지 않은 경우)
+            if not new_category:
+                new_category = old_data.get("category", "")
             
-            # 통계 이전
-            if word in quiz_stats:
-                quiz_stats[new_english] = quiz_stats.pop(word)
+            # 단어가 변경된 경우 새 단어가 이미 존재하는지 확인
+            if new_english != word and new_english in store:
+                return jsonify({"success": False, "message": f"'{new_english}' 단어가 이미 존재합니다."}), 409
             
-            # 새 단어 추가
-            vocabulary[new_english] = {
-                "korean": new_korean,
-                "category": new_category
-            }
-        else:
-            # 단어는 같고 뜻/카테고리만 변경
-            vocabulary[word] = {
-                "korean": new_korean,
-                "category": new_category
-            }
+            # 단어/뜻/카테고리 변경 (단어가 바뀌면 통계도 이전)
+            store.update_word(word, new_english, new_korean, new_category)
         
-        if save_data():
+        if txn.ok:
             logger.info(f"단어 수정 성공: {word} -> {new_english}")
             return jsonify({"success": True, "message": f"단어가 수정되었습니다!"})
         else:
@@ -321,13 +711,102 @@ def update_word(word: str):
         logger.error(f"단어 수정 오류: {e}")
         return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
 
+# 단어 자동 완성 API
+@app.route('/api/words/suggest', methods=['GET'])
+def suggest_words():
+    """
+    영어 단어 자동 완성 API
+    
+    Query:
+        prefix: 입력 중인 영어 단어 앞부분
+        limit: 최대 결과 수 (기본 10, 최대 50)
+        
+    Returns:
+        JSON: 접두사로 시작하는 단어 목록 (사전 순)
+    """
+    prefix = request.args.get('prefix', '').strip().lower()
+    try:
+        limit = int(request.args.get('limit', SUGGEST_DEFAULT_LIMIT))
+    except ValueError:
+        return jsonify({"success": False, "message": "limit은 숫자여야 합니다."}), 400
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+    
+    if not prefix:
+        return jsonify([])
+    
+    store = get_store()
+    words_list = []
+    with store.lock:
+        for eng in store.get_index("prefix").complete(prefix, limit):
+            data = store.get_word(eng)
+            words_list.append({
+                "english": eng,
+                "korean": data.get("korean", ""),
+                "category": data.get("category", "")
+            })
+    
+    return jsonify(words_list)
+
+def find_similar_words(word: str, max_distance: int = FUZZY_MAX_DISTANCE,
+                       limit: int = FUZZY_DEFAULT_LIMIT) -> List[Dict]:
+    """
+    철자가 비슷한 단어 찾기 (편집 거리 색인 사용)
+    
+    Args:
+        word: 찾을 단어
+        max_distance: 최대 편집 거리
+        limit: 최대 결과 수
+        
+    Returns:
+        List[Dict]: 가까운 순서의 단어 목록 (distance 포함)
+    """
+    store = get_store()
+    words_list = []
+    with store.lock:
+        for eng, distance in store.get_index("fuzzy").lookup(word, max_distance, limit):
+            data = store.get_word(eng)
+            words_list.append({
+                "english": eng,
+                "korean": data.get("korean", ""),
+                "category": data.get("category", ""),
+                "distance": distance
+            })
+    return words_list
+
+# 비슷한 단어 추천 API
+@app.route('/api/words/similar', methods=['GET'])
+def similar_words():
+    """
+    철자가 비슷한 단어 추천 API ("혹시 이 단어를 찾으셨나요?")
+    
+    Query:
+        word: 찾을 단어
+        distance: 최대 편집 거리 (기본 2, 최대 2)
+        limit: 최대 결과 수 (기본 5, 최대 50)
+        
+    Returns:
+        JSON: 편집 거리가 가까운 순서의 단어 목록
+    """
+    word = request.args.get('word', '').strip().lower()
+    try:
+        max_distance = int(request.args.get('distance', FUZZY_MAX_DISTANCE))
+        limit = int(request.args.get('limit', FUZZY_DEFAULT_LIMIT))
+    except ValueError:
+        return jsonify({"success": False, "message": "distance와 limit은 숫자여야 합니다."}), 400
+    max_distance = max(0, min(max_distance, FUZZY_MAX_DISTANCE))
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+    
+    if not word:
+        return jsonify([])
+    return jsonify(find_similar_words(word, max_distance, limit))
+
 # 단어 검색 API
 @app.route('/api/words/<word>', methods=['GET'])
 def search_word(word):
-    """단어 검색"""
+    """단어 검색 (없으면 철자가 비슷한 단어 추천)"""
     word = word.lower()
-    if word in vocabulary:
-        data = vocabulary[word]
+    data = get_store().get_word(word)
+    if data is not None:
         return jsonify({
             "success": True, 
             "english": word, 
@@ -335,7 +814,55 @@ def search_word(word):
             "category": data.get("category", "")
         })
     else:
-        return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
+        return jsonify({
+            "success": False,
+            "message": "단어를 찾을 수 없습니다.",
+            "suggestions": find_similar_words(word)
+        }), 404
+
+@app.route('/api/search', methods=['GET'])
+def search_words():
+    """
+    단어 부분 검색 API (영어 단어 또는 한국어 뜻)
+    
+    초성으로만 이루어진 검색어(예: "ㅅㄱ")는 한국어 뜻의 초성으로 검색
+    
+    Query:
+        q: 검색어
+        category: 카테고리 (선택)
+        limit: 최대 결과 수 (기본 50, 최대 200)
+    
+    Returns:
+        JSON: 일치 정도가 높은 순서의 단어 목록
+    """
+    query = request.args.get('q', '').strip()
+    category = request.args.get('category', None)
+    try:
+        limit = int(request.args.get('limit', SEARCH_DEFAULT_LIMIT))
+    except ValueError:
+        return jsonify({"success": False, "message": "limit은 숫자여야 합니다."}), 400
+    limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+    
+    if not query:
+        return jsonify([])
+    
+    store = get_store()
+    
+    def in_category(eng: str) -> bool:
+        return store.get_word(eng).category == category
+    
+    index_name = "choseong" if is_choseong_query(query) else "search"
+    words_list = []
+    with store.lock:
+        for eng in store.get_index(index_name).search(query, limit, in_category if category else None):
+            data = store.get_word(eng)
+            words_list.append({
+                "english": eng,
+                "korean": data.get("korean", ""),
+                "category": data.get("category", "")
+            })
+    
+    return jsonify(words_list)
 
 # 퀴즈 문제 가져오기 API
 @app.route('/api/quiz', methods=['POST'])
@@ -345,72 +872,133 @@ def get_quiz():
     quiz_type = data.get('type', 'english_to_korean')  # 'english_to_korean' or 'korean_to_english'
     quiz_mode = data.get('mode', 'text')  # 'text' (주관식) or 'multiple' (객관식)
     focus_mode = data.get('focus_mode', False)  # True면 틀린 단어만 선택
+    review_mode = data.get('review_mode', False)  # True면 복습할 때가 된 단어부터 선택 (간격 반복)
     
-    if not vocabulary:
+    store = get_store()
+    if len(store) == 0:
         return jsonify({"success": False, "message": "퀴즈를 하려면 먼저 단어를 추가해주세요."}), 400
     
-    # 단어 선택
-    words = list(vocabulary.keys())
-    
-    # 카테고리 필터링
+    # 단어 선택 (카테고리 필터링 포함, 단어 목록을 만들지 않고 추출용 배열에서 바로 뽑음)
     quiz_category = data.get('category', None)
-    if quiz_category and quiz_category != "":
-        words = [w for w in words if vocabulary[w].get("category", "") == quiz_category]
-        if not words:
-            return jsonify({"success": False, "message": f"'{quiz_category}' 카테고리에 단어가 없습니다."}), 400
-    
-    # 틀린 단어 집중 학습 모드
-    if focus_mode:
-        # 정답률이 낮은 단어 우선 선택 (틀린 횟수가 많은 단어)
-        words_with_stats = []
-        for word in words:
-            if word in quiz_stats:
-                correct, wrong = quiz_stats[word]
-                total = correct + wrong
-                if total > 0:
-                    accuracy = (correct / total) * 100
-                    # 정답률이 낮거나 틀린 횟수가 많은 단어 우선
-                    words_with_stats.append((word, accuracy, wrong))
-        
-        if words_with_stats:
-            # 정답률 낮은 순으로 정렬 (같으면 틀린 횟수 많은 순)
-            words_with_stats.sort(key=lambda x: (x[1], -x[2]))
-            # 하위 50% 중에서 랜덤 선택 (너무 제한적이지 않게)
-            bottom_half = words_with_stats[:max(1, len(words_with_stats) // 2)]
-            word = random.choice(bottom_half)[0]
-        else:
-            # 통계가 없는 단어 중에서 선택
-            word = random.choice(words)
-    else:
-        # 일반 모드: 랜덤 선택
-        word = random.choice(words)
+    with store.lock:
+        pool = store.get_index("pool")
+        if quiz_category and quiz_category != "":
+            if pool.count(quiz_category) == 0:
+                return jsonify({"success": False, "message": f"'{quiz_category}' 카테고리에 단어가 없습니다."}), 400
+        
+        # 틀린 단어 집중 학습 모드
+        word = None
+        if review_mode:
+            # 간격 반복: 복습 시각이 가장 많이 지난 단어, 없으면 처음 보는 단어
+            words = store.get_index("due").draw(1, time.time(), quiz_category)
+            word = words[0] if words else None
+        elif focus_mode:
+            # 정답률이 낮은 단어 우선 선택 (정답률 낮은 순, 같으면 틀린 횟수 많은 순)
+            # 약점 순위 인덱스의 하위 50% 중에서 랜덤 선택 (너무 제한적이지 않게)
+            word = store.get_index("weakness").draw(quiz_category)
+        if word is None:
+            # 일반 모드 또는 통계가 없는 경우: 랜덤 선택
+            word = pool.choice(quiz_category)
+        if word is None:
+            # 확인한 뒤 다른 요청이 마지막 단어를 지운 경우
+            return jsonify({"success": False, "message": "퀴즈를 하려면 먼저 단어를 추가해주세요."}), 400
     
     # 객관식 문제 생성
     if quiz_mode == 'multiple':
-        return get_multiple_choice_quiz(word, quiz_type)
+        return jsonify(get_multiple_choice_quiz(word, quiz_type))
     
     # 주관식 문제 생성
-    word_data = vocabulary[word]
+    return jsonify(get_text_quiz(word, quiz_type))
+
+# 여러 문제 한 번에 가져오기 API
+@app.route('/api/quiz/batch', methods=['POST'])
+def get_quiz_batch():
+    """
+    퀴즈 문제 여러 개 생성 (같은 단어는 한 번만 출제)
+    
+    Request Body:
+        {
+            "count": 문제 수 (기본 10, 최대 50),
+            "type", "mode", "category", "focus_mode", "review_mode": /api/quiz와 같음
+        }
+        
+    Returns:
+        JSON: {"success": true, "questions": [/api/quiz 응답과 같은 형식의 문제, ...]}
+        (단어가 모자라면 있는 만큼만 반환)
+    """
+    data = request.get_json()
+    if not data:
+        data = {}
+    quiz_type = data.get('type', 'english_to_korean')
+    quiz_mode = data.get('mode', 'text')
+    focus_mode = data.get('focus_mode', False)
+    review_mode = data.get('review_mode', False)
+    quiz_category = data.get('category', None)
+    try:
+        count = int(data.get('count', QUIZ_BATCH_DEFAULT_COUNT))
+    except (ValueError, TypeError):
+        return jsonify({"success": False, "message": "count는 숫자여야 합니다."}), 400
+    count = max(1, min(count, QUIZ_BATCH_MAX_COUNT))
+    
+    store = get_store()
+    with store.lock:
+        pool = store.get_index("pool")
+        if pool.count() == 0:
+            return jsonify({"success": False, "message": "퀴즈를 하려면 먼저 단어를 추가해주세요."}), 400
+        if quiz_category and pool.count(quiz_category) == 0:
+            return jsonify({"success": False, "message": f"'{quiz_category}' 카테고리에 단어가 없습니다."}), 400
+        
+        words = []
+        if review_mode:
+            # 복습 대기열 순서 그대로 출제 (복습 시각이 지난 단어 -> 처음 보는 단어 -> 곧 복습할 단어)
+            words = store.get_index("due").draw(count, time.time(), quiz_category)
+        else:
+            if focus_mode:
+                # 약점 순위 하위 50%에서 먼저 뽑고, 모자라면 나머지 단어로 채움
+                words = store.get_index("weakness").sample(count, quiz_category)
+            if len(words) < count:
+                words += pool.sample(count - len(words), exclude=set(words), category=quiz_category)
+            random.shuffle(words)
+        
+        if quiz_mode == 'multiple':
+            questions = [get_multiple_choice_quiz(word, quiz_type) for word in words]
+        else:
+            questions = [get_text_quiz(word, quiz_type) for word in words]
+    
+    return jsonify({"success": True, "questions": questions})
+
+def get_text_quiz(word: str, quiz_type: str) -> Dict:
+    """
+    주관식 문제 생성
+    
+    Args:
+        word: 정답 단어
+        quiz_type: 'english_to_korean' or 'korean_to_english'
+        
+    Returns:
+        JSON 응답 데이터
+    """
+    word_data = get_store().get_word(word)
     korean = word_data.get("korean", "")
     
     if quiz_type == 'english_to_korean':
-        return jsonify({
+        return {
             "success": True,
             "type": "english_to_korean",
             "mode": "text",
             "word": word,
             "question": f"'{word}'의 한국어 뜻은?",
             "correct_answer": korean
-        })
+        }
     else:  # korean_to_english
-        return jsonify({
+        return {
             "success": True,
             "type": "korean_to_english",
             "mode": "text",
             "word": word,
             "question": f"'{korean}'의 영어 단어는?",
             "correct_answer": word
-        })
+        }
 
 def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
     """
@@ -423,29 +1011,28 @@ def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
     Returns:
         JSON 응답 데이터
     """
-    words = list(vocabulary.keys())
-    
-    # 정답 1개 + 오답 3개 선택
-    wrong_words = [w for w in words if w != correct_word]
-    if len(wrong_words) < 3:
+    store = get_store()
+    with store.lock:
+        pool = store.get_index("pool")
+        # 정답 1개 + 오답 3개 선택 (정답을 뺀 서로 다른 단어)
+        wrong_choices = pool.sample(3, exclude=(correct_word,))
         # 단어가 4개 미만이면 오답을 반복 사용
-        while len(wrong_words) < 3:
-            wrong_words.append(random.choice(words))
-    
-    wrong_choices = random.sample(wrong_words, min(3, len(wrong_words)))
-    
-    # 선택지 생성
-    correct_word_data = vocabulary[correct_word]
+        while len(wrong_choices) < 3:
+            wrong_choices.append(pool.choice())
+        
+        # 선택지 생성
+        correct_word_data = store.get_word(correct_word)
+        wrong_koreans = [store.get_word(w).get("korean", "") for w in wrong_choices]
     correct_korean = correct_word_data.get("korean", "")
     
     if quiz_type == 'english_to_korean':
         # 영어 → 한글: 정답은 correct_word의 뜻, 오답은 다른 단어들의 뜻
         correct_answer = correct_korean
-        wrong_answers = [vocabulary[w].get("korean", "") for w in wrong_choices]
+        wrong_answers = wrong_koreans
         choices = [correct_answer] + wrong_answers
         random.shuffle(choices)  # 선택지 섞기
         
-        return jsonify({
+        return {
             "success": True,
             "type": "english_to_korean",
             "mode": "multiple",
@@ -454,7 +1041,7 @@ def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
             "correct_answer": correct_answer,
             "choices": choices,
             "correct_index": choices.index(correct_answer)
-        })
+        }
     else:  # korean_to_english
         # 한글 → 영어: 정답은 correct_word, 오답은 다른 단어들
         correct_answer = correct_word
@@ -462,7 +1049,7 @@ def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
         choices = [correct_answer] + wrong_answers
         random.shuffle(choices)  # 선택지 섞기
         
-        return jsonify({
+        return {
             "success": True,
             "type": "korean_to_english",
             "mode": "multiple",
@@ -471,7 +1058,7 @@ def get_multiple_choice_quiz(correct_word: str, quiz_type: str) -> Dict:
             "correct_answer": correct_answer,
             "choices": choices,
             "correct_index": choices.index(correct_answer)
-        })
+        }
 
 @app.route('/api/quiz/check', methods=['POST'])
 def check_quiz():
@@ -504,107 +1091,308 @@ def check_quiz():
         if not word:
             return jsonify({"success": False, "message": "단어를 입력해주세요."}), 400
         
-        if word not in vocabulary:
+        store = get_store()
+        word_data = store.get_word(word)
+        if word_data is None:
             return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
         
-        # 객관식 정답 확인
-        if quiz_mode == 'multiple':
-            if correct_index is None:
-                return jsonify({"success": False, "message": "정답 인덱스가 없습니다."}), 400
-            
-            try:
-                user_index = int(user_answer)
-                is_correct = user_index == correct_index
-            except (ValueError, TypeError):
-                return jsonify({"success": False, "message": "잘못된 답안입니다."}), 400
-        else:
-            # 주관식 정답 확인
-            if not user_answer:
-                return jsonify({"success": False, "message": "답을 입력해주세요."}), 400
-            
-            word_data = vocabulary[word]
-            if quiz_type == 'english_to_korean':
-                correct_answer = word_data.get("korean", "")
-                is_correct = user_answer.strip() == correct_answer
-            else:  # korean_to_english
-                correct_answer = word
-                is_correct = user_answer.lower().strip() == correct_answer.lower()
-        
-        # 통계 초기화 (없는 경우)
-        if word not in quiz_stats:
-            quiz_stats[word] = [0, 0]
+        # 정답 확인
+        is_correct, error_message = grade_answer(word, word_data, user_answer, quiz_type, quiz_mode, correct_index)
+        if error_message:
+            return jsonify({"success": False, "message": error_message}), 400
         
         # 통계 업데이트
-        if is_correct:
-            quiz_stats[word][0] += 1  # 맞춘 횟수
-            logger.debug(f"퀴즈 정답: {word}")
-        else:
-            quiz_stats[word][1] += 1  # 틀린 횟수
-            logger.debug(f"퀴즈 오답: {word}")
-        
-        save_data()
+        with store.transaction(durable=wants_durable(data)):
+            if word not in store:
+                return jsonify({"success": False, "message": "단어를 찾을 수 없습니다."}), 404
+            stats = store.record_result(word, is_correct)
+            schedule = store.get_schedule(word)
+        logger.debug(f"퀴즈 {'정답' if is_correct else '오답'}: {word}")
         
         # 정답 정보 반환
-        word_data = vocabulary[word]
-        if quiz_type == 'english_to_korean':
-            correct_answer = word_data.get("korean", "")
-        else:
-            correct_answer = word
-        
-        return jsonify({
-            "success": True,
-            "is_correct": is_correct,
-            "correct_answer": correct_answer,
-            "stats": quiz_stats[word]
-        })
+        return jsonify(quiz_result(word, word_data, user_answer, quiz_type, quiz_mode, is_correct,
+                                   stats, schedule))
         
     except Exception as e:
         logger.error(f"퀴즈 정답 확인 오류: {e}")
         return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
 
+# 여러 답안 한 번에 확인 API
+@app.route('/api/quiz/check/batch', methods=['POST'])
+def check_quiz_batch():
+    """
+    퀴즈 답안 여러 개를 한 번에 확인
+    
+    모든 답안을 채점한 뒤 통계 변경을 하나의 트랜잭션으로 반영함 (저장도 한 번)
+    
+    Request Body:
+        {
+            "answers": [/api/quiz/check 요청과 같은 형식의 답안, ...] (최대 100개)
+        }
+        
+    Returns:
+        JSON: {"success": true, "results": [/api/quiz/check 응답과 같은 형식의 결과, ...],
+               "correct": 맞춘 수, "total": 채점된 답안 수}
+        (잘못된 답안은 해당 결과에만 success: false와 message를 담고 통계에 반영하지 않음)
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"success": False, "message": "요청 데이터가 없습니다."}), 400
+        
+        answers = data.get('answers')
+        if not isinstance(answers, list) or not answers:
+            return jsonify({"success": False, "message": "답안 목록이 없습니다."}), 400
+        if len(answers) > QUIZ_CHECK_BATCH_MAX_ANSWERS:
+            return jsonify({"success": False, "message": f"답안은 한 번에 {QUIZ_CHECK_BATCH_MAX_ANSWERS}개까지 확인할 수 있습니다."}), 400
+        
+        store = get_store()
+        results: List[Optional[Dict]] = [None] * len(answers)
+        graded = []  # (결과 위치, 단어, 단어 데이터, 답안, 정답 여부)
+        for i, item in enumerate(answers):
+            if not isinstance(item, dict):
+                results[i] = {"success": False, "message": "잘못된 답안입니다."}
+                continue
+            word = str(item.get('word', '')).lower().strip()
+            if not word:
+                results[i] = {"success": False, "message": "단어를 입력해주세요."}
+                continue
+            word_data = store.get_word(word)
+            if word_data is None:
+                results[i] = {"success": False, "word": word, "message": "단어를 찾을 수 없습니다."}
+                continue
+            is_correct, error_message = grade_answer(
+                word, word_data, item.get('answer', ''), item.get('type', 'english_to_korean'),
+                item.get('mode', 'text'), item.get('correct_index', None))
+            if error_message:
+                results[i] = {"success": False, "word": word, "message": error_message}
+                continue
+            graded.append((i, word, word_data, item, is_correct))
+        
+        # 통계 업데이트 (한 번의 트랜잭션)
+        with store.transaction(durable=wants_durable(data)) as txn:
+            for i, word, word_data, item, is_correct in graded:
+                if word not in store:
+                    results[i] = {"success": False, "word": word, "message": "단어를 찾을 수 없습니다."}
+                    continue
+                stats = store.record_result(word, is_correct)
+                results[i] = quiz_result(
+                    word, word_data, item.get('answer', ''), item.get('type', 'english_to_korean'),
+                    item.get('mode', 'text'), is_correct, stats, store.get_schedule(word))
+        if not txn.ok:
+            return jsonify({"success": False, "message": "파일 저장에 실패했습니다."}), 500
+        
+        checked = [r for r in results if r["success"]]
+        correct = sum(1 for r in checked if r["is_correct"])
+        logger.debug(f"퀴즈 답안 {len(checked)}개 확인 (정답 {correct}개)")
+        return jsonify({"success": True, "results": results, "correct": correct, "total": len(checked)})
+        
+    except Exception as e:
+        logger.error(f"퀴즈 답안 일괄 확인 오류: {e}")
+        return jsonify({"success": False, "message": "서버 오류가 발생했습니다."}), 500
+
+def grade_answer(word: str, word_data: Dict[str, str], user_answer: Any, quiz_type: str,
+                 quiz_mode: str, correct_index: Optional[int]) -> Tuple[bool, Optional[str]]:
+    """
+    답안 채점
+    
+    Args:
+        word: 정답 단어
+        word_data: 단어 데이터
+        user_answer: 사용자 답 (주관식) or 선택한 인덱스 (객관식)
+        quiz_type: 'english_to_korean' or 'korean_to_english'
+        quiz_mode: 'text' or 'multiple'
+        correct_index: 정답 인덱스 (객관식인 경우)
+        
+    Returns:
+        Tuple[bool, Optional[str]]: (정답 여부, 에러 메시지)
+    """
+    # 객관식 정답 확인
+    if quiz_mode == 'multiple':
+        if correct_index is None:
+            return False, "정답 인덱스가 없습니다."
+        
+        try:
+            return int(user_answer) == correct_index, None
+        except (ValueError, TypeError):
+            return False, "잘못된 답안입니다."
+    
+    # 주관식 정답 확인
+    if not user_answer:
+        return False, "답을 입력해주세요."
+    if not isinstance(user_answer, str):
+        # 숫자, 목록 등은 문자열 답안으로 채점할 수 없음 (일괄 확인에서는 해당 답안만 실패)
+        return False, "잘못된 답안입니다."
+    
+    if quiz_type == 'english_to_korean':
+        return user_answer.strip() == word_data.get("korean", ""), None
+    # korean_to_english
+    return user_answer.lower().strip() == word.lower(), None
+
+def quiz_result(word: str, word_data: Dict[str, str], user_answer: Any, quiz_type: str,
+                quiz_mode: str, is_correct: bool, stats: List[int],
+                schedule: Optional[List] = None) -> Dict:
+    """
+    정답 확인 결과 생성
+    
+    Returns:
+        Dict: 정답 여부, 정답, 갱신된 통계, 다음 복습 시각 (주관식 영어 답안이면 편집 거리 포함)
+    """
+    if quiz_type == 'english_to_korean':
+        correct_answer = word_data.get("korean", "")
+    else:
+        correct_answer = word
+    
+    result = {
+        "success": True,
+        "is_correct": is_correct,
+        "correct_answer": correct_answer,
+        "stats": stats
+    }
+    if schedule is not None:
+        # 간격 반복 복습 모드에서 이 단어가 다시 나올 시각 (epoch 초)
+        result["next_review"] = schedule[3]
+    if quiz_mode != 'multiple' and quiz_type == 'korean_to_english':
+        # 철자를 얼마나 틀렸는지 (0이면 정답). 답안 길이에 제한이 없으므로 단어 길이 + 허용 거리까지만
+        # 계산하고, 그보다 멀면 그 값 + 1을 돌려줌 (너무 긴 답안은 길이만 보고 바로 끝남)
+        result["distance"] = edit_distance(user_answer.lower().strip(), word,
+                                           max_distance=len(word) + FUZZY_MAX_DISTANCE)
+    return result
+
 # 통계 API
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """퀴즈 통계 가져오기"""
-    stats_list = []
+    # 단어장과 통계가 모두 그대로면 다시 계산하지 않음
+    etag = data_etag(include_stats=True)
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+    
+    store = get_store()
     
-    for word, stats in quiz_stats.items():
-        if word not in vocabulary:
-            continue  # 단어가 삭제된 경우 스킵
+    def build_stats() -> List[Dict]:
+        stats_list = []
         
-        correct, wrong = stats
-        total = correct + wrong
-        accuracy = (correct / total * 100) if total > 0 else 0
+        # 열 단위로 한 번씩 계산 (맞춘 횟수 열 + 틀린 횟수 열 -> 총 횟수 열 -> 정답률 열)
+        words, correct, wrong = store.stats_columns()
+        totals = list(map(operator.add, correct, wrong))
+        accuracy = list(map(percentage, correct, totals))
         
-        word_data = vocabulary[word]
-        stats_list.append({
-            "word": word,
-            "korean": word_data.get("korean", "?"),
-            "category": word_data.get("category", ""),
-            "correct": correct,
-            "wrong": wrong,
-            "total": total,
-            "accuracy": round(accuracy, 1)
-        })
-    
-    # 정답률 순으로 정렬
-    stats_list.sort(key=lambda x: x['accuracy'], reverse=True)
+        # 정답률 순으로 정렬 (같으면 기록 순서 유지)
+        for i in sorted(range(len(words)), key=accuracy.__getitem__, reverse=True):
+            word_data = store.get_word(words[i])
+            if word_data is None:
+                continue  # 단어가 삭제된 경우 스킵
+            
+            stats_list.append({
+                "word": words[i],
+                "korean": word_data.korean,
+                "category": word_data.category,
+                "correct": correct[i],
+                "wrong": wrong[i],
+                "total": totals[i],
+                "accuracy": accuracy[i]
+            })
+        return stats_list
     
-    return jsonify(stats_list)
+    return cached_json(etag, build_stats)
+
+def percentage(correct: int, total: int) -> float:
+    """정답률 (%, 소수점 한 자리, 푼 적이 없으면 0)"""
+    return round(correct / total * 100, 1) if total > 0 else 0
 
 # 카테고리 목록 API
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
     """모든 카테고리 목록 가져오기"""
-    categories = set()
-    for word_data in vocabulary.values():
-        category = word_data.get("category", "").strip()
-        if category:
-            categories.add(category)
+    etag = data_etag()
+    cached = not_modified(etag)
+    if cached is not None:
+        return cached
+    
+    # 빈 카테고리는 제외하고 정렬된 목록 반환
+    return cached_json(etag, get_store().categories)
+
+# 내보내기 API
+@app.route('/api/export', methods=['GET'])
+def export_words():
+    """
+    단어와 통계를 스트리밍으로 내보내기
+    
+    응답 전체를 만들지 않고 EXPORT_PAGE_SIZE개씩 읽어 바로 보내므로 (chunked 전송)
+    단어장 크기와 상관없이 메모리 사용량과 첫 바이트까지의 시간이 일정함
     
-    # 빈 카테고리도 포함 (카테고리 없음)
-    categories_list = sorted(list(categories))
-    return jsonify(categories_list)
+    Query:
+        format: 'ndjson' (기본) or 'csv'
+        category: 카테고리 (선택)
+        
+    Returns:
+        한 줄에 {"english", "korean", "category", "correct", "wrong"} 하나 (ndjson),
+        또는 같은 열의 CSV (헤더 포함, /api/import로 다시 가져올 수 있음)
+    """
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in ('ndjson', 'csv'):
+        return jsonify({"success": False, "message": "format은 ndjson 또는 csv여야 합니다."}), 400
+    category = request.args.get('category', None)
+    
+    rows = iter_export_rows(get_store(), category)
+    if fmt == 'csv':
+        body = iter_export_csv(rows)
+        mimetype = 'text/csv'
+    else:
+        body = (json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n" for row in rows)
+        mimetype = 'application/x-ndjson'
+    
+    response = Response(body, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="vocabulary.{fmt}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return hold_deck_until_closed(response)
+
+def iter_export_rows(store: VocabStore, category: Optional[str] = None) -> Iterator[Tuple]:
+    """
+    (영어 단어, 뜻, 카테고리, 맞춘 횟수, 틀린 횟수)를 영어 단어 순으로 순회
+    
+    EXPORT_PAGE_SIZE개마다 잠금을 잡고 마지막 단어 다음부터 읽으므로
+    내보내는 동안에도 다른 요청의 변경이 오래 막히지 않음
+    """
+    after = None
+    while True:
+        page = []
+        with store.lock:
+            if category:
+                keys = store.get_index("category").iter_from(category, after)
+            else:
+                keys = store.get_index("prefix").iter_from(after)
+            for eng in keys:
+                data = store.get_word(eng)
+                if data is None:
+                    continue
+                correct, wrong = store.get_stats(eng) or (0, 0)
+                page.append((eng, data.korean, data.category, correct, wrong))
+                if len(page) == EXPORT_PAGE_SIZE:
+                    break
+        if not page:
+            return
+        yield from page
+        if len(page) < EXPORT_PAGE_SIZE:
+            return
+        after = page[-1][0]
+
+def iter_export_csv(rows: Iterator[Tuple]) -> Iterator[str]:
+    """내보낼 행을 CSV 텍스트 조각으로 변환 (EXPORT_PAGE_SIZE행씩)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_FIELDS)
+    for i, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if i % EXPORT_PAGE_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
 
 def start_server(port: int = None) -> None:
     """
@@ -628,8 +1416,8 @@ def start_server(port: int = None) -> None:
     logger.info("="*60)
     logger.info("영어 단어장 웹 애플리케이션 시작!")
     logger.info("="*60)
-    logger.info(f"단어 개수: {len(vocabulary)}개")
-    logger.info(f"통계 기록: {len(quiz_stats)}개")
+    logger.info(f"단어 개수: {len(store)}개")
+    logger.info(f"통계 기록: {store.stats_count()}개")
     logger.info(f"모드: {'프로덕션' if is_production else '개발'}")
     logger.info(f"접속 주소: http://{host}:{port}")
     logger.info("="*60)